@@ -0,0 +1,57 @@
+"""Camera bake: per-frame evaluation + reduction vs adaptive sampling.
+
+Run from deforum_core/:  python benchmarks/bench_adaptive_bake.py [max_error]
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from deforum_core.camera.bake import bake_camera_tracks
+from deforum_core.schema.models import Channel, Meta, Project, Timeline, Track
+
+SIZES = (2_000, 20_000, 100_000)
+
+
+def _project(frames: int, rng: np.random.Generator) -> Project:
+    def channel(step: int, scale: float, interp: str) -> Channel:
+        ts = list(range(0, frames - 1, step)) + [frames - 1]
+        return Channel(keys=[{"t": t, "v": float(rng.normal() * scale), "interp": interp} for t in ts])
+
+    return Project(
+        meta=Meta(name="bench", fps=24, frames=frames, resolution=(640, 360)),
+        timeline=Timeline(tracks=[Track(id="camera.transform", type="camera.transform", channels={
+            "position.x": channel(240, 3.0, "catmull_rom"),
+            "position.y": channel(600, 0.5, "catmull_rom"),
+            "position.z": channel(300, 2.0, "bezier"),
+            "target.x": channel(480, 1.0, "catmull_rom"),
+            "roll_deg": channel(900, 4.0, "bezier"),
+            "focal_length_mm": Channel(keys=[{"t": 0, "v": 35}, {"t": frames - 1, "v": 50}]),
+        })]),
+    )
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def _count(baked) -> int:
+    return sum(len(keys) for track in baked.values() for keys in track.values())
+
+
+def main(max_error: float = 0.01) -> None:
+    rng = np.random.default_rng(5)
+    print(f"{'frames':>9}{'dense keys':>12}{'adaptive keys':>15}{'dense s':>10}{'adaptive s':>12}{'speedup':>9}")
+    for n in SIZES:
+        pr = _project(n, rng)
+        dense_s, dense = _timed(lambda: bake_camera_tracks(pr, 0, n - 1, max_error=max_error))
+        fast_s, fast = _timed(lambda: bake_camera_tracks(pr, 0, n - 1, max_error=max_error, sampling="adaptive"))
+        print(f"{n:>9}{_count(dense):>12}{_count(fast):>15}{dense_s:>10.3f}{fast_s:>12.3f}{dense_s / fast_s:>9.1f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.01)
@@ -0,0 +1,38 @@
+"""AimSpring: per-frame tuple loop vs the batched block scan.
+
+Run from deforum_core/:  python benchmarks/bench_aim_spring.py [frames]
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from deforum_core.camera.modifiers import AIM_SPRING_INTEGRATORS, aim_spring_apply, aim_spring_scan
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main(frames: int = 200000) -> None:
+    rng = np.random.default_rng(3)
+    targets = np.cumsum(rng.normal(scale=0.05, size=(frames, 3)), axis=0)
+    fr = np.arange(frames)
+    dt, stiffness, damping = 1.0 / 24.0, 18.0, 0.8
+
+    as_tuples = [tuple(t) for t in targets.tolist()]
+    base_s, ref = _timed(lambda: np.array(aim_spring_apply(as_tuples, dt=dt, stiffness=stiffness, damping=damping)))
+    print(f"{'path':<22}{'seconds':>10}{'speedup':>10}{'max |err|':>12}")
+    print(f"{'tuple loop':<22}{base_s:>10.4f}{1.0:>10.1f}{0.0:>12.2e}")
+    for integrator in AIM_SPRING_INTEGRATORS:
+        s, (got, _) = _timed(lambda: aim_spring_scan(fr, targets, dt, stiffness, damping, integrator=integrator))
+        err = np.max(np.abs(got - ref)) if integrator == "euler" else float("nan")
+        print(f"{'scan/' + integrator:<22}{s:>10.4f}{base_s / s:>10.1f}{err:>12.2e}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,56 @@
+"""Eased bezier channel evaluation: reference path vs compiled solvers.
+
+Run from deforum_core/:  python benchmarks/bench_bezier_solver.py [frames]
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from deforum_core.schema.models import Keyframe
+from deforum_core.timeline.curves import BEZIER_SOLVERS, compile_keyframes, eval_keyframes
+
+
+def _eased_bezier_keys(frames: int, spacing: int = 24):
+    rng = np.random.default_rng(7)
+    keys = []
+    for t in range(0, frames + spacing, spacing):
+        keys.append(Keyframe.model_construct(
+            t=t,
+            v=float(rng.normal()),
+            interp="bezier",
+            in_tan=(float(-rng.uniform(0.1, 0.9)), float(rng.normal())),
+            out_tan=(float(rng.uniform(0.1, 0.9)), float(rng.normal())),
+            ease=(0.42, 0.0, 0.58, 1.0),
+        ))
+    return keys
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main(frames: int = 20000) -> None:
+    keys = _eased_bezier_keys(frames)
+    fr = np.arange(frames)
+
+    base_s, ref = _timed(lambda: np.array([eval_keyframes(keys, int(f)) for f in fr]))
+    print(f"{'path':<22}{'seconds':>10}{'speedup':>10}{'max |err|':>12}")
+    print(f"{'eval_keyframes loop':<22}{base_s:>10.4f}{1.0:>10.1f}{0.0:>12.2e}")
+
+    for solver in BEZIER_SOLVERS:
+        cc = compile_keyframes(keys, solver=solver)
+        s, got = _timed(lambda: cc.eval_array(fr))
+        print(f"{'array/' + solver:<22}{s:>10.4f}{base_s / s:>10.1f}{np.max(np.abs(got - ref)):>12.2e}")
+        sub = fr[: max(1, frames // 10)]
+        s, got = _timed(lambda: [cc.eval(int(f)) for f in sub])
+        s *= len(fr) / len(sub)
+        print(f"{'scalar/' + solver:<22}{s:>10.4f}{base_s / s:>10.1f}{np.max(np.abs(np.array(got) - ref[: len(sub)])):>12.2e}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20000)
@@ -0,0 +1,78 @@
+"""Douglas–Peucker key reduction: recursive list-slicing version vs `rdp_indices`, then the
+bezier fit (`fit_bezier_keys`, bake ``key_mode="bezier"``) on the same series.
+
+Run from deforum_core/:  python benchmarks/bench_key_reduction.py [eps]
+"""
+from __future__ import annotations
+
+import sys
+import time
+
+import numpy as np
+
+from deforum_core.timeline.keyreduce import fit_bezier_keys, rdp_indices
+
+SIZES = (10_000, 50_000, 200_000)
+
+
+def _recursive_rdp(points, eps):
+    # The pre-keyreduce implementation (formerly exporters._rdp), kept as the baseline.
+    if len(points) <= 2:
+        return points
+    (x1, y1), (x2, y2) = points[0], points[-1]
+    dx, dy = x2 - x1, y2 - y1
+    denom = (dx * dx + dy * dy) ** 0.5
+    max_d, idx = -1.0, -1
+    for i in range(1, len(points) - 1):
+        x0, y0 = points[i]
+        d = abs(dy * x0 - dx * y0 + x2 * y1 - y2 * x1) / denom
+        if d > max_d:
+            max_d, idx = d, i
+    if max_d <= eps or idx < 0:
+        return [points[0], points[-1]]
+    return _recursive_rdp(points[: idx + 1], eps)[:-1] + _recursive_rdp(points[idx:], eps)
+
+
+def _timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def _cases(rng, n):
+    t = np.arange(n, dtype=np.float64)
+    return t, {
+        "noisy walk": np.cumsum(rng.normal(scale=0.05, size=n)),
+        "smooth+noise": np.sin(t / 500.0) * 3.0 + rng.normal(scale=0.02, size=n),
+    }
+
+
+def main(eps: float = 0.05) -> None:
+    rng = np.random.default_rng(11)
+    sys.setrecursionlimit(10_000)
+    print(f"{'series':<16}{'samples':>9}{'kept':>8}{'recursive s':>13}{'keyreduce s':>13}{'speedup':>9}")
+    for n in SIZES:
+        t, cases = _cases(rng, n)
+        for name, v in cases.items():
+            fast_s, idx = _timed(lambda: rdp_indices(t, v, eps))
+            pts = list(zip(t.tolist(), v.tolist()))
+            try:
+                base_s, ref = _timed(lambda: _recursive_rdp(pts, eps))
+                assert [int(p[0]) for p in ref] == idx.tolist()
+                base = f"{base_s:>13.3f}{base_s / fast_s:>9.1f}"
+            except RecursionError:
+                base = f"{'recursion':>13}{'-':>9}"
+            print(f"{name:<16}{n:>9}{len(idx):>8}{base[:13]}{fast_s:>13.3f}{base[13:]}")
+
+    print()
+    print(f"{'series':<16}{'samples':>9}{'rdp kept':>10}{'rdp s':>9}{'bezier kept':>13}{'bezier s':>10}{'x rdp':>8}")
+    for n in SIZES:
+        t, cases = _cases(rng, n)
+        for name, v in cases.items():
+            rdp_s, idx = _timed(lambda: rdp_indices(t, v, eps, metric="vertical"))
+            fit_s, fit = _timed(lambda: fit_bezier_keys(t, v, eps))
+            print(f"{name:<16}{n:>9}{len(idx):>10}{rdp_s:>9.3f}{len(fit.indices):>13}{fit_s:>10.3f}{fit_s / rdp_s:>8.1f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 0.05)
@@ -0,0 +1,59 @@
+"""Camera range evaluation: serial vs process pool, for frame-local and stateful stacks.
+
+Stateful stacks evaluate serially at every worker count.
+
+Run from deforum_core/:  python benchmarks/bench_parallel_range.py [frames]
+"""
+from __future__ import annotations
+
+import os
+import sys
+import time
+
+from deforum_core.camera.parallel import eval_camera_range_parallel
+from deforum_core.camera.rig import CameraRig
+from deforum_core.schema.models import Project
+
+STACKS = {
+    "frame-local": [{"type": "NoiseShake", "params": {"seed": 3, "mode": "hash"}}, {"type": "HorizonLock"}],
+    "stateful": [
+        {"type": "AimSpring", "params": {"stiffness": 9.0, "damping": 0.7, "integrator": "exact"}},
+        {"type": "NoiseShake", "params": {"seed": 3}},
+    ],
+}
+
+
+def _project(frames: int, modifiers) -> Project:
+    keys = [{"t": t, "v": float((t * 7919) % 13) / 4.0, "interp": "bezier"} for t in range(0, frames + 48, 48)]
+    return Project.model_validate({
+        "meta": {"name": "bench", "fps": 24, "frames": frames},
+        "timeline": {"tracks": [{
+            "id": "camera.transform",
+            "type": "CameraTransformTrack",
+            "channels": {"position.x": {"keys": keys}, "target.y": {"keys": keys}, "roll_deg": {"keys": keys}},
+            "modifiers": modifiers,
+        }]},
+    })
+
+
+def main(frames: int = 200000) -> None:
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, 8, 16, cores} & set(range(1, cores + 1))) or [1]
+    print(f"{frames} frames, {cores} cores")
+    print(f"{'stack':<14}{'workers':>8}{'seconds':>10}{'speedup':>10}{'identical':>11}")
+    for name, modifiers in STACKS.items():
+        pr = _project(frames, modifiers)
+        t0 = time.perf_counter()
+        ref = CameraRig.from_project(pr).eval_range(0, frames - 1)
+        base = time.perf_counter() - t0
+        print(f"{name:<14}{'serial':>8}{base:>10.3f}{1.0:>10.2f}{'':>11}")
+        for w in counts:
+            t0 = time.perf_counter()
+            got = eval_camera_range_parallel(pr, 0, frames - 1, workers=w)
+            s = time.perf_counter() - t0
+            same = got.data.tobytes() == ref.data.tobytes()
+            print(f"{name:<14}{w:>8}{s:>10.3f}{base / s:>10.2f}{str(same):>11}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
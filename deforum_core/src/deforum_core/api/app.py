@@ -1,15 +1,20 @@
 from __future__ import annotations
 
+import hashlib
 import json
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from deforum_core.camera.rig import eval_camera
-from deforum_core.camera.bake import sample_camera, apply_constraints, eval_camera_range
+from deforum_core.camera.rig import CameraRig
+from deforum_core.camera.bake import sample_camera, apply_constraints
+from deforum_core.camera.splines import TESSELLATE_MAX_POINTS, TESSELLATE_TOLERANCE
 from deforum_core.schema.models import Project
 
 
@@ -25,16 +30,41 @@ class SaveRequest(BaseModel):
 class EvalFrameRequest(BaseModel):
     path: Optional[str] = None
     project: Optional[Dict[str, Any]] = None
+    # Client-chosen id of this project state; bump it on every edit. Lets the rig cache key an
+    # inline project without hashing all of it (see `_RigCache`).
+    revision: Optional[str] = None
     frame: int
 
 
 class EvalRangeRequest(BaseModel):
     path: Optional[str] = None
     project: Optional[Dict[str, Any]] = None
+    revision: Optional[str] = None
     start: int
     end: int
 
 
+class NearestRequest(BaseModel):
+    path: Optional[str] = None
+    project: Optional[Dict[str, Any]] = None
+    revision: Optional[str] = None
+    spline_id: str
+    points: List[Tuple[float, float, float]]
+    # Report u as a fraction of path length (Rail/FollowPath `arc_length` params).
+    arc_length: bool = False
+
+
+class TessellateRequest(BaseModel):
+    path: Optional[str] = None
+    project: Optional[Dict[str, Any]] = None
+    revision: Optional[str] = None
+    spline_ids: Optional[List[str]] = None  # None: every spline in the project
+    # Chord deviation in world units at zoom 0; each zoom level halves it.
+    tolerance: float = Field(TESSELLATE_TOLERANCE, gt=0.0)
+    zoom: float = 0.0
+    max_points: int = Field(TESSELLATE_MAX_POINTS, ge=2, le=65536)
+
+
 def _resolve_project_json(path: str) -> Path:
     p = Path(path)
     if p.is_dir():
@@ -56,8 +86,80 @@ def _save_project(path: str, project: Project) -> None:
     pj.write_text(project.model_dump_json(indent=2), encoding="utf-8")
 
 
+def _project_fingerprint(project: Dict[str, Any]) -> str:
+    """Cheap digest that tells projects apart without serializing their keys.
+
+    Covers meta, track/channel/object ids, key counts and each channel's end keys: O(channels),
+    not O(keys). Only scopes a client revision; it does not detect edits on its own.
+    """
+    timeline = project.get("timeline") or {}
+    parts: List[Any] = [project.get("meta")]
+    for track in timeline.get("tracks") or []:
+        parts.append(track.get("id"))
+        for name, ch in sorted((track.get("channels") or {}).items()):
+            keys = ch.get("keys") or []
+            parts.append((name, ch.get("value"), len(keys), keys[0] if keys else None, keys[-1] if keys else None))
+    objects = timeline.get("objects") or {}
+    for kind in ("nulls", "splines"):
+        parts.append(sorted((objects.get(kind) or {}).keys()))
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+
+# Prepared rigs for recently evaluated projects, so UI-rate /evaluate/frame calls skip
+# project validation and channel compilation when the project has not changed.
+RIG_CACHE_SIZE = 8
+
+
+class _RigCache:
+    """LRU of prepared rigs, shared by the threadpool FastAPI runs sync endpoints on.
+
+    Path requests are keyed by file and mtime. Inline projects are keyed by ``revision`` when the
+    client sends one, scoped by `_project_fingerprint` so projects that reuse a revision string do
+    not share a rig; otherwise by a hash of the whole project, which serializes it on every call
+    (milliseconds for large projects), so UI-rate clients should send a revision.
+    """
+
+    def __init__(self, size: int = RIG_CACHE_SIZE):
+        self.size = int(size)
+        self._rigs: "OrderedDict[str, CameraRig]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, req: Union[EvalFrameRequest, EvalRangeRequest, NearestRequest, TessellateRequest]) -> str:
+        if req.project is not None:
+            if req.revision is not None:
+                return f"revision:{_project_fingerprint(req.project)}:{req.revision}"
+            raw = json.dumps(req.project, sort_keys=True, separators=(",", ":"), default=str)
+            return "project:" + hashlib.sha1(raw.encode("utf-8")).hexdigest()
+        if req.path is not None:
+            pj = _resolve_project_json(req.path)
+            if not pj.exists():
+                raise FileNotFoundError(str(pj))
+            return f"path:{pj.resolve()}:{pj.stat().st_mtime_ns}"
+        raise HTTPException(status_code=400, detail="Provide project or path")
+
+    def get(self, req: Union[EvalFrameRequest, EvalRangeRequest, NearestRequest, TessellateRequest]) -> CameraRig:
+        key = self._key(req)
+        with self._lock:
+            rig = self._rigs.get(key)
+            if rig is not None:
+                self._rigs.move_to_end(key)
+                return rig
+        # Built outside the lock so a slow project does not stall other requests; a concurrent
+        # miss on the same key builds twice and the last one wins.
+        project = Project.model_validate(req.project) if req.project is not None else _load_project(str(req.path))
+        rig = CameraRig.from_project(project)
+        with self._lock:
+            self._rigs[key] = rig
+            while len(self._rigs) > self.size:
+                self._rigs.popitem(last=False)
+        return rig
+
+
 def create_app() -> FastAPI:
     app = FastAPI(title="Deforum Next Bridge (v18.1)", version="0.18.1")
+    rigs = _RigCache()
+    state = SimpleNamespace(project=None)
 
     app.add_middleware(
         CORSMiddleware,
@@ -80,6 +182,7 @@ def create_app() -> FastAPI:
     def project_load(req: LoadRequest) -> Dict[str, Any]:
         try:
             project = _load_project(req.path)
+            state.project = project
             return {"project": project.model_dump()}
         except FileNotFoundError:
             raise HTTPException(status_code=404, detail="project.json not found")
@@ -91,6 +194,7 @@ def create_app() -> FastAPI:
         try:
             project = Project.model_validate(req.project)
             _save_project(req.path, project)
+            state.project = project
             return {"status": "saved"}
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
@@ -98,14 +202,7 @@ def create_app() -> FastAPI:
     @app.post("/evaluate/frame")
     def evaluate_frame(req: EvalFrameRequest) -> Dict[str, Any]:
         try:
-            if req.project is not None:
-                project = Project.model_validate(req.project)
-            elif req.path is not None:
-                project = _load_project(req.path)
-            else:
-                raise HTTPException(status_code=400, detail="Provide project or path")
-
-            cam = eval_camera(project, req.frame)
+            cam = rigs.get(req).eval(req.frame)
             return {
                 "frame": cam.frame,
                 "position": cam.position,
@@ -125,49 +222,83 @@ def create_app() -> FastAPI:
     @app.post("/evaluate/range")
     def evaluate_range(req: EvalRangeRequest) -> Dict[str, Any]:
         try:
-            if req.project is not None:
-                project = Project.model_validate(req.project)
-            elif req.path is not None:
-                project = _load_project(req.path)
-            else:
-                raise HTTPException(status_code=400, detail="Provide project or path")
-
             start = max(0, int(req.start))
             end = max(start, int(req.end))
 
-            cams = eval_camera_range(project, start=start, end=end)
+            cams = rigs.get(req).eval_range(start, end)
 
-            frames: List[Dict[str, Any]] = []
-            for cam in cams:
-                frames.append({
-                    "frame": cam.frame,
-                    "position": cam.position,
-                    "target": cam.target,
-                    "rotation": [cam.rotation.w, cam.rotation.x, cam.rotation.y, cam.rotation.z],
-                    "focal_length_mm": cam.focal_length_mm,
-                })
+            frames: List[Dict[str, Any]] = [
+                {"frame": f, "position": p, "target": t, "rotation": q, "focal_length_mm": fl}
+                for f, p, t, q, fl in zip(
+                    cams.frame.tolist(), cams.position.tolist(), cams.target.tolist(),
+                    cams.rotation.tolist(), cams.focal_length_mm.tolist(),
+                )
+            ]
             return {"frames": frames}
         except HTTPException:
             raise
         except Exception as e:
             raise HTTPException(status_code=400, detail=str(e))
 
-    return app
+    @app.post("/spline/nearest")
+    def spline_nearest(req: NearestRequest) -> Dict[str, Any]:
+        try:
+            rig = rigs.get(req)
+            hit = rig.nearest_u_batch(req.spline_id, req.points)
+            if hit is None:
+                raise HTTPException(status_code=404, detail=f"Spline {req.spline_id!r} not found or empty")
+            u, pos, dist = hit
+            if req.arc_length:
+                u = rig.compiled_splines[req.spline_id].arc_length.fraction(u)
+            return {"u": u.tolist(), "position": pos.tolist(), "distance": dist.tolist()}
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
 
-@app.get("/camera_path")
-def camera_path(start: int = 0, end: int = 179, apply: bool = True):
-    pr = state.project
-    end = min(int(end), int(pr.meta.frames) - 1)
-    start = max(0, int(start))
-    cc = getattr(getattr(pr, "timeline", None), "camera_constraints", None)
-    step = int(getattr(cc, "sample_step", 1) or 1) if cc else 1
-    samples = sample_camera(pr, start, end, step=step)
-    if apply and cc and getattr(cc, "enabled", False):
-        samples = apply_constraints(samples, cc)
-    return {
-        "meta": {"start": start, "end": end, "step": step, "constraints": cc.model_dump() if cc else None},
-        "samples": [
-            {"frame": s.frame, "pos": list(s.pos), "target": list(s.target), "euler_deg": list(s.euler_deg), "focal_length_mm": s.focal_length_mm}
-            for s in samples
-        ],
-    }
+    @app.post("/spline/tessellate")
+    def spline_tessellate(req: TessellateRequest) -> Dict[str, Any]:
+        """Adaptive polylines per spline as flat [x0, y0, z0, x1, ...] arrays for the viewport."""
+        try:
+            rig = rigs.get(req)
+            tolerance = float(req.tolerance) * 2.0 ** -float(req.zoom)
+            ids = rig.compiled_splines.keys() if req.spline_ids is None else req.spline_ids
+            out: Dict[str, Any] = {}
+            for sid in ids:
+                cs = rig.compiled_splines.get(str(sid))
+                if cs is None:
+                    continue
+                tess = cs.tessellate(tolerance, req.max_points)
+                out[str(sid)] = {
+                    "count": len(tess.u),
+                    "points": tess.points.ravel().tolist(),
+                    "u": tess.u.tolist(),
+                    "max_error": tess.max_error,
+                }
+            return {"tolerance": tolerance, "splines": out}
+        except HTTPException:
+            raise
+        except Exception as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    @app.get("/camera_path")
+    def camera_path(start: int = 0, end: int = 179, apply: bool = True):
+        pr = state.project
+        if pr is None:
+            raise HTTPException(status_code=404, detail="No project loaded")
+        end = min(int(end), int(pr.meta.frames) - 1)
+        start = max(0, int(start))
+        cc = getattr(getattr(pr, "timeline", None), "camera_constraints", None)
+        step = int(getattr(cc, "sample_step", 1) or 1) if cc else 1
+        samples = sample_camera(pr, start, end, step=step)
+        if apply and cc and getattr(cc, "enabled", False):
+            samples = apply_constraints(samples, cc)
+        return {
+            "meta": {"start": start, "end": end, "step": step, "constraints": cc.model_dump() if cc else None},
+            "samples": [
+                {"frame": s.frame, "pos": list(s.pos), "target": list(s.target), "euler_deg": list(s.euler_deg), "focal_length_mm": s.focal_length_mm}
+                for s in samples
+            ],
+        }
+
+    return app
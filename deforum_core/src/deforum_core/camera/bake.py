@@ -1,89 +1,151 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Sequence, Tuple, Optional
 import math
 
-from deforum_core.schema.models import Project, CameraConstraints
-from deforum_core.camera.rig import eval_camera_range
-from deforum_core.camera.euler import quat_to_euler_xyz_deg
-from deforum_core.camera.shot_constraints import segmentize
+import numpy as np
 
-from deforum_core.camera.quat import quat_to_euler_xyz_deg
+from deforum_core.schema.models import Project, CameraConstraints, Keyframe
+from deforum_core.camera.parallel import eval_camera_range_parallel
+from deforum_core.camera.rig import POSITION_DEFAULT, TARGET_DEFAULT, CameraRig, eval_camera_range
+from deforum_core.camera.euler import focal_mm_to_fov_deg, quat_to_euler_xyz_deg_batch
+from deforum_core.camera.math3d import quat_view_roll_deg_batch
+from deforum_core.timeline.curves import CompiledChannel, compile_keyframes
+from deforum_core.timeline.keyreduce import JointError, fit_bezier_keys, joint_column_keys, rdp_indices, rdp_joint, rdp_points
 
 Vec3 = Tuple[float, float, float]
 
-def _v_add(a: Vec3, b: Vec3) -> Vec3:
-    return (a[0]+b[0], a[1]+b[1], a[2]+b[2])
+SMOOTHING_KERNELS = ("trailing", "centered", "gaussian")
 
-def _v_sub(a: Vec3, b: Vec3) -> Vec3:
-    return (a[0]-b[0], a[1]-b[1], a[2]-b[2])
 
-def _v_mul(a: Vec3, s: float) -> Vec3:
-    return (a[0]*s, a[1]*s, a[2]*s)
+def _window_mean(x: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """Mean of rows ``x[lo[i]:hi[i]]`` for every i, from one cumulative sum (x is (N, D))."""
+    c = np.zeros((len(x) + 1, x.shape[1]))
+    np.cumsum(x, axis=0, out=c[1:])
+    return (c[hi] - c[lo]) / (hi - lo)[:, None]
 
-def _v_len(a: Vec3) -> float:
-    return math.sqrt(a[0]*a[0] + a[1]*a[1] + a[2]*a[2])
 
-def _clamp_len(v: Vec3, max_len: float) -> Vec3:
-    L = _v_len(v)
-    if L <= 1e-12 or L <= max_len:
-        return v
-    return _v_mul(v, max_len / L)
+def _gaussian_kernel(window: int) -> np.ndarray:
+    # The window spans +-3 sigma.
+    r = window // 2
+    sigma = max(window / 6.0, 1e-6)
+    k = np.exp(-0.5 * (np.arange(-r, r + 1) / sigma) ** 2)
+    return k / k.sum()
 
-def _moving_average(series: List[float], window: int) -> List[float]:
-    if window <= 1:
-        return series[:]
-    out = []
-    s = 0.0
-    q = []
-    for x in series:
-        q.append(float(x))
-        s += float(x)
-        if len(q) > window:
-            s -= q.pop(0)
-        out.append(s / len(q))
-    return out
 
-def _moving_average_vec3(series: List[Vec3], window: int) -> List[Vec3]:
-    if window <= 1:
-        return series[:]
-    xs = _moving_average([p[0] for p in series], window)
-    ys = _moving_average([p[1] for p in series], window)
-    zs = _moving_average([p[2] for p in series], window)
-    return list(zip(xs, ys, zs))
-
-def _limit_speed_accel_vec3(series: List[Vec3], max_speed: float, max_accel: float) -> List[Vec3]:
-    if (max_speed <= 0 and max_accel <= 0) or len(series) <= 1:
-        return series[:]
-    out = [series[0]]
-    prev_v = (0.0, 0.0, 0.0)
-    for i in range(1, len(series)):
-        desired = series[i]
-        prev = out[-1]
-        dv = _v_sub(desired, prev)
+def _smooth(series: np.ndarray, window: int, kernel: str = "trailing") -> np.ndarray:
+    """Smooth (N,) or (N, D) samples along axis 0 in O(N) per column.
+
+    - trailing: mean of the last ``window`` samples (fewer at the start)
+    - centered: mean of ``window`` samples around each sample (truncated at the ends)
+    - gaussian: Gaussian-weighted window, renormalized where it runs past the ends
+    """
+    x = np.asarray(series, dtype=np.float64)
+    window = int(window)
+    if window <= 1 or len(x) <= 1:
+        return x.copy()
+    if kernel not in SMOOTHING_KERNELS:
+        raise ValueError(f"Unknown smoothing kernel {kernel!r}; expected one of {SMOOTHING_KERNELS}")
+    flat = x.reshape(len(x), -1)
+    # Work relative to the first sample so long cumulative sums keep their precision.
+    origin = flat[0].copy()
+    rel = flat - origin
+    n = len(rel)
+    i = np.arange(n)
+    if kernel == "trailing":
+        out = _window_mean(rel, np.maximum(0, i - window + 1), i + 1)
+    elif kernel == "centered":
+        out = _window_mean(rel, np.maximum(0, i - (window - 1) // 2), np.minimum(n, i + window // 2 + 1))
+    else:
+        k = _gaussian_kernel(window)
+        mass = np.convolve(np.ones(n), k, mode="same")
+        out = np.stack([np.convolve(rel[:, j], k, mode="same") for j in range(rel.shape[1])], axis=1) / mass[:, None]
+    return (out + origin).reshape(x.shape)
+
+
+def _limit_speed_accel(series: np.ndarray, max_speed: float, max_accel: float = 0.0) -> np.ndarray:
+    """Clamp per-sample step length to ``max_speed`` and its change to ``max_accel`` (<= 0: no limit).
+
+    ``series`` is (N,) or (N, D) with D <= 3; vectors are clamped by length. The recurrence is
+    sequential only where a limit is active: wherever the input already respects both limits (and
+    the previous step did too), the output equals the input, so those stretches are located with
+    array ops and copied.
+    """
+    x = np.asarray(series, dtype=np.float64)
+    if (max_speed <= 0 and max_accel <= 0) or len(x) <= 1:
+        return x.copy()
+    flat = x.reshape(len(x), -1)
+    n, dim = flat.shape
+    d = np.zeros_like(flat)
+    d[1:] = flat[1:] - flat[:-1]
+    ok = np.ones(n, dtype=bool)
+    if max_speed > 0:
+        ok &= np.sqrt(np.einsum("ij,ij->i", d, d)) <= max_speed
+    if max_accel > 0:
+        dd = np.diff(d, axis=0, prepend=np.zeros((1, dim)))
+        ok &= np.sqrt(np.einsum("ij,ij->i", dd, dd)) <= max_accel
+    bad = (np.flatnonzero(~ok[1:]) + 1).tolist()
+    if not bad:
+        return x.copy()
+
+    # Scalar loop over xyz rows; zero padding of shorter rows leaves lengths unchanged.
+    if dim == 3:
+        rows = flat.tolist()
+    else:
+        padded = np.zeros((n, 3))
+        padded[:, :dim] = flat
+        rows = padded.tolist()
+    changed_at: List[int] = []
+    changed: List[List[float]] = []
+    px, py, pz = rows[0]
+    vx = vy = vz = 0.0
+    free = 2  # consecutive unclamped steps; two in a row put the output back on the input
+    b = 0
+    i = 1
+    while i < n:
+        if free >= 2:
+            # In sync with the input: skip ahead to the next precomputed violation.
+            while b < len(bad) and bad[b] < i:
+                b += 1
+            if b == len(bad):
+                break
+            i = bad[b]
+            px, py, pz = rows[i - 1]
+            qx, qy, qz = rows[i - 2] if i >= 2 else rows[0]
+            vx, vy, vz = px - qx, py - qy, pz - qz
+            free = 0
+        wx, wy, wz = rows[i]
+        ux, uy, uz = wx - px, wy - py, wz - pz
+        clamped = False
         if max_speed > 0:
-            dv = _clamp_len(dv, max_speed)
-        v = dv
+            L = math.sqrt(ux * ux + uy * uy + uz * uz)
+            if L > max_speed and L > 1e-12:
+                k = max_speed / L
+                ux, uy, uz = ux * k, uy * k, uz * k
+                clamped = True
         if max_accel > 0:
-            da = _v_sub(v, prev_v)
-            da = _clamp_len(da, max_accel)
-            v = _v_add(prev_v, da)
-        out.append(_v_add(prev, v))
-        prev_v = v
-    return out
+            ax, ay, az = ux - vx, uy - vy, uz - vz
+            L = math.sqrt(ax * ax + ay * ay + az * az)
+            if L > max_accel and L > 1e-12:
+                k = max_accel / L
+                ux, uy, uz = vx + ax * k, vy + ay * k, vz + az * k
+                clamped = True
+        if clamped:
+            px, py, pz = px + ux, py + uy, pz + uz
+            changed_at.append(i)
+            changed.append([px, py, pz])
+            free = 0
+        else:
+            px, py, pz = wx, wy, wz
+            free += 1
+        vx, vy, vz = ux, uy, uz
+        i += 1
+    out = flat.copy()
+    if changed_at:
+        out[changed_at] = np.asarray(changed)[:, :dim]
+    return out.reshape(x.shape)
 
-def _limit_speed_scalar(series: List[float], max_speed: float) -> List[float]:
-    if max_speed <= 0 or len(series) <= 1:
-        return [float(x) for x in series]
-    out = [float(series[0])]
-    for i in range(1, len(series)):
-        prev = out[-1]
-        dv = float(series[i]) - prev
-        if abs(dv) > max_speed:
-            dv = max_speed if dv > 0 else -max_speed
-        out.append(prev + dv)
-    return out
 
 @dataclass
 class CameraSample:
@@ -92,76 +154,60 @@ class CameraSample:
     target: Vec3
     euler_deg: Vec3
     fov_deg: float
+    focal_length_mm: float = 35.0
 
 def sample_camera(project: Project, start: int, end: int, step: int = 1) -> List[CameraSample]:
-    samples: List[CameraSample] = []
-    for f in range(int(start), int(end)+1, int(step)):
-        st = eval_camera(project, f)
-        rx, ry, rz = quat_to_euler_xyz_deg(st.rotation)
-        samples.append(CameraSample(frame=f, pos=tuple(st.position), target=tuple(st.target), euler_deg=(rx,ry,rz), fov_deg=float(st.fov_deg)))
-    return samples
+    cams = eval_camera_range(project, start=int(start), end=int(end))[::max(1, int(step))]
+    eulers = quat_to_euler_xyz_deg_batch(cams.rotation).tolist()
+    focals = cams.focal_length_mm.tolist()
+    return [
+        CameraSample(
+            frame=f,
+            pos=(p[0], p[1], p[2]),
+            target=(t[0], t[1], t[2]),
+            euler_deg=(rx, ry, rz),
+            fov_deg=focal_mm_to_fov_deg(fl),
+            focal_length_mm=fl,
+        )
+        for f, p, t, (rx, ry, rz), fl in zip(cams.frame.tolist(), cams.position.tolist(), cams.target.tolist(), eulers, focals)
+    ]
 
 def apply_constraints(samples: List[CameraSample], constraints: CameraConstraints) -> List[CameraSample]:
     if not constraints or not constraints.enabled or len(samples) <= 1:
         return samples[:]
     window = int(constraints.smoothing_window or 0)
-
-    pos = [s.pos for s in samples]
-    tgt = [s.target for s in samples]
-    roll = [s.euler_deg[0] for s in samples]
-    fov  = [s.fov_deg for s in samples]
-
-    if window and window > 1:
-        pos = _moving_average_vec3(pos, window)
-        tgt = _moving_average_vec3(tgt, window)
-        roll = _moving_average(roll, window)
-        fov  = _moving_average(fov, window)
-
-    pos = _limit_speed_accel_vec3(pos, float(constraints.max_speed_pos), float(constraints.max_accel_pos))
-    tgt = _limit_speed_accel_vec3(tgt, float(constraints.max_speed_target), float(constraints.max_accel_target))
-    roll = _limit_speed_scalar(roll, float(constraints.max_speed_roll_deg))
-    fov  = _limit_speed_scalar(fov, float(constraints.max_speed_fov_deg))
-
-    out = []
-    for i, s in enumerate(samples):
-        out.append(CameraSample(frame=s.frame, pos=pos[i], target=tgt[i], euler_deg=(roll[i], s.euler_deg[1], s.euler_deg[2]), fov_deg=fov[i]))
-    return out
-
-def _perp_distance_point_to_line_2d(px, py, ax, ay, bx, by):
-    # distance from P to segment AB in 2D, but for DP we use infinite line for stability.
-    dx = bx - ax
-    dy = by - ay
-    if abs(dx) < 1e-12 and abs(dy) < 1e-12:
-        return math.hypot(px - ax, py - ay)
-    # area*2 / length
-    return abs(dy*px - dx*py + bx*ay - by*ax) / math.hypot(dx, dy)
-
-def _douglas_peucker(points, epsilon):
-    # points: list of (t, v)
-    if len(points) <= 2:
-        return points[:]
-    a = points[0]
-    b = points[-1]
-    ax, ay = a[0], a[1]
-    bx, by = b[0], b[1]
-    max_d = -1.0
-    idx = -1
-    for i in range(1, len(points) - 1):
-        px, py = points[i][0], points[i][1]
-        d = _perp_distance_point_to_line_2d(px, py, ax, ay, bx, by)
-        if d > max_d:
-            max_d = d
-            idx = i
-    if max_d <= epsilon or idx < 0:
-        return [a, b]
-    left = _douglas_peucker(points[: idx + 1], epsilon)
-    right = _douglas_peucker(points[idx:], epsilon)
-    return left[:-1] + right
+    kernel = str(constraints.smoothing_kernel)
+
+    pos = np.array([s.pos for s in samples], dtype=np.float64)
+    tgt = np.array([s.target for s in samples], dtype=np.float64)
+    roll = np.array([s.euler_deg[0] for s in samples], dtype=np.float64)
+    focal = np.array([s.focal_length_mm for s in samples], dtype=np.float64)
+
+    if window > 1:
+        pos, tgt, roll, focal = (_smooth(x, window, kernel) for x in (pos, tgt, roll, focal))
+
+    pos = _limit_speed_accel(pos, float(constraints.max_speed_pos), float(constraints.max_accel_pos))
+    tgt = _limit_speed_accel(tgt, float(constraints.max_speed_target), float(constraints.max_accel_target))
+    roll = _limit_speed_accel(roll, float(constraints.max_speed_roll_deg), 0.0)
+    focal = _limit_speed_accel(focal, float(constraints.max_speed_focal_mm), 0.0)
+    fov = np.degrees(2.0 * np.arctan(36.0 / (2.0 * np.maximum(focal, 1e-6))))
+
+    return [
+        CameraSample(
+            frame=s.frame,
+            pos=tuple(p),
+            target=tuple(t),
+            euler_deg=(r, s.euler_deg[1], s.euler_deg[2]),
+            fov_deg=fv,
+            focal_length_mm=fl,
+        )
+        for s, p, t, r, fv, fl in zip(samples, pos.tolist(), tgt.tolist(), roll.tolist(), fov.tolist(), focal.tolist(), strict=True)
+    ]
 
 def _reduce_series(points, epsilon):
     if epsilon is None or float(epsilon) <= 0 or len(points) <= 2:
         return points[:]
-    return _douglas_peucker(points, float(epsilon))
+    return rdp_points(points, float(epsilon))
 
 def bake_camera_tracks(project: Project, start: int, end: int, constraints: Optional[CameraConstraints] = None, reduce_keys: bool = False, max_error: float = 0.0) -> Dict[str, Any]:
 
@@ -196,96 +242,150 @@ def bake_camera_tracks(project: Project, start: int, end: int, constraints: Opti
     return baked
 
 
-def bake_camera_tracks(project: Project, start: int, end: int, reduce_keys: bool = True, max_error: float = 0.01) -> Dict[str, Any]:
+BAKE_KEY_MODES = ("linear", "bezier")
+# "channel": every scalar channel keeps its own frames; "joint": each track's channels share frames.
+BAKE_REDUCE_MODES = ("channel", "joint")
+
+
+# "dense": evaluate every frame, then reduce; "adaptive": evaluate only frames the keys need.
+BAKE_SAMPLING_MODES = ("dense", "adaptive")
+# Adaptive sampling certifies chords at (1 - ADAPTIVE_SLACK) of the tolerance, which leaves room for
+# the evaluator's time-solve error. Stretches it cannot bound are sampled densely once they are at
+# most ADAPTIVE_DENSE_SPAN frames long.
+ADAPTIVE_SLACK = 1e-3
+ADAPTIVE_DENSE_SPAN = 16
+
+
+def _angle_deg(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Angle between (N, 3) rows, in degrees (0 where either row is zero)."""
+    cross = np.cross(a, b)
+    return np.degrees(np.arctan2(np.sqrt(np.einsum("ij,ij->i", cross, cross)), np.einsum("ij,ij->i", a, b)))
+
+
+def _view_error(
+    position: np.ndarray, target: np.ndarray, roll: np.ndarray, eps_pos: float, eps_angle: np.ndarray, eps_roll: float
+) -> JointError:
+    """Camera-space error of reconstructed (position xyz, target xyz, roll) rows, in tolerance units.
+
+    The worst of: position distance / ``eps_pos``, view direction angle / ``eps_angle`` (per
+    sample) and roll difference / ``eps_roll``.
+    """
+    def error(i: np.ndarray, approx: np.ndarray) -> np.ndarray:
+        p = approx[:, 0:3]
+        d = p - position[i]
+        e = np.sqrt(np.einsum("ij,ij->i", d, d)) / eps_pos
+        e = np.maximum(e, _angle_deg(target[i] - position[i], approx[:, 3:6] - p) / eps_angle[i])
+        return np.maximum(e, np.abs(approx[:, 6] - roll[i]) / eps_roll)
+
+    return error
+
+
+def _value_error(values: np.ndarray, eps: np.ndarray) -> JointError:
+    """Worst per-column |value error| / ``eps`` of reconstructed rows."""
+    def error(i: np.ndarray, approx: np.ndarray) -> np.ndarray:
+        return np.max(np.abs(approx - values[i]) / eps, axis=1)
+
+    return error
+
+
+def _bezier_key_dicts(frames: np.ndarray, values: np.ndarray, max_error: float) -> List[Dict[str, Any]]:
+    fit = fit_bezier_keys(frames, values, max_error)
+    last = len(fit.indices) - 1
+    out = []
+    for n, (t, v, it, ot) in enumerate(zip(frames[fit.indices].tolist(), values[fit.indices].tolist(), fit.in_tan.tolist(), fit.out_tan.tolist())):
+        key: Dict[str, Any] = {"t": int(t), "v": float(v), "interp": "bezier"}
+        if n > 0:
+            key["in_tan"] = it
+        if n < last:
+            key["out_tan"] = ot
+        out.append(key)
+    return out
+
+
+def bake_camera_tracks(
+    project: Project,
+    start: int,
+    end: int,
+    reduce_keys: bool = True,
+    max_error: float = 0.01,
+    workers: int = 1,
+    key_mode: str = "linear",
+    reduce_mode: str = "channel",
+    max_angle_deg: Optional[float] = None,
+    sampling: str = "dense",
+) -> Dict[str, Any]:
     """Bake camera state into explicit keyframes.
 
     - Samples camera state per frame (or per sample_step if constraints provided).
     - Applies shot-aware constraints (smoothing + speed limiting) during range evaluation.
-    - Optionally reduces keys using Douglas–Peucker for each scalar channel.
+    - Optionally reduces keys per scalar channel: ``key_mode="linear"`` keeps Douglas–Peucker
+      samples as linear keys; ``"bezier"`` fits bezier keys with tangents within ``max_error``.
+    - ``reduce_mode="joint"`` keys all channels of a track on the same frames (linear keys). The
+      transform is bounded in camera space: position within ``max_error``, view direction within
+      ``max_angle_deg`` (default: the angle a ``max_error`` target offset subtends at each frame)
+      and roll within its tolerance.
+    - ``sampling="adaptive"`` (per-channel linear keys only) skips evaluating frames the reduction
+      would drop: chords between keys are accepted on a bound over the source curves, so every
+      frame stays within ``max_error`` (vertically, which also bounds the dense path's distance).
+      Rigs whose stack reshapes the curves (anything but LookAtObject) are sampled densely.
     """
     if end < start:
         raise ValueError("end must be >= start")
+    if key_mode not in BAKE_KEY_MODES:
+        raise ValueError(f"Unknown key mode {key_mode!r}; expected one of {BAKE_KEY_MODES}")
+    if reduce_mode not in BAKE_REDUCE_MODES:
+        raise ValueError(f"Unknown reduce mode {reduce_mode!r}; expected one of {BAKE_REDUCE_MODES}")
+    if reduce_mode == "joint" and key_mode != "linear":
+        raise ValueError("Joint key reduction emits linear keys; use key_mode='linear'")
+    if sampling not in BAKE_SAMPLING_MODES:
+        raise ValueError(f"Unknown sampling mode {sampling!r}; expected one of {BAKE_SAMPLING_MODES}")
+    if sampling == "adaptive":
+        if key_mode != "linear" or reduce_mode != "channel":
+            raise ValueError("Adaptive sampling emits per-channel linear keys; use key_mode='linear', reduce_mode='channel'")
+        if reduce_keys and max_error > 0 and end > start:
+            rig = CameraRig.from_project(project)
+            sources = _adaptive_sources(rig)
+            if sources is not None:
+                return _bake_adaptive(rig, sources, int(start), int(end), float(max_error))
 
     # Determine sampling step from global constraints (if any); segmentize uses per-frame constraints anyway.
     # We'll sample every frame to preserve accuracy, then key-reduce if needed.
-    states = eval_camera_range(project, start=start, end=end)
+    cams = eval_camera_range_parallel(project, start, end, workers)
 
-    # Build scalar series
-    # position / target
+    # One scalar series per channel, straight from the camera buffer columns.
+    frames = cams.frame
     series = {
-        "position.x": [],
-        "position.y": [],
-        "position.z": [],
-        "target.x": [],
-        "target.y": [],
-        "target.z": [],
-        "roll_deg": [],
-        "focal_length_mm": [],
-        "focus_distance_m": [],
-        "aperture_f": [],
+        "position.x": cams.position[:, 0],
+        "position.y": cams.position[:, 1],
+        "position.z": cams.position[:, 2],
+        "target.x": cams.target[:, 0],
+        "target.y": cams.target[:, 1],
+        "target.z": cams.target[:, 2],
+        "roll_deg": quat_view_roll_deg_batch(cams.rotation),
+        "focal_length_mm": cams.focal_length_mm,
+        "focus_distance_m": cams.focus_distance_m,
+        "aperture_f": cams.aperture_f,
     }
 
-    for s in states:
-        rx, ry, rz = quat_to_euler_xyz_deg(s.rotation)
-        series["position.x"].append((s.frame, s.position[0]))
-        series["position.y"].append((s.frame, s.position[1]))
-        series["position.z"].append((s.frame, s.position[2]))
-        if s.target is not None:
-            series["target.x"].append((s.frame, s.target[0]))
-            series["target.y"].append((s.frame, s.target[1]))
-            series["target.z"].append((s.frame, s.target[2]))
+    def keys(values, epsilon):
+        values = np.asarray(values, dtype=np.float64)
+        reduce = reduce_keys and epsilon is not None and float(epsilon) > 0 and len(values) > 2
+        if reduce and key_mode == "bezier":
+            return _bezier_key_dicts(frames, values, float(epsilon))
+        if reduce:
+            idx = rdp_indices(frames, values, float(epsilon))
         else:
-            series["target.x"].append((s.frame, 0.0))
-            series["target.y"].append((s.frame, 0.0))
-            series["target.z"].append((s.frame, 0.0))
-        series["roll_deg"].append((s.frame, float(rx)))
-        series["focal_length_mm"].append((s.frame, float(getattr(s, "focal_length_mm", 35.0))))
-        series["focus_distance_m"].append((s.frame, float(getattr(s, "focus_distance_m", 2.8))))
-        series["aperture_f"].append((s.frame, float(getattr(s, "aperture_f", 2.8))))
-
-    def _perp_distance_point_to_line_2d(px, py, ax, ay, bx, by):
-        dx = bx - ax
-        dy = by - ay
-        if abs(dx) < 1e-12 and abs(dy) < 1e-12:
-            return math.hypot(px - ax, py - ay)
-        return abs(dy*px - dx*py + bx*ay - by*ax) / math.hypot(dx, dy)
-
-    def _douglas_peucker(points, epsilon):
-        if len(points) <= 2:
-            return points[:]
-        a = points[0]
-        b = points[-1]
-        ax, ay = a[0], a[1]
-        bx, by = b[0], b[1]
-        max_d = -1.0
-        idx = -1
-        for i in range(1, len(points) - 1):
-            px, py = points[i][0], points[i][1]
-            d = _perp_distance_point_to_line_2d(px, py, ax, ay, bx, by)
-            if d > max_d:
-                max_d = d
-                idx = i
-        if max_d <= epsilon or idx < 0:
-            return [a, b]
-        left = _douglas_peucker(points[: idx + 1], epsilon)
-        right = _douglas_peucker(points[idx:], epsilon)
-        return left[:-1] + right
-
-    def _reduce_series(points, epsilon):
-        if not reduce_keys or epsilon is None or float(epsilon) <= 0 or len(points) <= 2:
-            return points[:]
-        return _douglas_peucker(points, float(epsilon))
-
-    def keys(points, epsilon):
-        pts = [(int(t), float(v)) for t, v in points]
-        pts = _reduce_series(pts, epsilon)
-        return [{"t": int(t), "v": float(v), "interp": "linear"} for t, v in pts]
+            idx = np.arange(len(values))
+        return [{"t": int(t), "v": float(v), "interp": "linear"} for t, v in zip(frames[idx].tolist(), values[idx].tolist())]
 
     # channel-specific tolerances
     eps_pos = float(max_error)
     eps_roll = float(max_error) * 1.0
     eps_focal = float(max_error) * 1.0
 
+    if reduce_mode == "joint":
+        return _bake_joint(frames, series, reduce_keys and max_error > 0, eps_pos, eps_roll, eps_focal, max_angle_deg)
+
     out = {
         "camera.transform": {
             "position.x": keys(series["position.x"], eps_pos),
@@ -303,3 +403,201 @@ def bake_camera_tracks(project: Project, start: int, end: int, reduce_keys: bool
         },
     }
     return out
+
+
+_TRACK_CHANNELS = {
+    "camera.transform": ("position.x", "position.y", "position.z", "target.x", "target.y", "target.z", "roll_deg"),
+    "camera.lens": ("focal_length_mm", "focus_distance_m", "aperture_f"),
+}
+
+
+def _bake_joint(
+    frames: np.ndarray,
+    series: Dict[str, np.ndarray],
+    reduce: bool,
+    eps_pos: float,
+    eps_roll: float,
+    eps_focal: float,
+    max_angle_deg: Optional[float],
+) -> Dict[str, Any]:
+    """Linear keys on one shared set of frames per track (see `bake_camera_tracks`).
+
+    Each channel keeps the shared frames it needs to stay within the joint bound.
+    """
+    out: Dict[str, Any] = {}
+    for track, names in _TRACK_CHANNELS.items():
+        values = np.stack([np.asarray(series[name], dtype=np.float64) for name in names], axis=1)
+        if not reduce or len(values) <= 2:
+            keys = [np.arange(len(values))] * len(names)
+        else:
+            if track == "camera.transform":
+                if max_angle_deg:
+                    eps_angle = np.full(len(values), float(max_angle_deg))
+                else:
+                    # The angle a target offset of eps_pos subtends, i.e. what per-channel reduction allows.
+                    view = values[:, 3:6] - values[:, 0:3]
+                    eps_angle = np.degrees(np.arctan2(eps_pos, np.sqrt(np.einsum("ij,ij->i", view, view))))
+                error = _view_error(values[:, 0:3], values[:, 3:6], values[:, 6], eps_pos, eps_angle, eps_roll)
+            else:
+                error = _value_error(values, np.full(len(names), eps_focal))
+            keys = joint_column_keys(frames, values, error, rdp_joint(frames, values, error).indices)
+        out[track] = {
+            name: [{"t": int(f), "v": float(v), "interp": "linear"} for f, v in zip(frames[k].tolist(), values[k, c].tolist())]
+            for c, (name, k) in enumerate(zip(names, keys))
+        }
+    return out
+
+
+_BAKE_DEFAULTS = {
+    "position.x": POSITION_DEFAULT[0],
+    "position.y": POSITION_DEFAULT[1],
+    "position.z": POSITION_DEFAULT[2],
+    "target.x": TARGET_DEFAULT[0],
+    "target.y": TARGET_DEFAULT[1],
+    "target.z": TARGET_DEFAULT[2],
+    "roll_deg": 0.0,
+    "focal_length_mm": 35.0,
+    "focus_distance_m": 2.8,
+    "aperture_f": 2.8,
+}
+
+
+def _constant_channel(v: float) -> CompiledChannel:
+    return compile_keyframes([Keyframe(t=0, v=float(v), interp="linear")])
+
+
+def _adaptive_sources(rig: CameraRig) -> Optional[Dict[str, CompiledChannel]]:
+    """The curve each baked channel follows exactly, or None when the stack reshapes any of them.
+
+    Only LookAtObject is understood (it pins the target to a null); any other stack entry means
+    dense sampling. Roll is baked from the rotation and follows the roll channel where the view
+    has a horizon; `_roll_guard` checks that.
+    """
+    src = {name: rig.channels.get(name) or _constant_channel(v) for name, v in _BAKE_DEFAULTS.items()}
+    for entry, params in rig.stack:
+        if entry.name != "lookatobject":
+            return None
+        p = rig.nulls.get(str(params.get("null_id", "")))
+        if p is not None:
+            for axis, v in zip("xyz", p):
+                src[f"target.{axis}"] = _constant_channel(v)
+    return src
+
+
+def _value_range(ch: CompiledChannel, a: np.ndarray, b: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    # Bounds of the channel over [a, b] (no key strictly inside): the chord's ends widened by the deviation.
+    dev, _ = ch.chord_deviation(a, b)
+    va, vb = ch.eval_array(a), ch.eval_array(b)
+    return np.minimum(va, vb) - dev, np.maximum(va, vb) + dev
+
+
+def _horizon_ok(src: Dict[str, CompiledChannel], a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Intervals (no position/target/roll key inside) where the baked roll equals the roll channel.
+
+    The view must keep a horizon (it never points along world up, and the target never meets the
+    camera) and the roll must stay inside (-180, 180) so it does not wrap.
+    """
+    d_lo, d_hi = [], []
+    for axis in "xyz":
+        p_lo, p_hi = _value_range(src[f"position.{axis}"], a, b)
+        t_lo, t_hi = _value_range(src[f"target.{axis}"], a, b)
+        d_lo.append(t_lo - p_hi)
+        d_hi.append(t_hi - p_lo)
+    # Smallest possible horizontal (x, z) extent of the view vector vs its largest length.
+    gap = [np.maximum(0.0, np.maximum(d_lo[i], -d_hi[i])) for i in (0, 2)]
+    reach = np.sqrt(sum(np.maximum(np.abs(lo), np.abs(hi)) ** 2 for lo, hi in zip(d_lo, d_hi)))
+    view = np.hypot(gap[0], gap[1]) > 1e-6 * reach
+    r_lo, r_hi = _value_range(src["roll_deg"], a, b)
+    return view & (r_lo > -180.0) & (r_hi < 180.0)
+
+
+def _breakpoints(start: int, end: int, *channels: CompiledChannel) -> np.ndarray:
+    t = np.concatenate([ch.times for ch in channels])
+    return np.unique(np.concatenate([[start, end], t[(t > start) & (t < end)]]))
+
+
+def _unproven_stretches(check, bps: np.ndarray) -> List[Tuple[int, int]]:
+    """Stretches of at most ADAPTIVE_DENSE_SPAN frames where ``check(a, b)`` fails, by bisection."""
+    out: List[Tuple[int, int]] = []
+    a, b = bps[:-1], bps[1:]
+    while len(a):
+        bad = ~check(a, b)
+        small = bad & (b - a <= ADAPTIVE_DENSE_SPAN)
+        out.extend(zip(a[small].astype(int).tolist(), b[small].astype(int).tolist()))
+        a, b = a[bad & ~small], b[bad & ~small]
+        mid = np.floor((a + b) * 0.5)
+        a, b = np.concatenate([a, mid]), np.concatenate([mid, b])
+    return out
+
+
+def _adaptive_frames(
+    ch: CompiledChannel, start: int, end: int, eps: float, dense: Sequence[Tuple[int, int]] = ()
+) -> Tuple[np.ndarray, List[Tuple[int, int]]]:
+    """Key frames whose chords keep ``ch`` within ``eps``, and the intervals to sample densely.
+
+    Intervals start at the channel's keys (and the ends of the given ``dense`` stretches) and are
+    split, level by level, at the frame of largest deviation until
+    `CompiledChannel.chord_deviation` certifies them. Intervals it cannot bound (eased segments)
+    join ``dense``.
+    """
+    edges = np.array([e for ab in dense for e in ab], dtype=np.float64)
+    bps = np.unique(np.concatenate([_breakpoints(start, end, ch), edges]))
+    keys = [bps]
+    out = list(dense)
+    a, b = bps[:-1], bps[1:]
+    if dense:
+        # Intervals inside a dense stretch need no certificate.
+        d = np.array(sorted(dense), dtype=np.float64)
+        k = np.clip(np.searchsorted(d[:, 0], a, side="right") - 1, 0, len(d) - 1)
+        free = ~((d[k, 0] <= a) & (b <= d[k, 1]))
+        a, b = a[free], b[free]
+    tol = eps * (1.0 - ADAPTIVE_SLACK)
+    while len(a):
+        dev, where = ch.chord_deviation(a, b)
+        bounded = np.isfinite(dev)
+        out.extend(zip(a[~bounded].astype(int).tolist(), b[~bounded].astype(int).tolist()))
+        split = bounded & (dev > tol) & (b - a > 1)
+        a, b = a[split], b[split]
+        mid = np.clip(np.round(where[split]), a + 1, b - 1)
+        keys.append(mid)
+        a, b = np.concatenate([a, mid]), np.concatenate([mid, b])
+    return np.unique(np.concatenate(keys)).astype(np.int64), out
+
+
+def _bake_adaptive(rig: CameraRig, src: Dict[str, CompiledChannel], start: int, end: int, max_error: float) -> Dict[str, Any]:
+    """`bake_camera_tracks` with adaptive sampling: evaluates key frames (plus dense stretches) only."""
+    view = [src[f"{p}.{axis}"] for p in ("position", "target") for axis in "xyz"] + [src["roll_deg"]]
+    unproven = _unproven_stretches(lambda a, b: _horizon_ok(src, a, b), _breakpoints(start, end, *view))
+    plans = {
+        name: _adaptive_frames(ch, start, end, max_error, unproven if name == "roll_deg" else ())
+        for name, ch in src.items()
+    }
+
+    frames = [keys for keys, _ in plans.values()]
+    frames += [np.arange(a, b + 1) for _, dense in plans.values() for a, b in dense]
+    frames = np.unique(np.concatenate(frames))
+    cams = rig.eval_frames(frames)
+    series = {
+        "position.x": cams.position[:, 0],
+        "position.y": cams.position[:, 1],
+        "position.z": cams.position[:, 2],
+        "target.x": cams.target[:, 0],
+        "target.y": cams.target[:, 1],
+        "target.z": cams.target[:, 2],
+        "roll_deg": quat_view_roll_deg_batch(cams.rotation),
+        "focal_length_mm": cams.focal_length_mm,
+        "focus_distance_m": cams.focus_distance_m,
+        "aperture_f": cams.aperture_f,
+    }
+
+    def keys(name: str) -> List[Dict[str, Any]]:
+        kept, dense = plans[name]
+        values = series[name]
+        picked = [kept]
+        for a, b in dense:
+            lo, hi = np.searchsorted(frames, [a, b + 1])
+            picked.append(frames[lo:hi][rdp_indices(frames[lo:hi], values[lo:hi], max_error, "vertical")])
+        idx = np.searchsorted(frames, np.unique(np.concatenate(picked)))
+        return [{"t": int(t), "v": float(v), "interp": "linear"} for t, v in zip(frames[idx].tolist(), values[idx].tolist())]
+
+    return {track: {name: keys(name) for name in names} for track, names in _TRACK_CHANNELS.items()}
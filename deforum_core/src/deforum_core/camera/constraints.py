@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, Optional, Tuple, Union
 import math
 
-from deforum_core.camera.spline import sample_catmull_rom
+import numpy as np
+
+from deforum_core.camera.splines import CompiledSpline, arc_length_table, compiled_spline
 from deforum_core.schema.models import Project
 
 Vec3 = Tuple[float, float, float]
@@ -11,33 +13,71 @@ Vec3 = Tuple[float, float, float]
 
 def _get_objects(project: Project) -> Dict[str, Any]:
     tl = project.timeline
-    return tl.get("objects", {}) or {}
+    if tl is None:
+        return {}
+    objects = tl.get("objects") if isinstance(tl, dict) else getattr(tl, "objects", None)
+    if objects is None:
+        return {}
+    if hasattr(objects, "model_dump"):
+        return objects.model_dump()
+    return dict(objects)
 
 
-def rail_position(project: Project, u: float, params: Dict[str, Any]) -> Optional[Vec3]:
-    spline_id = str(params.get("spline_id", ""))
-    if not spline_id:
-        return None
+def resolve_objects(project: Project) -> Tuple[Dict[str, Vec3], Dict[str, Dict[str, Any]]]:
+    """Nulls (id -> position) and splines (id -> raw spline dict) referenced by constraints."""
     objects = _get_objects(project)
-    splines = objects.get("splines", {}) or {}
-    sp = splines.get(spline_id)
+    nulls: Dict[str, Vec3] = {}
+    for null_id, n in (objects.get("nulls", {}) or {}).items():
+        p = _null_position(n)
+        if p is not None:
+            nulls[str(null_id)] = p
+    splines = {str(k): dict(v) for k, v in (objects.get("splines", {}) or {}).items() if v}
+    return nulls, splines
+
+
+def offset_from_params(params: Dict[str, Any]) -> Vec3:
+    off = params.get("offset", [0.0, 0.0, 0.0])
+    try:
+        return (float(off[0]), float(off[1]), float(off[2]))
+    except Exception:
+        return (0.0, 0.0, 0.0)
+
+
+def spline_rail_positions(
+    sp: Union[CompiledSpline, Dict[str, Any], None], u, params: Dict[str, Any], spline_id: Optional[str] = None
+) -> Optional[np.ndarray]:
+    """Rail positions (N, 3) for an array of ``u`` on a compiled or already-resolved spline.
+
+    ``u`` is segment-uniform unless ``params["arc_length"]`` is set, in which case it is the
+    fraction of the path length (constant speed for linear ``u`` keys). A spline dict goes through
+    the content-hashed `SPLINE_CACHE` on every call; `CameraRig` passes compiled splines.
+    """
     if not sp:
         return None
+    cs = sp if isinstance(sp, CompiledSpline) else compiled_spline(sp, spline_id)
+    if cs is None:
+        return None
+    u = np.clip(np.asarray(u, dtype=np.float64), 0.0, 1.0)
+    if params.get("arc_length"):
+        u = (cs.arc_length if isinstance(sp, CompiledSpline) else arc_length_table(sp)).param(u)
+    return cs.sample(u) + np.asarray(offset_from_params(params), dtype=np.float64)
+
 
-    pts = sp.get("points", [])
-    closed = bool(sp.get("closed", False))
-    if not isinstance(pts, list) or len(pts) < 2:
+def spline_rail_position(sp: Optional[Dict[str, Any]], u: float, params: Dict[str, Any]) -> Optional[Vec3]:
+    """`rail_position` on an already-resolved spline dict (see `spline_rail_positions`)."""
+    p = spline_rail_positions(sp, float(u), params)
+    if p is None:
         return None
+    return (float(p[0]), float(p[1]), float(p[2]))
 
-    u = max(0.0, min(1.0, float(u)))
-    p = sample_catmull_rom([tuple(map(float, p)) for p in pts], u01=u, closed=closed)
 
-    off = params.get("offset", [0.0, 0.0, 0.0])
-    try:
-        ox, oy, oz = float(off[0]), float(off[1]), float(off[2])
-    except Exception:
-        ox, oy, oz = 0.0, 0.0, 0.0
-    return (p[0] + ox, p[1] + oy, p[2] + oz)
+def rail_position(project: Project, u: float, params: Dict[str, Any]) -> Optional[Vec3]:
+    spline_id = str(params.get("spline_id", ""))
+    if not spline_id:
+        return None
+    objects = _get_objects(project)
+    splines = objects.get("splines", {}) or {}
+    return spline_rail_position(splines.get(spline_id), u, params)
 
 
 def orbit_position(
@@ -57,16 +97,38 @@ def orbit_position(
     return (base_target[0] + x + offset[0], base_target[1] + y + offset[1], base_target[2] + z + offset[2])
 
 
-def lookup_null(project: Project, null_id: str) -> Optional[Vec3]:
-    objects = _get_objects(project)
-    nulls = objects.get("nulls", {}) or {}
-    n = nulls.get(null_id)
+def orbit_position_array(
+    base_target: np.ndarray,
+    radius: np.ndarray,
+    azimuth_deg: np.ndarray,
+    elevation_deg: np.ndarray,
+    offset: Vec3 = (0.0, 0.0, 0.0),
+) -> np.ndarray:
+    """`orbit_position` over (N, 3) targets and (N,) orbit channels."""
+    r = np.maximum(1e-6, radius)
+    az = np.radians(azimuth_deg)
+    el = np.radians(elevation_deg)
+    rel = np.stack([
+        r * np.cos(el) * np.sin(az),
+        r * np.sin(el),
+        r * np.cos(el) * np.cos(az),
+    ], axis=1)
+    return base_target + rel + np.asarray(offset, dtype=np.float64)
+
+
+def _null_position(n: Any) -> Optional[Vec3]:
     if not n:
         return None
     pos = n.get("position", None)
-    if not pos or not isinstance(pos, list) or len(pos) != 3:
+    if not pos or not isinstance(pos, (list, tuple)) or len(pos) != 3:
         return None
     try:
         return (float(pos[0]), float(pos[1]), float(pos[2]))
     except Exception:
         return None
+
+
+def lookup_null(project: Project, null_id: str) -> Optional[Vec3]:
+    objects = _get_objects(project)
+    nulls = objects.get("nulls", {}) or {}
+    return _null_position(nulls.get(null_id))
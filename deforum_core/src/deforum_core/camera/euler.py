@@ -2,7 +2,10 @@ from __future__ import annotations
 
 import math
 from typing import Tuple
-from deforum_core.camera.math3d import Quaternion
+
+import numpy as np
+
+from deforum_core.camera.math3d import Quaternion, lock_roll_quat_batch
 
 def quat_to_euler_xyz_deg(q: Quaternion) -> Tuple[float, float, float]:
     # Returns (x,y,z) in degrees, XYZ intrinsic (approx; good for export schedules)
@@ -47,10 +50,57 @@ def euler_xyz_deg_to_quat(x_deg: float, y_deg: float, z_deg: float) -> Quaternio
 
 
 def lock_roll(q: Quaternion) -> Quaternion:
-    rx, ry, rz = quat_to_euler_xyz_deg(q)
-    return euler_xyz_deg_to_quat(0.0, ry, rz)
+    # Horizon lock as a twist about the view axis (no Euler round-trip, stable near +-90 pitch).
+    w, x, y, z = lock_roll_quat_batch(np.array([q.w, q.x, q.y, q.z])).tolist()
+    return Quaternion(w, x, y, z)
 
 
 def focal_mm_to_fov_deg(focal_mm: float, sensor_width_mm: float = 36.0) -> float:
     f = max(1e-6, float(focal_mm))
     return math.degrees(2.0 * math.atan(sensor_width_mm / (2.0 * f)))
+
+
+def quat_to_euler_xyz_deg_batch(q: np.ndarray) -> np.ndarray:
+    """`quat_to_euler_xyz_deg` over (N, 4) rows of (w, x, y, z); returns (N, 3) degrees."""
+    q = np.asarray(q, dtype=np.float64).reshape(-1, 4)
+    w, x, y, z = q[:, 0], q[:, 1], q[:, 2], q[:, 3]
+
+    roll_x = np.arctan2(2 * (w * x + y * z), 1 - 2 * (x * x + y * y))
+    sinp = 2 * (w * y - z * x)
+    pitch_y = np.where(np.abs(sinp) >= 1, np.copysign(np.pi / 2, sinp), np.arcsin(np.clip(sinp, -1.0, 1.0)))
+    yaw_z = np.arctan2(2 * (w * z + x * y), 1 - 2 * (y * y + z * z))
+
+    return np.degrees(np.stack([roll_x, pitch_y, yaw_z], axis=1))
+
+
+def euler_xyz_deg_to_quat_batch(e: np.ndarray) -> np.ndarray:
+    """`euler_xyz_deg_to_quat` over (N, 3) degrees; returns (N, 4) rows of (w, x, y, z)."""
+    h = np.radians(np.asarray(e, dtype=np.float64).reshape(-1, 3)) * 0.5
+    cx, cy, cz = np.cos(h[:, 0]), np.cos(h[:, 1]), np.cos(h[:, 2])
+    sx, sy, sz = np.sin(h[:, 0]), np.sin(h[:, 1]), np.sin(h[:, 2])
+    return np.stack([
+        cx*cy*cz - sx*sy*sz,
+        sx*cy*cz + cx*sy*sz,
+        cx*sy*cz - sx*cy*sz,
+        cx*cy*sz + sx*sy*cz,
+    ], axis=1)
+
+
+def schedule_euler_deg_to_quat_batch(e: np.ndarray) -> np.ndarray:
+    """Exact inverse of `quat_to_euler_xyz_deg_batch` (the angles export schedules carry).
+
+    Those angles compose as yaw(z) * pitch(y) * roll(x), unlike `euler_xyz_deg_to_quat`.
+    """
+    h = np.radians(np.asarray(e, dtype=np.float64).reshape(-1, 3)) * 0.5
+    cr, cp, cy = np.cos(h[:, 0]), np.cos(h[:, 1]), np.cos(h[:, 2])
+    sr, sp, sy = np.sin(h[:, 0]), np.sin(h[:, 1]), np.sin(h[:, 2])
+    return np.stack([
+        cr*cp*cy + sr*sp*sy,
+        sr*cp*cy - cr*sp*sy,
+        cr*sp*cy + sr*cp*sy,
+        cr*cp*sy - sr*sp*cy,
+    ], axis=1)
+
+
+def lock_roll_batch(q: np.ndarray) -> np.ndarray:
+    return lock_roll_quat_batch(np.asarray(q, dtype=np.float64).reshape(-1, 4))
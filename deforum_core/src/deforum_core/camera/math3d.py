@@ -67,3 +67,120 @@ def look_at_rotation(eye: np.ndarray, target: np.ndarray, up: np.ndarray | None
     # Column-major basis: right, up, forward
     m = np.stack([right, true_up, forward], axis=1)
     return quat_from_matrix(m)
+
+
+def norm_rows(a: np.ndarray) -> np.ndarray:
+    """Row-wise `norm` for (N, 3) arrays; near-zero rows are returned unchanged."""
+    n = np.sqrt(np.einsum("ij,ij->i", a, a))
+    safe = n > 1e-12
+    return np.where(safe[:, None], a / np.where(safe, n, 1.0)[:, None], a)
+
+
+def quat_from_matrix_batch(m: np.ndarray) -> np.ndarray:
+    """`quat_from_matrix` over (N, 3, 3) matrices; returns (N, 4) rows of (w, x, y, z)."""
+    m00, m01, m02 = m[:, 0, 0], m[:, 0, 1], m[:, 0, 2]
+    m10, m11, m12 = m[:, 1, 0], m[:, 1, 1], m[:, 1, 2]
+    m20, m21, m22 = m[:, 2, 0], m[:, 2, 1], m[:, 2, 2]
+    t = m00 + m11 + m22
+
+    # Same branch order as the scalar version: trace, then largest diagonal element.
+    b0 = t > 0.0
+    b1 = ~b0 & (m00 > m11) & (m00 > m22)
+    b2 = ~b0 & ~b1 & (m11 > m22)
+    b3 = ~b0 & ~b1 & ~b2
+
+    with np.errstate(invalid="ignore", divide="ignore"):
+        s0 = np.sqrt(t + 1.0) * 2.0
+        s1 = np.sqrt(1.0 + m00 - m11 - m22) * 2.0
+        s2 = np.sqrt(1.0 + m11 - m00 - m22) * 2.0
+        s3 = np.sqrt(1.0 + m22 - m00 - m11) * 2.0
+        q0 = np.stack([0.25 * s0, (m21 - m12) / s0, (m02 - m20) / s0, (m10 - m01) / s0], axis=1)
+        q1 = np.stack([(m21 - m12) / s1, 0.25 * s1, (m01 + m10) / s1, (m02 + m20) / s1], axis=1)
+        q2 = np.stack([(m02 - m20) / s2, (m01 + m10) / s2, 0.25 * s2, (m12 + m21) / s2], axis=1)
+        q3 = np.stack([(m10 - m01) / s3, (m02 + m20) / s3, (m12 + m21) / s3, 0.25 * s3], axis=1)
+
+    return np.select([b0[:, None], b1[:, None], b2[:, None], b3[:, None]], [q0, q1, q2, q3])
+
+
+def look_at_rotation_batch(eye: np.ndarray, target: np.ndarray, up: np.ndarray | None = None) -> np.ndarray:
+    """`look_at_rotation` over (N, 3) eye/target arrays; returns (N, 4) quaternions (w, x, y, z)."""
+    eye = np.asarray(eye, dtype=np.float64).reshape(-1, 3)
+    target = np.asarray(target, dtype=np.float64).reshape(-1, 3)
+    if up is None:
+        up = v3(0.0, 1.0, 0.0)
+    up = np.broadcast_to(np.asarray(up, dtype=np.float64), eye.shape)
+    forward = norm_rows(target - eye)
+    right = norm_rows(np.cross(up, forward))
+    true_up = norm_rows(np.cross(forward, right))
+    # Column-major basis: right, up, forward
+    m = np.stack([right, true_up, forward], axis=2)
+    return quat_from_matrix_batch(m)
+
+
+def quat_rows(qs: np.ndarray) -> list:
+    """(N, 4) array -> list of `Quaternion`."""
+    return [Quaternion(w, x, y, z) for w, x, y, z in np.asarray(qs).tolist()]
+
+
+# Quaternion helpers. Rotations map camera-local axes to world: x = right, y = up, z = forward.
+
+def quat_mul_batch(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Hamilton product of (N, 4) quaternion rows (w, x, y, z)."""
+    aw, ax, ay, az = a[..., 0], a[..., 1], a[..., 2], a[..., 3]
+    bw, bx, by, bz = b[..., 0], b[..., 1], b[..., 2], b[..., 3]
+    return np.stack([
+        aw * bw - ax * bx - ay * by - az * bz,
+        aw * bx + ax * bw + ay * bz - az * by,
+        aw * by - ax * bz + ay * bw + az * bx,
+        aw * bz + ax * by - ay * bx + az * bw,
+    ], axis=-1)
+
+
+def quat_forward_batch(q: np.ndarray) -> np.ndarray:
+    """View direction (local +z in world space) for (N, 4) quaternions."""
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return np.stack([2 * (x * z + w * y), 2 * (y * z - w * x), 1 - 2 * (x * x + y * y)], axis=-1)
+
+
+def quat_up_batch(q: np.ndarray) -> np.ndarray:
+    """Camera up (local +y in world space) for (N, 4) quaternions."""
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    return np.stack([2 * (x * y - w * z), 1 - 2 * (x * x + z * z), 2 * (y * z + w * x)], axis=-1)
+
+
+def quat_roll_batch(q: np.ndarray, roll_deg) -> np.ndarray:
+    """Twist (N, 4) quaternions by ``roll_deg`` about their own view axis (right-handed)."""
+    half = np.radians(np.asarray(roll_deg, dtype=np.float64)) * 0.5
+    half = np.broadcast_to(half, q.shape[:-1])
+    zero = np.zeros_like(half)
+    twist = np.stack([np.cos(half), zero, zero, np.sin(half)], axis=-1)
+    return quat_mul_batch(q, twist)
+
+
+def quat_view_roll_deg_batch(q: np.ndarray, up: np.ndarray | None = None) -> np.ndarray:
+    """Signed roll of each camera about its view axis, relative to the horizon-level pose.
+
+    Level means the camera up lies in the plane of the view axis and world ``up``. Views parallel
+    to ``up`` have no defined horizon and report 0.
+    """
+    if up is None:
+        up = v3(0.0, 1.0, 0.0)
+    f = quat_forward_batch(q)
+    u = quat_up_batch(q)
+    level = up - (f @ up)[..., None] * f
+    ln = np.sqrt(np.einsum("...i,...i->...", level, level))
+    ok = ln > 1e-9
+    level = level / np.where(ok, ln, 1.0)[..., None]
+    sin_r = np.einsum("...i,...i->...", np.cross(level, u), f)
+    cos_r = np.einsum("...i,...i->...", level, u)
+    return np.where(ok, np.degrees(np.arctan2(sin_r, cos_r)), 0.0)
+
+
+def lock_roll_quat_batch(q: np.ndarray, up: np.ndarray | None = None) -> np.ndarray:
+    """Horizon lock: remove each camera's roll about its view axis, keeping yaw and pitch."""
+    return quat_roll_batch(q, -quat_view_roll_deg_batch(q, up))
+
+
+def quat_roll(q: Quaternion, roll_deg: float) -> Quaternion:
+    w, x, y, z = quat_roll_batch(np.array([q.w, q.x, q.y, q.z]), float(roll_deg)).tolist()
+    return Quaternion(w, x, y, z)
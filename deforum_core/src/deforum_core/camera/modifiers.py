@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 import math
 import random
 
+import numpy as np
+
 Vec3 = Tuple[float, float, float]
 
 
@@ -42,14 +44,32 @@ def aim_spring_apply(
     """
     if not targets:
         return []
-    if dt <= 0:
-        return targets
+    state = SpringState(x=targets[0] if x0 is None else x0, v=(0.0, 0.0, 0.0))
+    out, _ = aim_spring_step(targets, dt, stiffness=stiffness, damping=damping, state=state)
+    return out
+
+
+def aim_spring_step(
+    targets: List[Vec3],
+    dt: float,
+    stiffness: float = 18.0,
+    damping: float = 6.0,
+    state: Optional[SpringState] = None,
+) -> Tuple[List[Vec3], Optional[SpringState]]:
+    """`aim_spring_apply` resumable from `state`; returns the outputs and the state after the last frame.
+
+    A ``None`` state starts at rest on the first target, like `aim_spring_apply`.
+    """
+    if not targets or dt <= 0:
+        return list(targets), state
 
     w = float(stiffness)
     z = float(damping)
 
-    x = targets[0] if x0 is None else x0
-    v: Vec3 = (0.0, 0.0, 0.0)
+    if state is None:
+        state = SpringState(x=targets[0], v=(0.0, 0.0, 0.0))
+    x = state.x
+    v = state.v
 
     out: List[Vec3] = []
     for tgt in targets:
@@ -58,7 +78,163 @@ def aim_spring_apply(
         v = vadd(v, vmul(a, dt))
         x = vadd(x, vmul(v, dt))
         out.append(x)
-    return out
+    return out, SpringState(x=x, v=v)
+
+
+# AimSpring integrators. "euler" is the semi-implicit Euler recurrence of `aim_spring_apply` (the
+# default, so old projects keep their motion); "exact" is the exact discretization of the spring
+# with the target held over each frame, stable for any stiffness/fps.
+AIM_SPRING_INTEGRATORS = ("euler", "exact")
+
+# The batched spring works in blocks of SPRING_BLOCK frames counted from where the spring started,
+# so every frame is computed by the same operations however the range is chunked.
+SPRING_BLOCK = 128
+
+
+def aim_spring_transition(
+    dt: float, stiffness: float = 18.0, damping: float = 6.0, integrator: str = "euler"
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Per-axis discrete spring: ``[x, v]_{k+1} = phi @ [x, v]_k + gamma * target_k``.
+
+    For "exact", ``phi = expm(A * dt)`` with ``A = [[0, 1], [-w^2, -2 z w]]`` in closed form; the
+    overdamped branch combines the exponentials so large ``w * dt`` neither overflows nor loses
+    stability. ``gamma = (I - phi) @ [1, 0]`` keeps a held target a fixed point.
+    """
+    w = float(stiffness)
+    z = float(damping)
+    dt = float(dt)
+    if integrator == "euler":
+        k = w * w * dt
+        c = 1.0 - 2.0 * z * w * dt
+        phi = np.array([[1.0 - k * dt, dt * c], [-k, c]])
+    elif integrator == "exact":
+        mu = -z * w
+        disc = mu * mu - w * w
+        if disc < 0.0:
+            om = math.sqrt(-disc)
+            e = math.exp(mu * dt)
+            ch = e * math.cos(om * dt)
+            sh = e * math.sin(om * dt) / om
+        else:
+            sq = math.sqrt(disc)
+            if sq * dt < 1.0:
+                e = math.exp(mu * dt)
+                ch = e * math.cosh(sq * dt)
+                sh = e * (math.sinh(sq * dt) / sq if sq > 0.0 else dt)
+            else:
+                ep = math.exp((mu + sq) * dt)
+                em = math.exp((mu - sq) * dt)
+                ch = 0.5 * (ep + em)
+                sh = 0.5 * (ep - em) / sq
+        phi = np.array([[ch - mu * sh, sh], [-w * w * sh, ch + mu * sh]])
+    else:
+        raise ValueError(f"Unknown AimSpring integrator {integrator!r}; expected one of {AIM_SPRING_INTEGRATORS}")
+    return phi, np.array([1.0 - phi[0, 0], -phi[1, 0]])
+
+
+@dataclass
+class AimSpringScanState:
+    """Batched spring state: ``s`` = (2, 3) position/velocity rows at absolute `frame`, the start
+    of the current block, plus the block's targets already consumed (``pending``)."""
+
+    frame: int
+    s: np.ndarray
+    pending: np.ndarray
+
+
+def _block_scan(phi: np.ndarray, bx: np.ndarray, bv: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Zero-start responses ``u_k = sum_{j<=k} phi^(k-j) b_j`` along axis 1 of (blocks, L, 3) inputs.
+
+    Hillis-Steele passes written elementwise, so row k never depends on L or array layout.
+    """
+    x = bx.copy()
+    v = bv.copy()
+    p = phi.copy()
+    d = 1
+    while d < x.shape[1]:
+        x0 = x[:, :-d]
+        v0 = v[:, :-d]
+        tx = p[0, 0] * x0 + p[0, 1] * v0
+        tv = p[1, 0] * x0 + p[1, 1] * v0
+        x[:, d:] += tx
+        v[:, d:] += tv
+        p = p @ p
+        d *= 2
+    return x, v
+
+
+def aim_spring_scan(
+    frames: np.ndarray,
+    targets: np.ndarray,
+    dt: float,
+    stiffness: float = 18.0,
+    damping: float = 6.0,
+    integrator: str = "euler",
+    state: Optional[AimSpringScanState] = None,
+    block: int = SPRING_BLOCK,
+) -> Tuple[np.ndarray, Optional[AimSpringScanState]]:
+    """AimSpring over (N, 3) `targets` at consecutive absolute `frames`, as a vectorized recurrence.
+
+    Blocks are scanned from a zero start all at once, block start states are chained with
+    ``phi^block``, and each frame adds ``phi^(m+1)`` times its block's start state. A ``None``
+    state starts at rest on the first target, like `aim_spring_apply`; pass the returned state
+    to continue with the following frames.
+    """
+    tg = np.asarray(targets, dtype=np.float64).reshape(-1, 3)
+    if len(tg) == 0 or dt <= 0:
+        return tg.copy(), state
+    frames = np.asarray(frames, dtype=np.int64).reshape(-1)
+    phi, gamma = aim_spring_transition(dt, stiffness=stiffness, damping=damping, integrator=integrator)
+
+    if state is None:
+        state = AimSpringScanState(frame=int(frames[0]), s=np.stack([tg[0], np.zeros(3)]), pending=np.zeros((0, 3)))
+    skip = len(state.pending)
+    if int(frames[0]) != state.frame + skip:
+        raise ValueError(f"AimSpring state is at frame {state.frame + skip}, got frames from {int(frames[0])}")
+    tg = np.concatenate([state.pending, tg])
+
+    n = len(tg)
+    nb = -(-n // block)
+    padded = np.zeros((nb * block, 3))
+    padded[:n] = tg
+    padded = padded.reshape(nb, block, 3)
+    lx, lv = _block_scan(phi, gamma[0] * padded, gamma[1] * padded)
+
+    powers = np.empty((block, 2, 2))
+    powers[0] = phi
+    for m in range(1, block):
+        powers[m] = phi @ powers[m - 1]
+    pb = powers[-1]
+
+    sx = np.empty((nb, 3))
+    sv = np.empty((nb, 3))
+    cx, cv = state.s[0], state.s[1]
+    for i in range(nb):
+        sx[i] = cx
+        sv[i] = cv
+        cx, cv = pb[0, 0] * cx + pb[0, 1] * cv + lx[i, -1], pb[1, 0] * cx + pb[1, 1] * cv + lv[i, -1]
+
+    out = lx + powers[None, :, 0, 0, None] * sx[:, None] + powers[None, :, 0, 1, None] * sv[:, None]
+    out = out.reshape(-1, 3)[skip:n]
+    full = n // block
+    if full == nb:
+        return out, AimSpringScanState(frame=state.frame + n, s=np.stack([cx, cv]), pending=np.zeros((0, 3)))
+    # Partial last block: keep its start state and targets so the next call recomputes it.
+    return out, AimSpringScanState(
+        frame=state.frame + full * block, s=np.stack([sx[-1], sv[-1]]), pending=tg[full * block:].copy()
+    )
+
+
+@dataclass
+class NoiseShakeState:
+    rng: random.Random
+    phase: float = 0.0
+    lp: Vec3 = (0.0, 0.0, 0.0)
+    lt: Vec3 = (0.0, 0.0, 0.0)
+
+    @classmethod
+    def from_seed(cls, seed: int) -> "NoiseShakeState":
+        return cls(rng=random.Random(int(seed)))
 
 
 def noise_shake_apply(
@@ -77,16 +253,34 @@ def noise_shake_apply(
     """
     if not positions:
         return positions, targets
+    out_pos, out_tgt, _ = noise_shake_step(
+        positions, targets, NoiseShakeState.from_seed(seed), amp_pos=amp_pos, amp_tgt=amp_tgt, freq_hz=freq_hz, fps=fps
+    )
+    return out_pos, out_tgt
+
+
+def noise_shake_step(
+    positions: List[Vec3],
+    targets: List[Vec3],
+    state: NoiseShakeState,
+    amp_pos: float = 0.02,
+    amp_tgt: float = 0.01,
+    freq_hz: float = 6.0,
+    fps: int = 24,
+) -> Tuple[List[Vec3], List[Vec3], NoiseShakeState]:
+    """`noise_shake_apply` resumable from `state` (RNG, phase, low-pass values).
 
-    rnd = random.Random(int(seed))
+    The RNG in `state` is advanced in place; the returned state carries the new phase and filters.
+    """
+    rnd = state.rng
     out_pos: List[Vec3] = []
     out_tgt: List[Vec3] = []
 
-    phase = 0.0
+    phase = state.phase
     dphase = (2.0 * math.pi * float(freq_hz)) / float(max(1, fps))
 
-    lp = (0.0, 0.0, 0.0)
-    lt = (0.0, 0.0, 0.0)
+    lp = state.lp
+    lt = state.lt
 
     alpha = 0.25  # low-pass
     for i, (p, t) in enumerate(zip(positions, targets)):
@@ -107,7 +301,58 @@ def noise_shake_apply(
         out_pos.append((p[0] + lp[0] * blend, p[1] + lp[1] * blend, p[2] + lp[2] * blend))
         out_tgt.append((t[0] + lt[0] * blend, t[1] + lt[1] * blend, t[2] + lt[2] * blend))
 
-    return out_pos, out_tgt
+    return out_pos, out_tgt, NoiseShakeState(rng=rnd, phase=phase, lp=lp, lt=lt)
+
+
+# NoiseShake modes: "legacy" is the sequential RNG + low-pass filter above (the default, so old
+# projects render unchanged); "hash" is counter-based value noise, a pure function of
+# (seed, frame, axis) that any frame range can evaluate independently and in bulk.
+NOISE_SHAKE_MODES = ("legacy", "hash")
+
+def _splitmix64(x: np.ndarray) -> np.ndarray:
+    z = x + np.uint64(0x9E3779B97F4A7C15)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def hash_noise(seed: int, lattice: np.ndarray, axis: int) -> np.ndarray:
+    """Uniform values in [-1, 1) hashed from (seed, lattice index, axis); no hidden state."""
+    cell = np.asarray(lattice, dtype=np.int64).view(np.uint64)
+    key = _splitmix64(np.array([int(seed) & 0xFFFFFFFFFFFFFFFF], dtype=np.uint64) ^ np.uint64(int(axis)))
+    h = _splitmix64(cell ^ key)
+    return (h >> np.uint64(11)).astype(np.float64) * (2.0 ** -52) - 1.0
+
+
+def value_noise(seed: int, x: np.ndarray, axis: int) -> np.ndarray:
+    """Smooth 1D value noise: hashed lattice values at integers, quintic-faded in between (C2)."""
+    x = np.asarray(x, dtype=np.float64)
+    i0 = np.floor(x)
+    f = x - i0
+    i0 = i0.astype(np.int64)
+    fade = f * f * f * (f * (f * 6.0 - 15.0) + 10.0)
+    a = hash_noise(seed, i0, axis)
+    b = hash_noise(seed, i0 + 1, axis)
+    return a + (b - a) * fade
+
+
+def noise_shake_hash(
+    frames: np.ndarray,
+    seed: int,
+    amp_pos: float = 0.02,
+    amp_tgt: float = 0.01,
+    freq_hz: float = 6.0,
+    fps: int = 24,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Counter-based NoiseShake: (N, 3) position and target offsets for absolute `frames`.
+
+    Each axis is `value_noise` sampled at ``frame * freq_hz / fps`` lattice cells, so output
+    depends only on the frame number and is identical however a range is chunked.
+    """
+    x = np.asarray(frames, dtype=np.float64) * (float(freq_hz) / float(max(1, fps)))
+    pos = np.stack([value_noise(seed, x, axis) for axis in range(3)], axis=-1) * float(amp_pos)
+    tgt = np.stack([value_noise(seed, x, axis) for axis in range(3, 6)], axis=-1) * float(amp_tgt)
+    return pos, tgt
 
 
 def dolly_zoom_focal(
@@ -126,6 +371,21 @@ def dolly_zoom_focal(
     return max(float(min_focal_mm), min(float(max_focal_mm), f))
 
 
+def dolly_zoom_focal_array(
+    reference_focal_mm: float,
+    reference_distance_m: float,
+    distance_m: np.ndarray,
+    min_focal_mm: float = 12.0,
+    max_focal_mm: float = 200.0,
+) -> np.ndarray:
+    """`dolly_zoom_focal` over an array of distances."""
+    d = np.asarray(distance_m, dtype=np.float64)
+    if reference_distance_m <= 1e-6:
+        return np.full(d.shape, float(reference_focal_mm))
+    f = float(reference_focal_mm) * (d / float(reference_distance_m))
+    return np.minimum(float(max_focal_mm), np.maximum(float(min_focal_mm), f))
+
+
 from deforum_core.camera.euler import lock_roll
 from deforum_core.camera.math3d import look_at_rotation, v3
 
@@ -0,0 +1,118 @@
+"""Process-parallel camera range evaluation.
+
+Only frame-local stacks are sharded: the range is cut into chunks aligned to the rig's checkpoint
+interval and evaluated in a process pool whose workers rebuild the rig from the project once
+(pool initializer). The result is bit-identical to `CameraRig.eval_range`.
+
+Stateful stacks (AimSpring, NoiseShake in "legacy" mode) always evaluate serially in-process. Each
+chunk's starting state comes from a stack pass over every frame before it, and that pass is nearly
+all the cost of evaluating the chunk, so handing chunks to workers only adds pool overhead.
+
+Workers started with the "spawn" method re-import the package, so stack types registered at
+runtime by third-party code are only visible to them if registered on import.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+import os
+
+import numpy as np
+
+from deforum_core.camera.rig import CHECKPOINT_INTERVAL, RANGE_CHUNK, CameraBuffer, CameraRig
+from deforum_core.schema.models import Project
+
+# Chunks per worker when no chunk size is given, so uneven chunks still balance.
+TASKS_PER_WORKER = 4
+
+_worker_rig: Optional[CameraRig] = None
+
+
+def _init_worker(project_data: Dict[str, Any]) -> None:
+    global _worker_rig
+    _worker_rig = CameraRig.from_project(Project.model_validate(project_data))
+
+
+def _eval_chunk(lo: int, hi: int) -> np.ndarray:
+    assert _worker_rig is not None
+    return _worker_rig._eval_block(np.arange(lo, hi + 1), [None] * len(_worker_rig.stack)).data
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def chunk_bounds(start: int, end: int, workers: int, chunk: Optional[int] = None) -> List[Tuple[int, int]]:
+    """Inclusive (lo, hi) chunks covering start..end; interior boundaries sit on checkpoints.
+
+    Without ``chunk``, chunks are at most `RANGE_CHUNK` frames so streamed results stay small.
+    """
+    n = end - start + 1
+    if chunk is None:
+        chunk = min(RANGE_CHUNK, -(-n // max(1, workers * TASKS_PER_WORKER)))
+    step = max(1, -(-int(chunk) // CHECKPOINT_INTERVAL)) * CHECKPOINT_INTERVAL
+    bounds: List[Tuple[int, int]] = []
+    lo = start
+    while lo <= end:
+        hi = min(end, (lo // step + 1) * step - 1)
+        bounds.append((lo, hi))
+        lo = hi + 1
+    return bounds
+
+
+def iter_camera_range_parallel(
+    project: Project,
+    start: int,
+    end: int,
+    workers: Optional[int] = None,
+    *,
+    chunk: Optional[int] = None,
+    rig: Optional[CameraRig] = None,
+) -> Iterator[CameraBuffer]:
+    """`CameraRig.iter_range` with chunks evaluated by `workers` processes (default: all cores).
+
+    Chunks are yielded in frame order as they complete; at most ``2 * workers`` are in flight, so
+    memory stays bounded however long the range is. Stateful stacks, ``workers <= 1`` or a range
+    that fits one chunk stream serially in-process.
+    """
+    rig = rig or CameraRig.from_project(project)
+    start = max(0, int(start))
+    end = max(start, int(end))
+    workers = default_workers() if workers is None else int(workers)
+    bounds = chunk_bounds(start, end, workers, chunk)
+    if rig.stateful or workers <= 1 or len(bounds) <= 1:
+        yield from rig.iter_range(start, end)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=min(workers, len(bounds)),
+        initializer=_init_worker,
+        initargs=(project.model_dump(mode="json"),),
+    ) as pool:
+        pending: Deque[Any] = deque()
+        for lo, hi in bounds:
+            pending.append(pool.submit(_eval_chunk, lo, hi))
+            if len(pending) >= 2 * workers:
+                yield CameraBuffer(pending.popleft().result())
+        while pending:
+            yield CameraBuffer(pending.popleft().result())
+
+
+def eval_camera_range_parallel(
+    project: Project,
+    start: int,
+    end: int,
+    workers: Optional[int] = None,
+    *,
+    chunk: Optional[int] = None,
+    rig: Optional[CameraRig] = None,
+) -> CameraBuffer:
+    """`eval_camera_range` sharded over `workers` processes (default: all cores).
+
+    Stateful stacks, ``workers <= 1`` or a range that fits one chunk evaluate serially in-process.
+    """
+    rig = rig or CameraRig.from_project(project)
+    if rig.stateful:
+        return rig.eval_range(start, end)
+    return CameraBuffer.concat(iter_camera_range_parallel(project, start, end, workers, chunk=chunk, rig=rig))
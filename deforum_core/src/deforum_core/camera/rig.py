@@ -1,15 +1,28 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Dict, Optional, Tuple, Any, List
-import math
-
-from deforum_core.camera.math3d import Quaternion, look_at_rotation, v3
-from deforum_core.camera.constraints import rail_position, orbit_position, lookup_null
-from deforum_core.camera.modifiers import aim_spring_apply, noise_shake_apply, dolly_zoom_focal
-from deforum_core.camera.euler import lock_roll, quat_to_euler_xyz_deg, euler_xyz_deg_to_quat
-from deforum_core.schema.models import Project, Track
-from deforum_core.timeline.evaluator import build_tracks, eval_track
+from copy import deepcopy
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+import threading
+
+import numpy as np
+
+from deforum_core.camera.math3d import (
+    Quaternion,
+    lock_roll_quat_batch,
+    look_at_rotation_batch,
+    quat_roll_batch,
+    quat_rows,
+)
+from deforum_core.camera.constraints import resolve_objects
+from deforum_core.camera.splines import CompiledSpline, NearestPoint, compile_spline
+from deforum_core.camera.stack import CameraBlock, StackEntry, constraint_entry, modifier_entry
+from deforum_core.schema.models import Constraint, Modifier, Project, Track
+from deforum_core.timeline.curves import CompiledChannel, compile_channel
+from deforum_core.timeline.evaluator import TrackColumns, build_tracks, eval_track_columns
+
+Vec3 = Tuple[float, float, float]
 
 
 @dataclass
@@ -23,195 +36,341 @@ class CameraState:
     target: Optional[Tuple[float, float, float]] = None
 
 
-def _get(vals: Dict[str, float], k: str, default: float) -> float:
-    return float(vals.get(k, default))
-
-
-def _get_vec(vals: Dict[str, float], prefix: str, default: Tuple[float, float, float]) -> Tuple[float, float, float]:
-    return (
-        _get(vals, f"{prefix}.x", default[0]),
-        _get(vals, f"{prefix}.y", default[1]),
-        _get(vals, f"{prefix}.z", default[2]),
-    )
-
-
-def _apply_constraints(
-    project: Project,
-    track: Track,
-    vals: Dict[str, float],
-    base_pos: Tuple[float, float, float],
-    base_target: Tuple[float, float, float],
-) -> Tuple[Tuple[float, float, float], Tuple[float, float, float]]:
-    """Constraints may override position and/or target."""
-    pos = base_pos
-    target = base_target
-
-    constraints = sorted(track.constraints, key=lambda c: int(getattr(c, "order", 0)))
-    for c in constraints:
-        if not getattr(c, "enabled", True):
-            continue
-        ctype = (c.type or "").lower()
-        params = c.params or {}
-
-        if ctype == "rail" or ctype == "followpath":
-            u = _get(vals, "rail.u" if ctype=="rail" else "path.u", 0.0)
-            p = rail_position(project, u=u, params=params)
-            if p is not None:
-                pos = p
-
-        elif ctype == "orbit":
-            radius = _get(vals, "orbit.radius", float(params.get("radius", 6.0)))
-            az = _get(vals, "orbit.azimuth_deg", float(params.get("azimuth_deg", 0.0)))
-            el = _get(vals, "orbit.elevation_deg", float(params.get("elevation_deg", 10.0)))
-            off = params.get("offset", [0.0, 0.0, 0.0])
-            try:
-                offset = (float(off[0]), float(off[1]), float(off[2]))
-            except Exception:
-                offset = (0.0, 0.0, 0.0)
-            pos = orbit_position(target, radius=radius, azimuth_deg=az, elevation_deg=el, offset=offset)
-
-        elif ctype == "lookatobject":
-            null_id = str(params.get("null_id", ""))
-            p = lookup_null(project, null_id)
-            if p is not None:
-                target = p
-
-    return pos, target
-
-
-def _apply_roll_deg(rot, roll_deg: float):
-    try:
-        rx, ry, rz = quat_to_euler_xyz_deg(rot)
-        return euler_xyz_deg_to_quat(rx + float(roll_deg), ry, rz)
-    except Exception:
-        return rot
+# Structured row layout of CameraBuffer; one record per evaluated frame.
+CAMERA_DTYPE = np.dtype([
+    ("frame", np.int64),
+    ("position", np.float64, (3,)),
+    ("target", np.float64, (3,)),
+    ("rotation", np.float64, (4,)),  # w, x, y, z
+    ("focal_length_mm", np.float64),
+    ("focus_distance_m", np.float64),
+    ("aperture_f", np.float64),
+])
+
+
+@dataclass(frozen=True, eq=False)
+class CameraBuffer:
+    """Evaluated camera frames as one structured array (`CAMERA_DTYPE`).
+
+    Field properties return array views, so consumers can work column-wise without building a
+    `CameraState` per frame. Indexing and iteration still produce `CameraState`s, and `to_states`
+    gives the old list form.
+    """
+
+    data: np.ndarray
+
+    @classmethod
+    def empty(cls, n: int) -> "CameraBuffer":
+        return cls(np.zeros(int(n), dtype=CAMERA_DTYPE))
+
+    @classmethod
+    def from_states(cls, states: Sequence[CameraState]) -> "CameraBuffer":
+        buf = cls.empty(len(states))
+        d = buf.data
+        for i, st in enumerate(states):
+            r = st.rotation
+            d[i] = (st.frame, st.position, st.target if st.target is not None else (0.0, 0.0, 0.0),
+                    (r.w, r.x, r.y, r.z), st.focal_length_mm, st.focus_distance_m, st.aperture_f)
+        return buf
+
+    @classmethod
+    def concat(cls, buffers: Iterable["CameraBuffer"]) -> "CameraBuffer":
+        parts = [b.data for b in buffers]
+        return cls(np.concatenate(parts) if parts else np.zeros(0, dtype=CAMERA_DTYPE))
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def frame(self) -> np.ndarray:
+        return self.data["frame"]
+
+    @property
+    def position(self) -> np.ndarray:
+        return self.data["position"]
+
+    @property
+    def target(self) -> np.ndarray:
+        return self.data["target"]
+
+    @property
+    def rotation(self) -> np.ndarray:
+        return self.data["rotation"]
+
+    @property
+    def focal_length_mm(self) -> np.ndarray:
+        return self.data["focal_length_mm"]
+
+    @property
+    def focus_distance_m(self) -> np.ndarray:
+        return self.data["focus_distance_m"]
+
+    @property
+    def aperture_f(self) -> np.ndarray:
+        return self.data["aperture_f"]
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return CameraBuffer(self.data[i])
+        return self._state(self.data[i])
+
+    def __iter__(self) -> Iterator[CameraState]:
+        return iter(self.to_states())
+
+    @staticmethod
+    def _state(rec) -> CameraState:
+        w, x, y, z = rec["rotation"].tolist()
+        return CameraState(
+            frame=int(rec["frame"]),
+            position=_vec3(rec["position"]),
+            rotation=Quaternion(w, x, y, z),
+            focal_length_mm=float(rec["focal_length_mm"]),
+            focus_distance_m=float(rec["focus_distance_m"]),
+            aperture_f=float(rec["aperture_f"]),
+            target=_vec3(rec["target"]),
+        )
+
+    def to_states(self) -> List[CameraState]:
+        """Adapter to the list-of-`CameraState` form."""
+        d = self.data
+        return [
+            CameraState(
+                frame=f,
+                position=(p[0], p[1], p[2]),
+                rotation=rot,
+                focal_length_mm=fl,
+                focus_distance_m=fd,
+                aperture_f=ap,
+                target=(t[0], t[1], t[2]),
+            )
+            for f, p, t, rot, fl, fd, ap in zip(
+                d["frame"].tolist(), d["position"].tolist(), d["target"].tolist(), quat_rows(d["rotation"]),
+                d["focal_length_mm"].tolist(), d["focus_distance_m"].tolist(), d["aperture_f"].tolist(),
+            )
+        ]
+
+
+POSITION_DEFAULT = (0.0, 1.5, -6.0)
+TARGET_DEFAULT = (0.0, 1.5, 0.0)
+
+# Frames per chunk for streamed range evaluation.
+RANGE_CHUNK = 4096
+
+# Frames between modifier state snapshots.
+CHECKPOINT_INTERVAL = 256
+
+
+def _vec3(row: np.ndarray) -> Vec3:
+    x, y, z = row.tolist()
+    return (x, y, z)
+
+
+def _camera_track(project: Project) -> Track:
+    tracks = build_tracks(project)
+    return tracks[0] if tracks else Track(id="camera.transform", type="CameraTransformTrack")
+
+
+@dataclass(frozen=True, eq=False)
+class CameraRig:
+    """Camera evaluation state prepared once per project.
+
+    Holds the camera track's compiled channels, the enabled constraint and modifier stacks in
+    execution order, and the nulls/splines they reference. ``stack`` pairs each known entry with
+    its registered batch function (see `deforum_core.camera.stack`), constraints first.
+    ``compiled_splines`` holds every usable spline compiled, with its arc-length table, so
+    evaluation never hashes spline dicts. Build it with `from_project` and reuse it for every
+    frame or range of that project.
+    """
+
+    track: Track
+    channels: Dict[str, CompiledChannel]
+    constraints: Tuple[Constraint, ...]
+    modifiers: Tuple[Modifier, ...]
+    nulls: Dict[str, Vec3]
+    splines: Dict[str, Dict[str, Any]]
+    fps: int
+    stack: Tuple[Tuple[StackEntry, Dict[str, Any]], ...] = ()
+    compiled_splines: Dict[str, CompiledSpline] = field(default_factory=dict)
+
+    @classmethod
+    def from_project(cls, project: Project) -> "CameraRig":
+        track = _camera_track(project)
+        constraints = sorted(track.constraints, key=lambda c: int(getattr(c, "order", 0)))
+        modifiers = sorted(track.modifiers, key=lambda m: int(getattr(m, "order", 0)))
+        nulls, splines = resolve_objects(project)
+        constraints = tuple(c for c in constraints if getattr(c, "enabled", True))
+        modifiers = tuple(m for m in modifiers if getattr(m, "enabled", True))
+        stack = [(constraint_entry(c.type), dict(c.params or {})) for c in constraints]
+        stack += [(modifier_entry(m.type), dict(m.params or {})) for m in modifiers]
+        compiled = {sid: cs for sid, cs in ((sid, compile_spline(sp)) for sid, sp in splines.items()) if cs is not None}
+        for cs in compiled.values():
+            cs.arc_length
+        return cls(
+            track=track,
+            channels={name: compile_channel(ch) for name, ch in track.channels.items()},
+            constraints=constraints,
+            modifiers=modifiers,
+            nulls=nulls,
+            splines=splines,
+            fps=int(project.meta.fps),
+            stack=tuple((entry, params) for entry, params in stack if entry is not None),
+            compiled_splines=compiled,
+        )
+
+    def columns(self, frames) -> TrackColumns:
+        return eval_track_columns(self.channels, frames)
+
+    def nearest_u(self, spline_id: str, point) -> Optional[NearestPoint]:
+        """Closest point on one of the project's splines (None for unknown or unusable splines)."""
+        cs = self.compiled_splines.get(str(spline_id))
+        return cs.nearest(point) if cs is not None else None
+
+    def nearest_u_batch(self, spline_id: str, points) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        cs = self.compiled_splines.get(str(spline_id))
+        return cs.nearest_batch(points) if cs is not None else None
+
+    @cached_property
+    def checkpoints(self) -> "ModifierCheckpoints":
+        """Modifier state snapshots for this rig, built on first use."""
+        return ModifierCheckpoints(self)
+
+    @property
+    def stateful(self) -> bool:
+        return any(entry.is_stateful(params) for entry, params in self.stack)
+
+    def _states_at(self, frame: int) -> List[Any]:
+        if frame <= 0 or not self.stateful:
+            return [None] * len(self.stack)
+        return self.checkpoints.states_at(frame)
+
+    def eval(self, frame: int) -> CameraState:
+        """One frame, including stateful modifiers resumed from the nearest checkpoint."""
+        frame = int(frame)
+        return self._eval_block(np.array([frame]), self._states_at(frame))[0]
+
+    def eval_range(self, start: int, end: int) -> CameraBuffer:
+        start = max(0, int(start))
+        end = max(start, int(end))
+        return self._eval_block(np.arange(start, end + 1), self._states_at(start))
+
+    def eval_frames(self, frames) -> CameraBuffer:
+        """Arbitrary (e.g. sparse) frames in one block; frame-local stacks only.
+
+        Stateful modifiers depend on every frame before the ones asked for, so use
+        `eval_range`/`iter_range` for them.
+        """
+        if self.stateful:
+            raise ValueError("eval_frames needs a frame-local stack; stateful modifiers need eval_range")
+        frames = np.asarray(frames, dtype=np.int64).ravel()
+        return self._eval_block(frames, [None] * len(self.stack))
+
+    def iter_range(self, start: int, end: int, chunk: int = RANGE_CHUNK) -> Iterator[CameraBuffer]:
+        """Yield `eval_range(start, end)` in consecutive chunks of at most `chunk` frames.
+
+        Stateful modifiers (AimSpring, NoiseShake) carry their state from one chunk to the next,
+        so the concatenated chunks equal a single `eval_range` call while only one chunk is alive.
+        """
+        start = max(0, int(start))
+        end = max(start, int(end))
+        chunk = max(1, int(chunk))
+        states = self._states_at(start)
+        for lo in range(start, end + 1, chunk):
+            yield self._eval_block(np.arange(lo, min(end, lo + chunk - 1) + 1), states)
+
+    def _stack_pass(self, frames: np.ndarray, states: List[Any]) -> CameraBlock:
+        """Channels, then each stack entry once over consecutive `frames`.
+
+        Entry i resumes from ``states[i]`` (None = fresh) and ``states`` is updated in place with
+        each entry's state after the last frame.
+        """
+        cols = self.columns(frames)
+        block = CameraBlock(
+            frames=frames,
+            columns=cols,
+            fps=self.fps,
+            nulls=self.nulls,
+            splines=self.splines,
+            compiled_splines=self.compiled_splines,
+            position=cols.vec("position", POSITION_DEFAULT).copy(),
+            target=cols.vec("target", TARGET_DEFAULT).copy(),
+            focal_length_mm=cols.column("focal_length_mm", 35.0),
+        )
+        for i, (entry, params) in enumerate(self.stack):
+            states[i] = entry.fn(block, params, states[i])
+        return block
+
+    def _eval_block(self, frames: np.ndarray, states: List[Any]) -> CameraBuffer:
+        """Evaluate consecutive `frames`, resuming stack state as in `_stack_pass`."""
+        block = self._stack_pass(frames, states)
+        cols = block.columns
+        buf = CameraBuffer.empty(len(frames))
+        buf.frame[:] = frames
+
+        quats = look_at_rotation_batch(block.position, block.target)
+        roll_arr = cols.column("roll_deg", 0.0)
+        rolled = np.abs(roll_arr) > 1e-9
+        if rolled.any():
+            quats[rolled] = quat_roll_batch(quats[rolled], roll_arr[rolled])
+        if block.level_horizon:
+            quats = lock_roll_quat_batch(quats)
+
+        buf.position[:] = block.position
+        buf.target[:] = block.target
+        buf.rotation[:] = quats
+        buf.focal_length_mm[:] = block.focal_length_mm
+        buf.focus_distance_m[:] = cols.column("focus_distance_m", 2.8)
+        buf.aperture_f[:] = cols.column("aperture_f", 2.8)
+        return buf
+
+
+class ModifierCheckpoints:
+    """Stateful modifier snapshots every `interval` frames, counted from frame 0.
+
+    Snapshot k holds each modifier's state (spring position/velocity, low-pass values, RNG state)
+    just before frame ``k * interval``. Snapshots are appended on demand, so random access to
+    frame N costs at most `interval` frames of modifier warm-up once the store covers N. The store
+    belongs to one `CameraRig`, which is built from one project snapshot; a changed project gets a
+    new rig and starts from an empty store.
+    """
+
+    def __init__(self, rig: CameraRig, interval: int = CHECKPOINT_INTERVAL):
+        self.rig = rig
+        self.interval = max(1, int(interval))
+        self._snapshots: List[List[Any]] = [[None] * len(rig.stack)]
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._snapshots)
+
+    def states_at(self, frame: int) -> List[Any]:
+        """Modifier states just before `frame`; the caller owns the returned list."""
+        frame = max(0, int(frame))
+        k = frame // self.interval
+        with self._lock:
+            while len(self._snapshots) <= k:
+                i = len(self._snapshots) - 1
+                states = deepcopy(self._snapshots[i])
+                lo = i * self.interval
+                self.rig._stack_pass(np.arange(lo, lo + self.interval), states)
+                self._snapshots.append(states)
+            states = deepcopy(self._snapshots[k])
+        lo = k * self.interval
+        if frame > lo:
+            self.rig._stack_pass(np.arange(lo, frame), states)
+        return states
+
+    def invalidate(self) -> None:
+        with self._lock:
+            del self._snapshots[1:]
 
 
 def eval_camera(project: Project, frame: int) -> CameraState:
+    return CameraRig.from_project(project).eval(frame)
 
-    tracks = build_tracks(project)
-    cam_track = tracks[0] if tracks else Track(id="camera.transform", type="CameraTransformTrack")
-    vals = eval_track(cam_track, frame)
-
-    pos_default = (0.0, 1.5, -6.0)
-    pos_ch = _get_vec(vals, "position", pos_default)
-
-    tgt_default = (0.0, 1.5, 0.0)
-    tgt_ch = _get_vec(vals, "target", tgt_default)
-
-    pos, target = _apply_constraints(project, cam_track, vals, pos_ch, tgt_ch)
-
-    rot = look_at_rotation(v3(*pos), v3(*target))
-    # Optional roll channel (degrees): roll_deg
-    roll = _get(vals, "roll_deg", 0.0)
-    if abs(float(roll)) > 1e-9:
-        rot = _apply_roll_deg(rot, float(roll))
-    # HorizonLock is applied as a modifier in range eval; single-frame eval keeps base look-at.
-    focal = _get(vals, "focal_length_mm", 35.0)
-    focus = _get(vals, "focus_distance_m", 2.8)
-    aperture = _get(vals, "aperture_f", 2.8)
-
-    return CameraState(
-        frame=int(frame),
-        position=pos,
-        rotation=rot,
-        focal_length_mm=focal,
-        focus_distance_m=focus,
-        aperture_f=aperture,
-        target=target,
-    )
-
-
-def eval_camera_range(project: Project, start: int, end: int) -> List[CameraState]:
-    tracks = build_tracks(project)
-    cam_track = tracks[0] if tracks else Track(id="camera.transform", type="CameraTransformTrack")
-
-    start = max(0, int(start))
-    end = max(start, int(end))
-
-    fps = project.meta.fps
-    dt = 1.0 / float(max(1, fps))
-
-    cams: List[CameraState] = []
-    positions: List[Tuple[float, float, float]] = []
-    targets: List[Tuple[float, float, float]] = []
-    focals: List[float] = []
-
-    for f in range(start, end + 1):
-        vals = eval_track(cam_track, f)
-
-        pos_default = (0.0, 1.5, -6.0)
-        pos_ch = _get_vec(vals, "position", pos_default)
-
-        tgt_default = (0.0, 1.5, 0.0)
-        tgt_ch = _get_vec(vals, "target", tgt_default)
-
-        pos, target = _apply_constraints(project, cam_track, vals, pos_ch, tgt_ch)
-
-        focal = _get(vals, "focal_length_mm", 35.0)
-        focus = _get(vals, "focus_distance_m", 2.8)
-        aperture = _get(vals, "aperture_f", 2.8)
-
-        cams.append(CameraState(frame=f, position=pos, rotation=Quaternion(1,0,0,0), focal_length_mm=focal, focus_distance_m=focus, aperture_f=aperture, target=target))
-        positions.append(pos)
-        targets.append(target)
-        focals.append(focal)
-
-    modifiers = sorted(cam_track.modifiers, key=lambda m: int(getattr(m, "order", 0)))
-    for m in modifiers:
-        if not getattr(m, "enabled", True):
-            continue
-        mtype = (m.type or "").lower()
-        params = m.params or {}
-
-        if mtype == "aimspring":
-            stiffness = float(params.get("stiffness", 18.0))
-            damping = float(params.get("damping", 6.0))
-            targets = aim_spring_apply(targets, dt=dt, stiffness=stiffness, damping=damping)
-
-        elif mtype == "noiseshake":
-            seed = int(params.get("seed", 1337))
-            amp_pos = float(params.get("amp_pos", 0.02))
-            amp_tgt = float(params.get("amp_tgt", 0.01))
-            freq_hz = float(params.get("freq_hz", 6.0))
-            positions, targets = noise_shake_apply(positions, targets, seed=seed, amp_pos=amp_pos, amp_tgt=amp_tgt, freq_hz=freq_hz, fps=fps)
-
-        elif mtype == "horizonlock":
-            # enforce roll=0 while preserving yaw/pitch
-            # this operates by recomputing look-at rotation then removing roll
-            # (deterministic)
-            pass
-
-        elif mtype == "dollyzoom":
-            ref_focal = float(params.get("reference_focal_mm", 35.0))
-            ref_dist = float(params.get("reference_distance_m", 3.0))
-            min_f = float(params.get("min_focal_mm", 12.0))
-            max_f = float(params.get("max_focal_mm", 200.0))
-            for i in range(len(focals)):
-                p = positions[i]
-                t = targets[i]
-                dist = math.sqrt((p[0]-t[0])**2 + (p[1]-t[1])**2 + (p[2]-t[2])**2)
-                focals[i] = dolly_zoom_focal(ref_focal, ref_dist, dist, min_focal_mm=min_f, max_focal_mm=max_f)
-
-    hlock_enabled = any((getattr(m, 'enabled', True) and (m.type or '').lower()=='horizonlock') for m in modifiers)
-
-    out: List[CameraState] = []
-    for i, cam in enumerate(cams):
-        pos = positions[i]
-        tgt = targets[i]
-        rot = look_at_rotation(v3(*pos), v3(*tgt))
-        roll = _get(vals, "roll_deg", 0.0)
-        if abs(float(roll)) > 1e-9:
-            rot = _apply_roll_deg(rot, float(roll))
-        if hlock_enabled:
-            rot = lock_roll(rot)
-        out.append(CameraState(
-            frame=cam.frame,
-            position=pos,
-            rotation=rot,
-            focal_length_mm=focals[i],
-            focus_distance_m=cam.focus_distance_m,
-            aperture_f=cam.aperture_f,
-            target=tgt,
-        ))
-    return out
+
+def eval_camera_range(project: Project, start: int, end: int) -> CameraBuffer:
+    return CameraRig.from_project(project).eval_range(start, end)
+
+
+def iter_camera_range(project: Project, start: int, end: int, chunk: int = RANGE_CHUNK) -> Iterator[CameraBuffer]:
+    return CameraRig.from_project(project).iter_range(start, end, chunk=chunk)
@@ -1,10 +1,30 @@
 from __future__ import annotations
 
-from typing import List, Tuple, Dict, Any
+from dataclasses import dataclass
+from functools import cached_property, lru_cache
+from typing import List, NamedTuple, Optional, Tuple, Dict, Any
+import hashlib
+import json
 import math
+import threading
+
+import numpy as np
+
+from deforum_core.camera.spline import sample_catmull_rom
 
 Vec3 = Tuple[float, float, float]
 
+# Arc-length table resolution: parameter samples per spline segment.
+ARC_LENGTH_SAMPLES = 64
+
+# Adaptive tessellation defaults: chord deviation (world units) and point budget per spline.
+TESSELLATE_TOLERANCE = 0.01
+TESSELLATE_MAX_POINTS = 2048
+
+# Closest-point refinement: Newton seeds per candidate segment and iterations per seed.
+NEAREST_SEEDS = 5
+NEAREST_NEWTON_ITERS = 8
+
 def bezier3(p0: Vec3, p1: Vec3, p2: Vec3, p3: Vec3, t: float) -> Vec3:
     u = 1.0 - t
     b0 = u*u*u
@@ -53,6 +73,8 @@ def sample_spline(spline_obj: Dict[str, Any], u: float) -> Vec3:
     if stype == "catmullromspline":
         pts = spline_obj.get("points") or []
         pts3: List[Vec3] = [tuple(map(float, p)) for p in pts]
+        if spline_obj.get("closed") and len(pts3) >= 2:
+            return sample_catmull_rom(pts3, u01=u, closed=True)
         return catmull_rom(pts3, u)
 
     if stype == "bezierspline":
@@ -76,3 +98,434 @@ def sample_spline(spline_obj: Dict[str, Any], u: float) -> Vec3:
         return bezier3(p0,p1,p2,p3,t)
 
     return (0.0, 0.0, 0.0)
+
+
+def spline_segment_count(spline_obj: Dict[str, Any]) -> int:
+    """Segments that `sample_spline` spreads ``u`` over uniformly (0 if it cannot sample)."""
+    stype = (spline_obj.get("type") or "").lower()
+    pts = spline_obj.get("points") or []
+    if stype == "catmullromspline":
+        if len(pts) < 2:
+            return 0
+        return len(pts) if spline_obj.get("closed") else len(pts) - 1
+    if stype == "bezierspline":
+        segs = spline_obj.get("segments") or []
+        return len(segs) if segs else (1 if len(pts) >= 4 else 0)
+    return 0
+
+
+@dataclass(frozen=True)
+class CompiledSpline:
+    """A spline as contiguous power-basis cubics: segment ``i`` is ``c0 + c1 t + c2 t^2 + c3 t^3``.
+
+    ``coeffs`` has shape (segments, 4, 3). ``u`` spreads uniformly over segments, as in
+    `sample_spline`.
+    """
+
+    coeffs: np.ndarray
+    key: str
+
+    @property
+    def segments(self) -> int:
+        return int(self.coeffs.shape[0])
+
+    def _locate(self, u) -> Tuple[np.ndarray, np.ndarray]:
+        m = self.segments
+        s = np.clip(np.asarray(u, dtype=np.float64), 0.0, 1.0) * m
+        i = np.minimum(np.floor(s).astype(np.intp), m - 1)
+        return i, s - i
+
+    def sample(self, u) -> np.ndarray:
+        """Positions at ``u`` (scalar -> (3,), array -> (..., 3)); one vectorized Horner pass."""
+        i, t = self._locate(u)
+        c = self.coeffs[i]
+        t = t[..., None]
+        return ((c[..., 3, :] * t + c[..., 2, :]) * t + c[..., 1, :]) * t + c[..., 0, :]
+
+    def tangent(self, u) -> np.ndarray:
+        """d position / d ``u`` at ``u`` (same shapes as `sample`)."""
+        i, t = self._locate(u)
+        c = self.coeffs[i]
+        t = t[..., None]
+        return ((3.0 * c[..., 3, :] * t + 2.0 * c[..., 2, :]) * t + c[..., 1, :]) * self.segments
+
+    @cached_property
+    def index(self) -> "SegmentBVH":
+        return SegmentBVH.build(self.coeffs)
+
+    @cached_property
+    def arc_length(self) -> "ArcLengthTable":
+        """Arc-length table at `ARC_LENGTH_SAMPLES` per segment, built on first use."""
+        return _arc_length_of(self, ARC_LENGTH_SAMPLES)
+
+    def nearest(self, point) -> "NearestPoint":
+        """Closest point on the spline to ``point`` (`nearest_batch` for one point)."""
+        u, pos, dist = self.nearest_batch(np.asarray(point, dtype=np.float64).reshape(1, 3))
+        return NearestPoint(u=float(u[0]), position=pos[0], distance=float(dist[0]))
+
+    def nearest_batch(self, points) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Closest points for (N, 3) ``points``: (u (N,), positions (N, 3), distances (N,)).
+
+        All points walk the BVH together. A greedy descent to each point's nearest-box leaf gives
+        a first distance bound; then a level-by-level traversal keeps only (point, node) pairs
+        whose box is nearer than the point's best distance so far, running Newton on every
+        surviving leaf pair of a level in one vectorized pass.
+        """
+        pts = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        n = len(pts)
+        bvh = self.index
+        k = np.zeros(n, dtype=np.intp)
+        inner = np.flatnonzero(bvh.seg[k] < 0)
+        while len(inner):
+            left, right = bvh.left[k[inner]], bvh.right[k[inner]]
+            q = pts[inner]
+            k[inner] = np.where(bvh.box_d2(left, q) <= bvh.box_d2(right, q), left, right)
+            inner = inner[bvh.seg[k[inner]] < 0]
+        best_seg = bvh.seg[k]
+        best_t, best_d2 = _segments_nearest(self.coeffs[best_seg], pts)
+
+        p = np.arange(n)
+        k = np.zeros(n, dtype=np.intp)
+        while len(p):
+            near = bvh.box_d2(k, pts[p]) < best_d2[p]
+            p, k = p[near], k[near]
+            seg = bvh.seg[k]
+            leaf = seg >= 0
+            lp, ls = p[leaf], seg[leaf]
+            fresh = ls != best_seg[lp]
+            lp, ls = lp[fresh], ls[fresh]
+            if len(lp):
+                t, d2 = _segments_nearest(self.coeffs[ls], pts[lp])
+                # Best pair per point (the first on ties), kept where it improves on the bound.
+                order = np.lexsort((d2, lp))
+                first = order[np.concatenate([[True], lp[order][1:] != lp[order][:-1]])]
+                better = first[d2[first] < best_d2[lp[first]]]
+                hit = lp[better]
+                best_d2[hit], best_seg[hit], best_t[hit] = d2[better], ls[better], t[better]
+            p, k = p[~leaf], k[~leaf]
+            p, k = np.concatenate([p, p]), np.concatenate([bvh.left[k], bvh.right[k]])
+        u = (best_seg + best_t) / self.segments
+        pos = self.sample(u)
+        return u, pos, np.linalg.norm(pos - pts, axis=1)
+
+    def tessellate(self, tolerance: float = TESSELLATE_TOLERANCE, max_points: int = TESSELLATE_MAX_POINTS) -> "Tessellation":
+        """Polyline whose chords deviate from the curve by at most ``tolerance`` where the budget allows.
+
+        Pieces start as whole segments and are halved while their flatness bound exceeds
+        ``tolerance``, worst first once ``max_points`` would be exceeded, so straight stretches
+        stay as single chords and tight bends get the points. Every segment keeps at least one
+        piece, whatever the budget.
+        """
+        tol = max(0.0, float(tolerance))
+        seg = np.arange(self.segments)
+        a = np.zeros(self.segments)
+        b = np.ones(self.segments)
+        err = _piece_flatness(self.coeffs[seg], a, b)
+        while True:
+            split = np.flatnonzero(err > tol)
+            room = int(max_points) - 1 - len(seg)
+            if len(split) == 0 or room <= 0:
+                break
+            if len(split) > room:
+                split = split[np.argsort(-err[split], kind="stable")[:room]]
+            # Halve in place; the right halves are appended.
+            mid = 0.5 * (a[split] + b[split])
+            right_end = b[split]
+            b[split] = mid
+            seg = np.concatenate([seg, seg[split]])
+            a = np.concatenate([a, mid])
+            b = np.concatenate([b, right_end])
+            touched = np.concatenate([split, np.arange(len(err), len(seg))])
+            err = np.concatenate([err, np.zeros(len(split))])
+            err[touched] = _piece_flatness(self.coeffs[seg[touched]], a[touched], b[touched])
+        order = np.lexsort((a, seg))
+        u = np.append((seg[order] + a[order]) / self.segments, 1.0)
+        return Tessellation(u=u, points=self.sample(u), max_error=float(err.max()) if len(err) else 0.0)
+
+
+class Tessellation(NamedTuple):
+    u: np.ndarray
+    points: np.ndarray
+    # Upper bound on chord deviation (world units) actually achieved.
+    max_error: float
+
+
+def _piece_flatness(c: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """Bound on how far the cubic pieces ``c[k]`` over [a, b] stray from their chords.
+
+    The piece is rewritten as a Bezier; its curve stays inside the hull of the control points, so
+    the larger distance of the two inner control points from the chord bounds the deviation.
+    """
+    h = (b - a)[:, None]
+    t = a[:, None]
+    c0, c1, c2, c3 = c[:, 0], c[:, 1], c[:, 2], c[:, 3]
+    d0 = ((c3 * t + c2) * t + c1) * t + c0
+    d1 = ((3.0 * c3 * t + 2.0 * c2) * t + c1) * h
+    d2 = (3.0 * c3 * t + c2) * h * h
+    d3 = c3 * h * h * h
+    p1 = d0 + d1 / 3.0
+    p2 = d0 + (2.0 * d1 + d2) / 3.0
+    p3 = d0 + d1 + d2 + d3
+    return np.maximum(_point_segment_distance(p1, d0, p3), _point_segment_distance(p2, d0, p3))
+
+
+def _point_segment_distance(p: np.ndarray, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    ab = b - a
+    den = np.einsum("ij,ij->i", ab, ab)
+    t = np.divide(np.einsum("ij,ij->i", p - a, ab), den, out=np.zeros_like(den), where=den > 0.0)
+    d = p - (a + np.clip(t, 0.0, 1.0)[:, None] * ab)
+    return np.sqrt(np.einsum("ij,ij->i", d, d))
+
+
+class NearestPoint(NamedTuple):
+    u: float
+    position: np.ndarray
+    distance: float
+
+
+def _segments_nearest(c: np.ndarray, p: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """(t, squared distance) of the closest point to ``p[j]`` on power-basis cubic ``c[j]``.
+
+    ``c`` is (M, 4, 3) and ``p`` (M, 3); t is in [0, 1]. The squared distance is a sextic in t
+    with up to three minima, so Newton runs from several seeds per pair at once; the ends are
+    candidates too.
+    """
+    t = np.broadcast_to(np.linspace(0.0, 1.0, NEAREST_SEEDS), (len(p), NEAREST_SEEDS))[..., None]
+    c0, c1, c2, c3 = (c[:, i, None, :] for i in range(4))
+    q = p[:, None, :]
+    for _ in range(NEAREST_NEWTON_ITERS):
+        r = ((c3 * t + c2) * t + c1) * t + c0 - q
+        d1 = (3.0 * c3 * t + 2.0 * c2) * t + c1
+        d2 = 6.0 * c3 * t + 2.0 * c2
+        g = np.sum(r * d1, axis=2, keepdims=True)
+        h = np.sum(d1 * d1 + r * d2, axis=2, keepdims=True)
+        # Skip the step where the distance is locally concave; the other seeds cover it.
+        step = np.divide(g, h, out=np.zeros_like(g), where=h > 1e-12)
+        t = np.clip(t - step, 0.0, 1.0)
+    r = ((c3 * t + c2) * t + c1) * t + c0 - q
+    d2 = np.einsum("mij,mij->mi", r, r)
+    k = np.argmin(d2, axis=1)
+    rows = np.arange(len(p))
+    return t[rows, k, 0], d2[rows, k]
+
+
+@dataclass(frozen=True)
+class SegmentBVH:
+    """Bounding-volume hierarchy over spline segments.
+
+    Each segment's box is the box of its Bezier control points, which contains the curve. Nodes are
+    stored flat: ``left``/``right`` are child node indices, and leaves have ``seg >= 0``.
+    """
+
+    lo: np.ndarray
+    hi: np.ndarray
+    left: np.ndarray
+    right: np.ndarray
+    seg: np.ndarray
+
+    @classmethod
+    def build(cls, coeffs: np.ndarray) -> "SegmentBVH":
+        c0, c1, c2, c3 = coeffs[:, 0], coeffs[:, 1], coeffs[:, 2], coeffs[:, 3]
+        ctrl = np.stack([c0, c0 + c1 / 3.0, c0 + (2.0 * c1 + c2) / 3.0, c0 + c1 + c2 + c3], axis=1)
+        seg_lo, seg_hi = ctrl.min(axis=1), ctrl.max(axis=1)
+        lo: List[np.ndarray] = []
+        hi: List[np.ndarray] = []
+        left: List[int] = []
+        right: List[int] = []
+        leaf: List[int] = []
+
+        def node(idx: np.ndarray) -> int:
+            k = len(lo)
+            lo.append(seg_lo[idx].min(axis=0))
+            hi.append(seg_hi[idx].max(axis=0))
+            left.append(-1)
+            right.append(-1)
+            leaf.append(int(idx[0]) if len(idx) == 1 else -1)
+            if len(idx) > 1:
+                centers = 0.5 * (seg_lo[idx] + seg_hi[idx])
+                axis = int(np.argmax(hi[k] - lo[k]))
+                idx = idx[np.argsort(centers[:, axis], kind="stable")]
+                half = len(idx) // 2
+                left[k] = node(idx[:half])
+                right[k] = node(idx[half:])
+            return k
+
+        node(np.arange(len(coeffs)))
+        return cls(lo=np.array(lo), hi=np.array(hi), left=np.array(left), right=np.array(right), seg=np.array(leaf))
+
+    def box_d2(self, k: np.ndarray, p: np.ndarray) -> np.ndarray:
+        """Squared distances from points ``p`` (M, 3) to the boxes of nodes ``k`` (M,)."""
+        d = np.maximum(np.maximum(self.lo[k] - p, p - self.hi[k]), 0.0)
+        return np.einsum("ij,ij->i", d, d)
+
+
+def _catmull_rom_coeffs(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
+    return 0.5 * np.stack(
+        [2.0 * p1, -p0 + p2, 2.0 * p0 - 5.0 * p1 + 4.0 * p2 - p3, -p0 + 3.0 * p1 - 3.0 * p2 + p3], axis=1
+    )
+
+
+def _bezier_coeffs(p0: np.ndarray, p1: np.ndarray, p2: np.ndarray, p3: np.ndarray) -> np.ndarray:
+    return np.stack(
+        [p0, 3.0 * (p1 - p0), 3.0 * (p0 - 2.0 * p1 + p2), -p0 + 3.0 * p1 - 3.0 * p2 + p3], axis=1
+    )
+
+
+def compile_spline(spline_obj: Dict[str, Any]) -> Optional[CompiledSpline]:
+    """Power-basis coefficients for a CatmullRom (open/closed) or Bezier spline; None if it cannot be sampled."""
+    m = spline_segment_count(spline_obj)
+    if m == 0:
+        return None
+    stype = (spline_obj.get("type") or "").lower()
+    if stype == "catmullromspline":
+        pts = np.asarray(spline_obj.get("points"), dtype=np.float64).reshape(-1, 3)
+        n = len(pts)
+        i = np.arange(m)
+        if spline_obj.get("closed"):
+            idx = [(i + k) % n for k in (-1, 0, 1, 2)]
+        else:
+            idx = [np.clip(i + k, 0, n - 1) for k in (-1, 0, 1, 2)]
+        coeffs = _catmull_rom_coeffs(*(pts[j] for j in idx))
+    else:
+        segs = spline_obj.get("segments") or []
+        if segs:
+            ctrl = np.array([[seg["p0"], seg["p1"], seg["p2"], seg["p3"]] for seg in segs], dtype=np.float64)
+        else:
+            ctrl = np.asarray(spline_obj.get("points")[:4], dtype=np.float64).reshape(1, 4, 3)
+        coeffs = _bezier_coeffs(ctrl[:, 0], ctrl[:, 1], ctrl[:, 2], ctrl[:, 3])
+    coeffs = np.ascontiguousarray(coeffs)
+    coeffs.setflags(write=False)
+    return CompiledSpline(coeffs=coeffs, key=_spline_key(spline_obj))
+
+
+def _spline_key(spline_obj: Dict[str, Any]) -> str:
+    return json.dumps(spline_obj, sort_keys=True, separators=(",", ":"), default=list)
+
+
+def spline_content_hash(spline_obj: Dict[str, Any]) -> str:
+    return hashlib.sha1(_spline_key(spline_obj).encode("utf-8")).hexdigest()
+
+
+class SplineCache:
+    """Compiled splines keyed by spline id; an entry is recompiled when the spline's content hash changes."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = int(maxsize)
+        self._entries: Dict[str, Tuple[str, Optional[CompiledSpline]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, spline_id: Optional[str], spline_obj: Dict[str, Any]) -> Optional[CompiledSpline]:
+        digest = spline_content_hash(spline_obj)
+        key = digest if spline_id is None else str(spline_id)
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None and hit[0] == digest:
+                return hit[1]
+        compiled = compile_spline(spline_obj)
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.maxsize:
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (digest, compiled)
+        return compiled
+
+    def invalidate(self, spline_id: Optional[str] = None) -> None:
+        with self._lock:
+            if spline_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(str(spline_id), None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+SPLINE_CACHE = SplineCache()
+
+
+def compiled_spline(spline_obj: Dict[str, Any], spline_id: Optional[str] = None) -> Optional[CompiledSpline]:
+    """`compile_spline` through the shared `SPLINE_CACHE`."""
+    return SPLINE_CACHE.get(spline_id, spline_obj)
+
+
+def sample_spline_array(spline_obj: Dict[str, Any], u, spline_id: Optional[str] = None) -> np.ndarray:
+    """Batched `sample_spline`: positions (N, 3) for an array of ``u`` (zeros if the spline cannot be sampled)."""
+    u = np.asarray(u, dtype=np.float64)
+    cs = compiled_spline(spline_obj, spline_id)
+    if cs is None:
+        return np.zeros(u.shape + (3,), dtype=np.float64)
+    return cs.sample(u)
+
+
+@dataclass(frozen=True)
+class ArcLengthTable:
+    """Cumulative chord length of a spline at increasing parameter samples.
+
+    ``s`` is normalized to 0..1, so `param` maps a fraction of the path length back to the
+    segment-uniform ``u`` that `sample_spline` takes.
+    """
+
+    u: np.ndarray
+    s: np.ndarray
+    length: float
+
+    def param(self, s01):
+        """Spline ``u`` at arc-length fraction(s) ``s01`` (binary search + linear interpolation)."""
+        s01 = np.clip(np.asarray(s01, dtype=np.float64), 0.0, 1.0)
+        if self.length <= 0.0:
+            return s01
+        return np.interp(s01, self.s, self.u)
+
+    def fraction(self, u):
+        """Inverse of `param`: arc-length fraction at spline ``u``."""
+        u = np.clip(np.asarray(u, dtype=np.float64), 0.0, 1.0)
+        if self.length <= 0.0:
+            return u
+        return np.interp(u, self.u, self.s)
+
+
+def arc_length_table(spline_obj: Dict[str, Any], samples_per_segment: int = ARC_LENGTH_SAMPLES) -> ArcLengthTable:
+    """Arc-length table for a spline, built once per distinct spline content."""
+    return _arc_length_table(_spline_key(spline_obj), int(samples_per_segment))
+
+
+@lru_cache(maxsize=128)
+def _arc_length_table(key: str, samples_per_segment: int) -> ArcLengthTable:
+    return _arc_length_of(compile_spline(json.loads(key)), samples_per_segment)
+
+
+def _arc_length_of(cs: Optional[CompiledSpline], samples_per_segment: int) -> ArcLengthTable:
+    n = max(1, cs.segments if cs is not None else 0) * max(2, samples_per_segment) + 1
+    u = np.linspace(0.0, 1.0, n)
+    pts = cs.sample(u) if cs is not None else np.zeros((n, 3))
+    d = np.diff(pts, axis=0)
+    cum = np.concatenate([[0.0], np.cumsum(np.sqrt(np.einsum("ij,ij->i", d, d)))])
+    length = float(cum[-1])
+    s = cum / length if length > 0.0 else u.copy()
+    for a in (u, s):
+        a.setflags(write=False)
+    return ArcLengthTable(u=u, s=s, length=length)
+
+
+def nearest_u(spline_obj: Dict[str, Any], point, spline_id: Optional[str] = None) -> Optional[NearestPoint]:
+    """Segment-uniform ``u`` (and position/distance) of the point on a spline closest to ``point``."""
+    cs = compiled_spline(spline_obj, spline_id)
+    return cs.nearest(point) if cs is not None else None
+
+
+def nearest_u_batch(
+    spline_obj: Dict[str, Any], points, spline_id: Optional[str] = None
+) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """`nearest_u` for (N, 3) points: (u, positions, distances), or None if the spline cannot be sampled."""
+    cs = compiled_spline(spline_obj, spline_id)
+    return cs.nearest_batch(points) if cs is not None else None
+
+
+def tessellate_spline(
+    spline_obj: Dict[str, Any],
+    tolerance: float = TESSELLATE_TOLERANCE,
+    max_points: int = TESSELLATE_MAX_POINTS,
+    spline_id: Optional[str] = None,
+) -> Optional[Tessellation]:
+    """Adaptive polyline for drawing a spline (see `CompiledSpline.tessellate`)."""
+    cs = compiled_spline(spline_obj, spline_id)
+    return cs.tessellate(tolerance, max_points) if cs is not None else None
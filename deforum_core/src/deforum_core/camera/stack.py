@@ -0,0 +1,205 @@
+"""Constraint and modifier registry.
+
+Every stack entry type is a batch function over one block of frames: it reads and overwrites the
+(N, 3)/(N,) columns of a `CameraBlock` and is called once per stack entry, not once per frame.
+Stateful types (springs, sequential noise) receive their state from the previous block and return
+the state after the block's last frame; frame-local types ignore it and return None.
+
+Third-party types register without touching the rig::
+
+    @register_modifier("wobble")
+    def wobble(block, params, state):
+        block.position[:, 1] += float(params.get("amp", 0.1)) * np.sin(block.frames * 0.1)
+
+Type names are matched case-insensitively against `Constraint.type` / `Modifier.type`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple, Union
+
+import numpy as np
+
+from deforum_core.camera.constraints import offset_from_params, orbit_position_array, spline_rail_positions
+from deforum_core.camera.splines import CompiledSpline
+from deforum_core.camera.modifiers import (
+    NOISE_SHAKE_MODES,
+    NoiseShakeState,
+    aim_spring_scan,
+    dolly_zoom_focal_array,
+    noise_shake_hash,
+    noise_shake_step,
+)
+from deforum_core.timeline.evaluator import TrackColumns
+
+Vec3 = Tuple[float, float, float]
+
+
+@dataclass
+class CameraBlock:
+    """Camera columns for consecutive `frames`, as the stack transforms them."""
+
+    frames: np.ndarray
+    columns: TrackColumns
+    fps: int
+    nulls: Dict[str, Vec3]
+    splines: Dict[str, Dict[str, Any]]
+    position: np.ndarray
+    target: np.ndarray
+    focal_length_mm: np.ndarray
+    # Set by HorizonLock: remove roll about the view axis after the rotation is built.
+    level_horizon: bool = False
+    # The rig's splines compiled once per project; `splines` keeps the raw dicts.
+    compiled_splines: Dict[str, CompiledSpline] = field(default_factory=dict)
+
+    @property
+    def dt(self) -> float:
+        return 1.0 / float(max(1, self.fps))
+
+    def __len__(self) -> int:
+        return len(self.frames)
+
+
+StackFn = Callable[[CameraBlock, Dict[str, Any], Any], Any]
+
+
+@dataclass(frozen=True)
+class StackEntry:
+    name: str
+    fn: StackFn
+    # True/False, or a predicate on the entry's params (e.g. NoiseShake depends on its mode).
+    stateful: Union[bool, Callable[[Mapping[str, Any]], bool]] = False
+
+    def is_stateful(self, params: Mapping[str, Any]) -> bool:
+        return bool(self.stateful(params)) if callable(self.stateful) else bool(self.stateful)
+
+
+CONSTRAINTS: Dict[str, StackEntry] = {}
+MODIFIERS: Dict[str, StackEntry] = {}
+
+
+def _register(table: Dict[str, StackEntry], kind: str, name: str, fn: Optional[StackFn], stateful, replace: bool):
+    key = str(name).lower()
+
+    def add(f: StackFn) -> StackFn:
+        if key in table and not replace:
+            raise ValueError(f"{kind} type {name!r} is already registered")
+        table[key] = StackEntry(name=key, fn=f, stateful=stateful)
+        return f
+
+    return add(fn) if fn is not None else add
+
+
+def register_constraint(name: str, fn: Optional[StackFn] = None, *, stateful=False, replace: bool = False):
+    """Register a constraint batch function; usable directly or as a decorator."""
+    return _register(CONSTRAINTS, "Constraint", name, fn, stateful, replace)
+
+
+def register_modifier(name: str, fn: Optional[StackFn] = None, *, stateful=False, replace: bool = False):
+    """Register a modifier batch function; usable directly or as a decorator."""
+    return _register(MODIFIERS, "Modifier", name, fn, stateful, replace)
+
+
+def constraint_entry(type_name: Optional[str]) -> Optional[StackEntry]:
+    return CONSTRAINTS.get((type_name or "").lower())
+
+
+def modifier_entry(type_name: Optional[str]) -> Optional[StackEntry]:
+    return MODIFIERS.get((type_name or "").lower())
+
+
+# --- built-in constraints -------------------------------------------------------------------
+
+def _spline_rail(u_channel: str) -> StackFn:
+    def apply(block: CameraBlock, params: Dict[str, Any], state: Any) -> None:
+        spline_id = str(params.get("spline_id", ""))
+        sp = block.compiled_splines.get(spline_id) or block.splines.get(spline_id)
+        p = spline_rail_positions(sp, block.columns.column(u_channel, 0.0), params, spline_id)
+        if p is not None:
+            block.position = p
+        return None
+
+    return apply
+
+
+register_constraint("rail", _spline_rail("rail.u"))
+register_constraint("followpath", _spline_rail("path.u"))
+
+
+@register_constraint("orbit")
+def _orbit(block: CameraBlock, params: Dict[str, Any], state: Any) -> None:
+    cols = block.columns
+    radius = cols.column("orbit.radius", float(params.get("radius", 6.0)))
+    az = cols.column("orbit.azimuth_deg", float(params.get("azimuth_deg", 0.0)))
+    el = cols.column("orbit.elevation_deg", float(params.get("elevation_deg", 10.0)))
+    block.position = orbit_position_array(
+        block.target, radius=radius, azimuth_deg=az, elevation_deg=el, offset=offset_from_params(params)
+    )
+
+
+@register_constraint("lookatobject")
+def _look_at_object(block: CameraBlock, params: Dict[str, Any], state: Any) -> None:
+    p = block.nulls.get(str(params.get("null_id", "")))
+    if p is not None:
+        block.target[:] = p
+
+
+# --- built-in modifiers ---------------------------------------------------------------------
+
+@register_modifier("aimspring", stateful=True)
+def _aim_spring(block: CameraBlock, params: Dict[str, Any], state: Any):
+    block.target, state = aim_spring_scan(
+        block.frames,
+        block.target,
+        dt=block.dt,
+        stiffness=float(params.get("stiffness", 18.0)),
+        damping=float(params.get("damping", 6.0)),
+        integrator=str(params.get("integrator", "euler")).lower(),
+        state=state,
+    )
+    return state
+
+
+def _noise_mode(params: Mapping[str, Any]) -> str:
+    mode = str(params.get("mode", "legacy")).lower()
+    if mode not in NOISE_SHAKE_MODES:
+        raise ValueError(f"Unknown NoiseShake mode {mode!r}; expected one of {NOISE_SHAKE_MODES}")
+    return mode
+
+
+@register_modifier("noiseshake", stateful=lambda params: _noise_mode(params) != "hash")
+def _noise_shake(block: CameraBlock, params: Dict[str, Any], state: Any):
+    seed = int(params.get("seed", 1337))
+    amp_pos = float(params.get("amp_pos", 0.02))
+    amp_tgt = float(params.get("amp_tgt", 0.01))
+    freq_hz = float(params.get("freq_hz", 6.0))
+    if _noise_mode(params) == "hash":
+        d_pos, d_tgt = noise_shake_hash(block.frames, seed, amp_pos=amp_pos, amp_tgt=amp_tgt, freq_hz=freq_hz, fps=block.fps)
+        block.position = block.position + d_pos
+        block.target = block.target + d_tgt
+        return None
+    shake = state if state is not None else NoiseShakeState.from_seed(seed)
+    positions, targets, state = noise_shake_step(
+        block.position.tolist(), block.target.tolist(), shake, amp_pos=amp_pos, amp_tgt=amp_tgt, freq_hz=freq_hz, fps=block.fps
+    )
+    block.position = np.array(positions, dtype=np.float64).reshape(-1, 3)
+    block.target = np.array(targets, dtype=np.float64).reshape(-1, 3)
+    return state
+
+
+@register_modifier("horizonlock")
+def _horizon_lock(block: CameraBlock, params: Dict[str, Any], state: Any) -> None:
+    # Roll is removed after the look-at rotation is built, so yaw/pitch are preserved.
+    block.level_horizon = True
+
+
+@register_modifier("dollyzoom")
+def _dolly_zoom(block: CameraBlock, params: Dict[str, Any], state: Any) -> None:
+    d = block.position - block.target
+    block.focal_length_mm = dolly_zoom_focal_array(
+        float(params.get("reference_focal_mm", 35.0)),
+        float(params.get("reference_distance_m", 3.0)),
+        np.sqrt(np.einsum("ij,ij->i", d, d)),
+        min_focal_mm=float(params.get("min_focal_mm", 12.0)),
+        max_focal_mm=float(params.get("max_focal_mm", 200.0)),
+    )
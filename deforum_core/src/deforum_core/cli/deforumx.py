@@ -10,7 +10,7 @@ from rich.console import Console
 from rich.table import Table
 
 from deforum_core.api.app import create_app
-from deforum_core.camera.rig import eval_camera, eval_camera_range
+from deforum_core.camera.parallel import default_workers, iter_camera_range_parallel
 from deforum_core.schema.models import Project
 from deforum_core.cli.exporters import export_a1111_bundle, export_comfy_bundle, export_a1111_shots
 
@@ -23,6 +23,13 @@ def _resolve_project_json(path: str) -> Path:
     return (p / "project.json") if p.is_dir() else p
 
 
+WORKERS_HELP = "Processes for range evaluation of frame-local stacks (0 = all cores; stateful stacks run serially)"
+
+
+def _workers(n: int) -> int:
+    return default_workers() if int(n) <= 0 else int(n)
+
+
 def _load_project(path: str) -> Project:
     pj = _resolve_project_json(path)
     data = json.loads(pj.read_text(encoding="utf-8"))
@@ -43,17 +50,17 @@ def validate(project: str) -> None:
     t.add_row("schema_version", pr.schema_version)
     console.print(t)
     # Check shot override keys (non-fatal)
-allowed = {"sampler", "steps", "cfg", "seed_mode", "prompts", "negative_prompts"}
-warns = []
-for s in getattr(pr.timeline, "shots", []) if getattr(pr, "timeline", None) else []:
-    ov = getattr(s, "render_overrides", {}) or {}
-    for k in ov.keys():
-        if k not in allowed:
-            warns.append(f"Unknown override key in shot [{s.start}-{s.end}]: {k}")
-if warns:
-    console.print("[yellow]Warnings[/yellow]")
-    for wmsg in sorted(set(warns)):
-        console.print(" - " + wmsg)
+    allowed = {"sampler", "steps", "cfg", "seed_mode", "prompts", "negative_prompts"}
+    warns = []
+    for s in getattr(pr.timeline, "shots", []) if getattr(pr, "timeline", None) else []:
+        ov = getattr(s, "render_overrides", {}) or {}
+        for k in ov.keys():
+            if k not in allowed:
+                warns.append(f"Unknown override key in shot [{s.start}-{s.end}]: {k}")
+    if warns:
+        console.print("[yellow]Warnings[/yellow]")
+        for wmsg in sorted(set(warns)):
+            console.print(" - " + wmsg)
 
     console.print("[green]OK[/green]")
 
@@ -67,6 +74,7 @@ def export_camera_csv(
     compact: bool = True,
     tolerance: float = 0.02,
     max_points: int = 220,
+    workers: int = typer.Option(1, "--workers", help=WORKERS_HELP),
 ) -> None:
     pr = _load_project(project)
     base = Path(project) if Path(project).is_dir() else Path(project).parent
@@ -76,14 +84,19 @@ def export_camera_csv(
     end_frame = pr.meta.frames - 1 if end is None else min(end, pr.meta.frames - 1)
     start_frame = max(0, start)
 
-    cams = eval_camera_range(pr, start=start_frame, end=end_frame)
+    chunks = iter_camera_range_parallel(pr, start_frame, end_frame, _workers(workers))
 
     with out_path.open("w", newline="", encoding="utf-8") as f:
         cw = csv.writer(f)
         cw.writerow(["frame", "x", "y", "z", "tx", "ty", "tz", "qw", "qx", "qy", "qz", "focal_mm"])
-        for cam in cams:
-            tx, ty, tz = cam.target if cam.target else (0.0, 0.0, 0.0)
-            cw.writerow([cam.frame, *cam.position, tx, ty, tz, cam.rotation.w, cam.rotation.x, cam.rotation.y, cam.rotation.z, cam.focal_length_mm])
+        for cams in chunks:
+            cw.writerows(
+                [f, *p, *t, *q, fl]
+                for f, p, t, q, fl in zip(
+                    cams.frame.tolist(), cams.position.tolist(), cams.target.tolist(),
+                    cams.rotation.tolist(), cams.focal_length_mm.tolist(),
+                )
+            )
 
     console.print(f"[green]Wrote[/green] {out_path}")
 
@@ -96,6 +109,8 @@ def export_a1111(
     compact: bool = True,
     tolerance: float = 0.02,
     max_points: int = 220,
+    workers: int = typer.Option(1, "--workers", help=WORKERS_HELP),
+    reduce_mode: str = typer.Option("channel", "--reduce-mode", help="channel | joint (all schedules share key frames)"),
 ) -> None:
     pr = _load_project(project)
     base = Path(project) if Path(project).is_dir() else Path(project).parent
@@ -105,7 +120,10 @@ def export_a1111(
     end_frame = pr.meta.frames - 1 if end is None else min(end, pr.meta.frames - 1)
     start_frame = max(0, start)
 
-    bundle = export_a1111_bundle(pr, start=start_frame, end=end_frame, compact=compact, tolerance=tolerance, max_points=max_points)
+    bundle = export_a1111_bundle(
+        pr, start=start_frame, end=end_frame, compact=compact, tolerance=tolerance, max_points=max_points,
+        workers=_workers(workers), reduce_mode=reduce_mode,
+    )
     out_path.write_text(json.dumps({
         "meta": bundle.meta,
         "schedules": bundle.schedules,
@@ -126,6 +144,7 @@ def export_comfyui(
     compact: bool = True,
     tolerance: float = 0.02,
     max_points: int = 220,
+    workers: int = typer.Option(1, "--workers", help=WORKERS_HELP),
 ) -> None:
     pr = _load_project(project)
     base = Path(project) if Path(project).is_dir() else Path(project).parent
@@ -135,7 +154,7 @@ def export_comfyui(
     end_frame = pr.meta.frames - 1 if end is None else min(end, pr.meta.frames - 1)
     start_frame = max(0, start)
 
-    bundle = export_comfy_bundle(pr, start=start_frame, end=end_frame)
+    bundle = export_comfy_bundle(pr, start=start_frame, end=end_frame, workers=_workers(workers))
     out_path.write_text(json.dumps(bundle, indent=2), encoding="utf-8")
     console.print(f"[green]Wrote[/green] {out_path}")
 
@@ -160,11 +179,12 @@ def export_a1111_shots_cmd(
     compact: bool = typer.Option(True, "--compact/--no-compact", help="Compact schedule using RDP"),
     tolerance: float = typer.Option(0.02, "--tolerance", help="RDP tolerance (higher=fewer points)"),
     max_points: int = typer.Option(220, "--max-points", help="Max points per channel schedule"),
+    workers: int = typer.Option(1, "--workers", help=WORKERS_HELP),
 ):
-    pr = load_project(project_path)
+    pr = _load_project(project_path)
     start_frame = 0 if start is None else int(start)
     end_frame = (pr.meta.frames - 1) if end is None else int(end)
-    data = export_a1111_shots(pr, start=start_frame, end=end_frame, compact=compact, tolerance=tolerance, max_points=max_points)
+    data = export_a1111_shots(pr, start=start_frame, end=end_frame, compact=compact, tolerance=tolerance, max_points=max_points, workers=_workers(workers))
     Path(out).parent.mkdir(parents=True, exist_ok=True)
     Path(out).write_text(json.dumps(data, indent=2), encoding="utf-8")
     typer.echo(f"Wrote {out} (shots={data['meta']['shot_count']})")
@@ -1,67 +1,56 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple, Optional
 
-from deforum_core.camera.rig import eval_camera_range
-from deforum_core.camera.euler import quat_to_euler_xyz_deg, focal_mm_to_fov_deg
+import numpy as np
+
+from deforum_core.camera.parallel import eval_camera_range_parallel, iter_camera_range_parallel
+from deforum_core.camera.rig import CameraBuffer, CameraRig
+from deforum_core.camera.euler import quat_to_euler_xyz_deg_batch, focal_mm_to_fov_deg, schedule_euler_deg_to_quat_batch
 from deforum_core.schema.models import Project
+from deforum_core.timeline.keyreduce import JointError, joint_column_keys, max_error, rdp_budget, rdp_joint
+
+# "channel": every schedule keeps its own frames; "joint": all schedules share one set of frames.
+EXPORT_REDUCE_MODES = ("channel", "joint")
 
 
 def _schedule_from_points(points: List[Tuple[int, float]], precision: int = 4) -> str:
     return ", ".join([f"{int(f)}:({round(float(v), precision)})" for f, v in points])
 
 
-def _rdp(points: List[Tuple[int, float]], eps: float) -> List[Tuple[int, float]]:
-    # Ramer–Douglas–Peucker on (frame,value) in 2D, measured by perpendicular distance to segment.
-    if len(points) <= 2:
-        return points
-
-    (x1, y1) = points[0]
-    (x2, y2) = points[-1]
-    dx = x2 - x1
-    dy = y2 - y1
-    denom = (dx*dx + dy*dy) ** 0.5
-
-    def dist(p):
-        (x0, y0) = p
-        if denom < 1e-9:
-            return abs(y0 - y1)
-        # perpendicular distance to line
-        return abs(dy*x0 - dx*y0 + x2*y1 - y2*x1) / denom
-
-    max_d = -1.0
-    idx = -1
-    for i in range(1, len(points) - 1):
-        d = dist(points[i])
-        if d > max_d:
-            max_d = d
-            idx = i
-
-    if max_d <= eps or idx < 0:
-        return [points[0], points[-1]]
-    left = _rdp(points[: idx + 1], eps)
-    right = _rdp(points[idx:], eps)
-    return left[:-1] + right
-
-
 def _series_to_points(series: List[float], start_frame: int) -> List[Tuple[int, float]]:
     return [(start_frame + i, float(v)) for i, v in enumerate(series)]
 
 
-def _compact_points(points: List[Tuple[int, float]], eps: float, max_points: int) -> List[Tuple[int, float]]:
+def _compact_points(points: List[Tuple[int, float]], eps: float, max_points: int) -> Tuple[List[Tuple[int, float]], float]:
+    """At most ``max_points`` keys within ``eps`` of the series where the budget allows.
+
+    Returns the kept points and the largest value error of the linear schedule they describe.
+    """
     if len(points) <= 2:
-        return points
-    # If the user asks for very tight eps, keep more points; otherwise RDP.
-    simplified = _rdp(points, eps)
-    if len(simplified) <= max_points:
-        return simplified
-    # If still too many, progressively relax eps
-    e = eps
-    while len(simplified) > max_points and e < eps * 64:
-        e *= 1.25
-        simplified = _rdp(points, e)
-    return simplified[:max_points - 1] + [simplified[-1]]
+        return points, 0.0
+    arr = np.asarray(points, dtype=np.float64)
+    red = rdp_budget(arr[:, 0], arr[:, 1], max_points, eps)
+    return [points[i] for i in red.indices.tolist()], red.max_error
+
+
+def _schedule_error(position: np.ndarray, rotation: np.ndarray, lens: np.ndarray, tolerance: float) -> JointError:
+    """Camera-space error of reconstructed schedule rows (position xyz, euler xyz deg, lens...).
+
+    The worst of: position distance, rotation angle between the interpolated Euler angles and the
+    camera (which bounds the view direction and roll) in degrees, and each lens column's value
+    error; all over ``tolerance``.
+    """
+    def error(i: np.ndarray, approx: np.ndarray) -> np.ndarray:
+        d = approx[:, 0:3] - position[i]
+        e = np.sqrt(np.einsum("ij,ij->i", d, d))
+        dot = np.minimum(np.abs(np.einsum("ij,ij->i", schedule_euler_deg_to_quat_batch(approx[:, 3:6]), rotation[i])), 1.0)
+        e = np.maximum(e, np.degrees(2.0 * np.arctan2(np.sqrt(1.0 - dot * dot), dot)))
+        e = np.maximum(e, np.max(np.abs(approx[:, 6:] - lens[i]), axis=1))
+        return e / tolerance
+
+    return error
 
 
 def _bundle_text(deforum_fields: Dict[str, str]) -> str:
@@ -89,6 +78,8 @@ class A1111Bundle:
     compact: bool
     tolerance: float
     max_points: int
+    # Largest schedule value error per compacted schedule; empty when not compacted.
+    max_errors: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -97,25 +88,36 @@ class ComfyBundle:
     meta: Dict[str, Any]
 
 
-def export_camera_csv(project: Project, start: int, end: int) -> List[Dict[str, Any]]:
-    cams = eval_camera_range(project, start, end)
-    out: List[Dict[str, Any]] = []
-    for cam in cams:
-        out.append({
-            "frame": cam.frame,
-            "pos_x": cam.position[0],
-            "pos_y": cam.position[1],
-            "pos_z": cam.position[2],
-            "tgt_x": cam.target[0] if cam.target else 0.0,
-            "tgt_y": cam.target[1] if cam.target else 0.0,
-            "tgt_z": cam.target[2] if cam.target else 0.0,
-            "qw": cam.rotation.w,
-            "qx": cam.rotation.x,
-            "qy": cam.rotation.y,
-            "qz": cam.rotation.z,
-            "focal_mm": cam.focal_length_mm,
-        })
-    return out
+def export_camera_csv(
+    project: Project, start: int, end: int, *, rig: Optional[CameraRig] = None, workers: int = 1
+) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for cams in iter_camera_range_parallel(project, start, end, workers, rig=rig):
+        rows.extend(_camera_csv_rows(cams))
+    return rows
+
+
+def _camera_csv_rows(cams: CameraBuffer) -> List[Dict[str, Any]]:
+    pos = cams.position.tolist()
+    tgt = cams.target.tolist()
+    rot = cams.rotation.tolist()
+    return [
+        {
+            "frame": f,
+            "pos_x": p[0],
+            "pos_y": p[1],
+            "pos_z": p[2],
+            "tgt_x": t[0],
+            "tgt_y": t[1],
+            "tgt_z": t[2],
+            "qw": q[0],
+            "qx": q[1],
+            "qy": q[2],
+            "qz": q[3],
+            "focal_mm": fl,
+        }
+        for f, p, t, q, fl in zip(cams.frame.tolist(), pos, tgt, rot, cams.focal_length_mm.tolist())
+    ]
 
 
 def export_a1111_bundle(
@@ -127,52 +129,94 @@ def export_a1111_bundle(
     tolerance: float = 0.02,
     max_points: int = 220,
     precision: int = 4,
+    rig: Optional[CameraRig] = None,
+    workers: int = 1,
+    cams: Optional[CameraBuffer] = None,
+    reduce_mode: str = "channel",
 ) -> A1111Bundle:
-    cams = eval_camera_range(project, start=start, end=end)
-    csv = export_camera_csv(project, start, end)
+    """Deforum schedules and presets for frames ``start..end``.
+
+    With ``compact``, ``reduce_mode="channel"`` reduces each schedule on its own within
+    ``tolerance``; ``"joint"`` keys every schedule on one shared set of frames, chosen so the
+    camera they describe stays within ``tolerance`` of the evaluated one in position (scene units),
+    rotation (degrees) and lens values. Joint mode needs a positive ``tolerance`` and more than two
+    frames; otherwise the schedules are reduced per channel, ``meta["reduce_mode"]`` says
+    ``"channel"`` and ``meta["warnings"]`` says why.
+    """
+    if reduce_mode not in EXPORT_REDUCE_MODES:
+        raise ValueError(f"Unknown reduce mode {reduce_mode!r}; expected one of {EXPORT_REDUCE_MODES}")
+    if cams is None:
+        cams = eval_camera_range_parallel(project, start, end, workers, rig=rig)
+    csv = _camera_csv_rows(cams)
 
-    xs = [c.position[0] for c in cams]
-    ys = [c.position[1] for c in cams]
-    zs = [c.position[2] for c in cams]
+    xs = cams.position[:, 0].tolist()
+    ys = cams.position[:, 1].tolist()
+    zs = cams.position[:, 2].tolist()
 
     x0, y0, z0 = xs[0], ys[0], zs[0]
     tx = [x - x0 for x in xs]
     ty = [y - y0 for y in ys]
     tz = [z - z0 for z in zs]
 
-    eulers = [quat_to_euler_xyz_deg(c.rotation) for c in cams]  # (rx, ry, rz)
-    rx0, ry0, rz0 = eulers[0]
-    rxs = [e[0] - rx0 for e in eulers]
-    rys = [e[1] - ry0 for e in eulers]
-    rzs = [e[2] - rz0 for e in eulers]
-
-    fovs = [focal_mm_to_fov_deg(c.focal_length_mm, 36.0) for c in cams]
+    eulers = quat_to_euler_xyz_deg_batch(cams.rotation)  # (rx, ry, rz)
+    rel = eulers - eulers[0]
+    rxs = rel[:, 0].tolist()
+    rys = rel[:, 1].tolist()
+    rzs = rel[:, 2].tolist()
+
+    focals = cams.focal_length_mm.tolist()
+    fovs = [focal_mm_to_fov_deg(f, 36.0) for f in focals]
+
+    max_errors: Dict[str, float] = {}
+    frames = np.arange(start, start + len(cams))
+    # Joint mode: schedule name -> its keys, all on one shared set of frames.
+    joint_keys: Dict[str, np.ndarray] = {}
+    warnings_list: List[str] = []
+    if compact and reduce_mode == "joint" and (len(cams) <= 2 or tolerance <= 0):
+        warnings_list.append(
+            f"reduce_mode 'joint' needs tolerance > 0 and more than 2 frames "
+            f"(got tolerance={tolerance}, frames={len(cams)}); reduced per channel instead"
+        )
+    elif compact and reduce_mode == "joint":
+        columns = np.column_stack([cams.position, eulers, fovs, focals])
+        error = _schedule_error(cams.position, cams.rotation, columns[:, 6:], float(tolerance))
+        shared = rdp_joint(frames, columns, error, max_points).indices
+        px, py, pz, rx, ry, rz, fov, focal = joint_column_keys(frames, columns, error, shared)
+        joint_keys = {
+            "translation_x": px, "translation_y": py, "translation_z": pz,
+            "rotation_3d_x": rx, "rotation_3d_y": ry, "rotation_3d_z": rz, "fov": fov,
+            "position.x": px, "position.y": py, "position.z": pz, "focal_length_mm": focal,
+        }
 
-    def mk(series: List[float]) -> str:
-        pts = _series_to_points(series, start)
-        if compact:
-            pts = _compact_points(pts, tolerance, max_points)
+    def mk(name: str, series: List[float]) -> str:
+        if name in joint_keys:
+            values = np.asarray(series, dtype=np.float64)
+            idx = joint_keys[name]
+            pts = [(int(f), float(v)) for f, v in zip(frames[idx].tolist(), values[idx].tolist())]
+            max_errors[name] = max_error(frames, values, idx)
+        else:
+            pts = _series_to_points(series, start)
+            if compact:
+                pts, max_errors[name] = _compact_points(pts, tolerance, max_points)
         return _schedule_from_points(pts, precision=precision)
 
     deforum_fields = {
-        "translation_x": mk(tx),
-        "translation_y": mk(ty),
-        "translation_z": mk(tz),
-        "rotation_3d_x": mk(rxs),
-        "rotation_3d_y": mk(rys),
-        "rotation_3d_z": mk(rzs),
-        "fov": mk(fovs),
+        "translation_x": mk("translation_x", tx),
+        "translation_y": mk("translation_y", ty),
+        "translation_z": mk("translation_z", tz),
+        "rotation_3d_x": mk("rotation_3d_x", rxs),
+        "rotation_3d_y": mk("rotation_3d_y", rys),
+        "rotation_3d_z": mk("rotation_3d_z", rzs),
+        "fov": mk("fov", fovs),
     }
 
     schedules = {
-        "position.x": mk(xs),
-        "position.y": mk(ys),
-        "position.z": mk(zs),
-        "focal_length_mm": mk([c.focal_length_mm for c in cams]),
+        "position.x": mk("position.x", xs),
+        "position.y": mk("position.y", ys),
+        "position.z": mk("position.z", zs),
+        "focal_length_mm": mk("focal_length_mm", focals),
     }
 
-    warnings_list = []
-    
     meta = {
         "schema_version": project.schema_version,
         "project_name": project.meta.name,
@@ -181,6 +225,9 @@ def export_a1111_bundle(
         "end": end,
         "frames": len(cams),
         "resolution": project.meta.resolution,
+        "max_errors": max_errors,
+        "reduce_mode": "joint" if joint_keys else "channel",
+        "warnings": warnings_list,
     }
 
     deforum_preset = {
@@ -215,11 +262,14 @@ def export_a1111_bundle(
         compact=compact,
         tolerance=tolerance,
         max_points=max_points,
+        max_errors=max_errors,
     )
 
 
-def export_comfy_bundle(project: Project, start: int, end: int) -> Dict[str, Any]:
-    csv = export_camera_csv(project, start, end)
+def export_comfy_bundle(
+    project: Project, start: int, end: int, *, rig: Optional[CameraRig] = None, workers: int = 1
+) -> Dict[str, Any]:
+    csv = export_camera_csv(project, start, end, rig=rig, workers=workers)
     return {
         "meta": {"fps": project.meta.fps, "start": start, "end": end, "schema_version": project.schema_version},
         "camera_csv": csv,
@@ -293,14 +343,20 @@ def export_a1111_shots(
     tolerance: float = 0.02,
     max_points: int = 220,
     precision: int = 4,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     cuts = [c for c in _cut_markers(project) if start < c < end]
     boundaries = [start] + cuts + [end]
+    # One evaluation of the whole range; each shot is a slice of it.
+    cams = eval_camera_range_parallel(project, start, end, workers)
     shots: List[Dict[str, Any]] = []
     for i in range(len(boundaries) - 1):
         s = boundaries[i]
         e = boundaries[i + 1]
-        b = export_a1111_bundle(project, s, e, compact=compact, tolerance=tolerance, max_points=max_points, precision=precision)
+        b = export_a1111_bundle(
+            project, s, e, compact=compact, tolerance=tolerance, max_points=max_points, precision=precision,
+            cams=cams[s - start:e - start + 1],
+        )
         shots.append({
             "shot_index": i,
             "meta": {**b.meta, "shot_start": s, "shot_end": e},
@@ -318,11 +374,11 @@ def _merge_shot_override_fields(shot: Any, render_overrides: Dict[str, Any]) ->
     # Mirror typed fields into render_overrides (without overwriting explicit keys)
     ro = dict(render_overrides or {})
     has_prompt_stack = bool(getattr(shot, "prompt_override", None) is not None or getattr(shot, "negative_prompt_override", None) is not None or (getattr(shot, "prompt_layers", None) or []) or (getattr(shot, "style_layers", None) or []) or (getattr(shot, "negative_layers", None) or []))
-        if has_prompt_stack and "prompts" not in ro:
-            # resolved stack will also include global prompts at call site
-            ro["prompts"] = {"base": None, "negative": None}
+    if has_prompt_stack and "prompts" not in ro:
+        # resolved stack will also include global prompts at call site
+        ro["prompts"] = {"base": None, "negative": None}
 
-        if getattr(shot, "prompt_override", None) is not None and "prompts" in ro:
+    if getattr(shot, "prompt_override", None) is not None and "prompts" in ro:
         ro["prompts"] = {"base": str(getattr(shot, "prompt_override")), "negative": None}
     if getattr(shot, "negative_prompt_override", None) is not None:
         if "prompts" not in ro:
@@ -385,7 +441,7 @@ def export_render_plan(project: Project, start: int, end: int, overlap_strategy:
     # Provide a simple ffmpeg recipe (placeholder-free but generic paths)
     ffmpeg = {
         "note": "This is a generic recipe. Replace input patterns with your rendered sequences.",
-        "example_dissolve": "ffmpeg -y -i shotA_%05d.png -i shotB_%05d.png -filter_complex "[0:v][1:v]xfade=transition=fade:duration=0.4:offset=3.0" out.mp4"
+        "example_dissolve": 'ffmpeg -y -i shotA_%05d.png -i shotB_%05d.png -filter_complex "[0:v][1:v]xfade=transition=fade:duration=0.4:offset=3.0" out.mp4'
     }
 
     return {
@@ -439,83 +495,76 @@ def _resolve_prompt_stack(global_base: str, global_neg: str, shot: Any) -> Dict[
     return {"base": base, "negative": neg}
 
 
-    def write_ffmpeg_scripts(plan: Dict[str, Any], out_dir: str) -> Dict[str, str]:
-        """Write .sh and .bat scripts to assemble shots with dissolves using xfade.
-
-        Assumptions:
-        - Each shot is rendered to an mp4 named shot_00.mp4, shot_01.mp4, ...
-        - All shots share fps, resolution, and codec compatibility.
-
-        This is a best-effort helper; users can adapt it to their pipeline.
-        """
-        import os
-        from pathlib import Path
-
-        outp = Path(out_dir)
-        outp.mkdir(parents=True, exist_ok=True)
-
-        fps = float(plan.get("meta", {}).get("fps", 30))
-        shots = plan.get("shots", [])
-        transitions = plan.get("transitions", [])
-
-        # Build xfade chain command
-        # offset is in seconds from start of first input stream
-        # We approximate shot durations by frame counts, and dissolve duration by frames.
-        def shot_duration_sec(i):
-            sh = shots[i]
-            return (int(sh["end"]) - int(sh["start"]) + 1) / fps
-
-        # Create filtergraph
-        filter_lines = []
-        inputs = []
-        for i in range(len(shots)):
-            inputs.append(f"-i shot_{i:02d}.mp4")
-
-        cur_label = "[0:v]"
-        time_cursor = shot_duration_sec(0)
-        for i in range(len(shots) - 1):
-            # default hard cut
-            tr = None
-            for t in transitions:
-                if int(t.get("tail", {}).get("shot_index", -1)) == i and int(t.get("head", {}).get("shot_index", -2)) == i+1:
-                    tr = t
-                    break
-
-            next_label = f"[{i+1}:v]"
-            out_label = f"[v{i+1}]"
-            if tr and tr.get("type") == "dissolve":
-                d_frames = int(tr.get("duration_frames", 0) or 0)
-                d = d_frames / fps
-                # xfade offset is when the transition starts in the current stream timeline
-                # start at time_cursor - d
-                offset = max(0.0, time_cursor - d)
-                filter_lines.append(f"{cur_label}{next_label}xfade=transition=fade:duration={d:.6f}:offset={offset:.6f}{out_label}")
-                # new cursor: add next duration, but subtract overlap d
-                time_cursor = time_cursor + shot_duration_sec(i+1) - d
-                cur_label = out_label
-            else:
-                # hard cut: concat filter on video-only by trimming? easiest: use concat demuxer; but we keep xfade chain:
-                # use xfade with duration 0
-                filter_lines.append(f"{cur_label}{next_label}xfade=transition=fade:duration=0:offset={time_cursor:.6f}{out_label}")
-                time_cursor = time_cursor + shot_duration_sec(i+1)
-                cur_label = out_label
-
-        filter_complex = ";".join(filter_lines)
-        sh_cmd = f"ffmpeg -y {' '.join(inputs)} -filter_complex "{filter_complex}" -map {cur_label} -c:v libx264 -pix_fmt yuv420p out.mp4"
-
-        sh_script = "#!/usr/bin/env bash
-set -e
-" + sh_cmd + "
-"
-        bat_script = "@echo off
-" + sh_cmd.replace(""", "\"") + "
-"
-
-        sh_path = outp / "assemble.sh"
-        bat_path = outp / "assemble.bat"
-        sh_path.write_text(sh_script, encoding="utf-8", newline="
-")
-        bat_path.write_text(bat_script, encoding="utf-8", newline="
-")
-
-        return {"assemble_sh": str(sh_path), "assemble_bat": str(bat_path)}
+def write_ffmpeg_scripts(plan: Dict[str, Any], out_dir: str) -> Dict[str, str]:
+    """Write .sh and .bat scripts to assemble shots with dissolves using xfade.
+
+    Assumptions:
+    - Each shot is rendered to an mp4 named shot_00.mp4, shot_01.mp4, ...
+    - All shots share fps, resolution, and codec compatibility.
+
+    This is a best-effort helper; users can adapt it to their pipeline.
+    """
+    import os
+    from pathlib import Path
+
+    outp = Path(out_dir)
+    outp.mkdir(parents=True, exist_ok=True)
+
+    fps = float(plan.get("meta", {}).get("fps", 30))
+    shots = plan.get("shots", [])
+    transitions = plan.get("transitions", [])
+
+    # Build xfade chain command
+    # offset is in seconds from start of first input stream
+    # We approximate shot durations by frame counts, and dissolve duration by frames.
+    def shot_duration_sec(i):
+        sh = shots[i]
+        return (int(sh["end"]) - int(sh["start"]) + 1) / fps
+
+    # Create filtergraph
+    filter_lines = []
+    inputs = []
+    for i in range(len(shots)):
+        inputs.append(f"-i shot_{i:02d}.mp4")
+
+    cur_label = "[0:v]"
+    time_cursor = shot_duration_sec(0)
+    for i in range(len(shots) - 1):
+        # default hard cut
+        tr = None
+        for t in transitions:
+            if int(t.get("tail", {}).get("shot_index", -1)) == i and int(t.get("head", {}).get("shot_index", -2)) == i+1:
+                tr = t
+                break
+
+        next_label = f"[{i+1}:v]"
+        out_label = f"[v{i+1}]"
+        if tr and tr.get("type") == "dissolve":
+            d_frames = int(tr.get("duration_frames", 0) or 0)
+            d = d_frames / fps
+            # xfade offset is when the transition starts in the current stream timeline
+            # start at time_cursor - d
+            offset = max(0.0, time_cursor - d)
+            filter_lines.append(f"{cur_label}{next_label}xfade=transition=fade:duration={d:.6f}:offset={offset:.6f}{out_label}")
+            # new cursor: add next duration, but subtract overlap d
+            time_cursor = time_cursor + shot_duration_sec(i+1) - d
+            cur_label = out_label
+        else:
+            # hard cut: concat filter on video-only by trimming? easiest: use concat demuxer; but we keep xfade chain:
+            # use xfade with duration 0
+            filter_lines.append(f"{cur_label}{next_label}xfade=transition=fade:duration=0:offset={time_cursor:.6f}{out_label}")
+            time_cursor = time_cursor + shot_duration_sec(i+1)
+            cur_label = out_label
+
+    filter_complex = ";".join(filter_lines)
+    sh_cmd = f'ffmpeg -y {" ".join(inputs)} -filter_complex "{filter_complex}" -map {cur_label} -c:v libx264 -pix_fmt yuv420p out.mp4'
+
+    sh_script = "#!/usr/bin/env bash\nset -e\n" + sh_cmd + "\n"
+    bat_script = "@echo off\n" + sh_cmd.replace('"', '\\"') + "\n"
+
+    sh_path = outp / "assemble.sh"
+    bat_path = outp / "assemble.bat"
+    sh_path.write_text(sh_script, encoding="utf-8", newline="\n")
+    bat_path.write_text(bat_script, encoding="utf-8", newline="\n")
+
+    return {"assemble_sh": str(sh_path), "assemble_bat": str(bat_path)}
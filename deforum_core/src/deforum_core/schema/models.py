@@ -65,10 +65,19 @@ class NullObject(BaseModel):
     position: Tuple[float, float, float] = (0.0, 0.0, 0.0)
 
 
+class BezierSegment(BaseModel):
+    p0: Tuple[float, float, float]
+    p1: Tuple[float, float, float]
+    p2: Tuple[float, float, float]
+    p3: Tuple[float, float, float]
+
+
 class SplineObject(BaseModel):
-    type: Literal["CatmullRomSpline"] = "CatmullRomSpline"
+    type: Literal["CatmullRomSpline", "BezierSpline"] = "CatmullRomSpline"
     points: List[Tuple[float, float, float]] = Field(default_factory=list)
     closed: bool = False
+    # BezierSpline only: cubic segments, traversed in order.
+    segments: List[BezierSegment] = Field(default_factory=list)
 
 
 class TimelineObjects(BaseModel):
@@ -133,6 +142,9 @@ class CameraConstraints(BaseModel):
     # v15: prefer focal-length constraints (mm/frame). Keep legacy field name for older projects.
     max_speed_focal_mm: float = Field(default=2.0, ge=0.0, description="Max focal length speed (mm per frame)")
     smoothing_window: int = Field(default=0, ge=0, description="Moving average window (0 disables)")
+    smoothing_kernel: Literal["trailing", "centered", "gaussian"] = Field(
+        default="trailing", description="Smoothing window shape (gaussian spans +-3 sigma over the window)"
+    )
     sample_step: int = Field(default=1, ge=1, description="Sampling step in frames for baking/export paths")
 
 
@@ -1,12 +1,19 @@
 from __future__ import annotations
 
-from typing import Dict, List
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Sequence, Tuple, Union
+
+import numpy as np
 
 from deforum_core.schema.models import Channel, Project, Track
-from deforum_core.timeline.curves import eval_keyframes
+from deforum_core.timeline.curves import CompiledChannel, eval_keyframes, eval_keyframes_array
+
+AnyChannel = Union[Channel, CompiledChannel]
 
 
-def eval_channel(channel: Channel, frame: int, default: float = 0.0) -> float:
+def eval_channel(channel: AnyChannel, frame: int, default: float = 0.0) -> float:
+    if isinstance(channel, CompiledChannel):
+        return channel.eval(frame, default=default)
     if channel.keys:
         return eval_keyframes(channel.keys, frame, default=default)
     if channel.value is not None:
@@ -14,6 +21,15 @@ def eval_channel(channel: Channel, frame: int, default: float = 0.0) -> float:
     return float(default)
 
 
+def eval_channel_array(channel: AnyChannel, frames, default: float = 0.0) -> np.ndarray:
+    if isinstance(channel, CompiledChannel):
+        return channel.eval_array(frames, default=default)
+    if channel.keys:
+        return eval_keyframes_array(channel.keys, frames, default=default)
+    value = channel.value if channel.value is not None else default
+    return np.full(np.shape(frames), float(value))
+
+
 def eval_track(track: Track, frame: int) -> Dict[str, float]:
     out: Dict[str, float] = {}
     for name, ch in track.channels.items():
@@ -21,6 +37,13 @@ def eval_track(track: Track, frame: int) -> Dict[str, float]:
     return out
 
 
+def eval_track_array(track: Track, frames) -> Dict[str, np.ndarray]:
+    out: Dict[str, np.ndarray] = {}
+    for name, ch in track.channels.items():
+        out[name] = eval_channel_array(ch, frames, default=0.0)
+    return out
+
+
 def eval_tracks(tracks: List[Track], frame: int) -> Dict[str, float]:
     merged: Dict[str, float] = {}
     for tr in tracks:
@@ -28,6 +51,77 @@ def eval_tracks(tracks: List[Track], frame: int) -> Dict[str, float]:
     return merged
 
 
+def eval_tracks_array(tracks: List[Track], frames) -> Dict[str, np.ndarray]:
+    merged: Dict[str, np.ndarray] = {}
+    for tr in tracks:
+        merged.update(eval_track_array(tr, frames))
+    return merged
+
+
+@dataclass(frozen=True)
+class TrackColumns:
+    """Channel values for a frame range, one row per channel.
+
+    ``data[index[name]]`` is the column for ``name``; resolve a name once with `column`/`vec`
+    and index the returned arrays per frame.
+    """
+
+    frames: np.ndarray
+    index: Dict[str, int]
+    data: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.frames.shape[0])
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def column(self, name: str, default: float) -> np.ndarray:
+        i = self.index.get(name)
+        if i is None:
+            return np.full(len(self), float(default))
+        return self.data[i]
+
+    def vec(self, prefix: str, default: Tuple[float, float, float]) -> np.ndarray:
+        """(N, 3) array from the ``{prefix}.x/.y/.z`` columns."""
+        return np.stack([
+            self.column(f"{prefix}.x", default[0]),
+            self.column(f"{prefix}.y", default[1]),
+            self.column(f"{prefix}.z", default[2]),
+        ], axis=1)
+
+    def row(self, i: int) -> Dict[str, float]:
+        return {name: float(self.data[c, i]) for name, c in self.index.items()}
+
+
+TrackLike = Union[Track, Mapping[str, AnyChannel]]
+
+
+def _channels_of(track: TrackLike) -> Mapping[str, AnyChannel]:
+    return track.channels if isinstance(track, Track) else track
+
+
+def eval_tracks_columns(tracks: Sequence[TrackLike], frames) -> TrackColumns:
+    """Columnar `eval_tracks`: later tracks override earlier channels of the same name."""
+    fr = np.atleast_1d(np.asarray(frames)).ravel()
+    index: Dict[str, int] = {}
+    rows: List[np.ndarray] = []
+    for tr in tracks:
+        for name, ch in _channels_of(tr).items():
+            col = eval_channel_array(ch, fr, default=0.0)
+            if name in index:
+                rows[index[name]] = col
+            else:
+                index[name] = len(rows)
+                rows.append(col)
+    data = np.stack(rows) if rows else np.zeros((0, fr.shape[0]))
+    return TrackColumns(frames=fr, index=index, data=data)
+
+
+def eval_track_columns(track: TrackLike, frames) -> TrackColumns:
+    return eval_tracks_columns([track], frames)
+
+
 def build_tracks(project: Project) -> List[Track]:
     tl = project.timeline
     raw_tracks = getattr(tl, 'tracks', []) if tl is not None else []
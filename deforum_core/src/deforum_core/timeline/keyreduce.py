@@ -0,0 +1,388 @@
+"""Key reduction for sampled channels.
+
+Ramer–Douglas–Peucker over a (time, value) series, shared by baking and export. It works on index
+ranges kept in arrays (no list slicing, no recursion limit on long bakes): each pass measures
+every open range at once with NumPy and splits those whose farthest sample exceeds the tolerance.
+
+`rdp_budget` is the max-points variant: it splits the worst range first and stops at the point
+budget, reporting the error it reached. `rdp_joint` reduces several columns to one shared set of
+key times under an error measured over the whole group.
+
+Distance metrics:
+- perpendicular: distance to the chord in the (time, value) plane (the historical behaviour)
+- vertical: |value - chord value at that time|, i.e. the error linear keys actually make
+"""
+from __future__ import annotations
+
+import heapq
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+RDP_METRICS = ("perpendicular", "vertical")
+
+
+def _chord_distances(t: np.ndarray, v: np.ndarray, i: np.ndarray, lo: np.ndarray, hi: np.ndarray, metric: str) -> np.ndarray:
+    """Distances of samples ``i`` from the chords (t[lo], v[lo]) -> (t[hi], v[hi]) of their ranges."""
+    x1, y1, x2, y2 = t[lo], v[lo], t[hi], v[hi]
+    dx = x2 - x1
+    dy = y2 - y1
+    ti = t[i]
+    vi = v[i]
+    if metric == "vertical":
+        slope = np.divide(dy, dx, out=np.zeros_like(dy), where=dx != 0.0)
+        return np.abs(vi - (y1 + (ti - x1) * slope))
+    denom = np.sqrt(dx * dx + dy * dy)
+    flat = denom < 1e-12
+    d = np.abs(dy * ti - dx * vi + x2 * y1 - y2 * x1) / np.where(flat, 1.0, denom)
+    if flat.any():
+        d[flat] = np.hypot(ti - x1, vi - y1)[flat]
+    return d
+
+
+# Distances of samples ``i`` from the reconstruction between kept samples ``lo`` and ``hi`` (arrays).
+RangeDistance = Callable[[np.ndarray, np.ndarray, np.ndarray], np.ndarray]
+# Joint error of samples ``i`` given their (M, D) linear reconstruction, in tolerance units.
+JointError = Callable[[np.ndarray, np.ndarray], np.ndarray]
+
+
+def _split_levels(n: int, dist: RangeDistance, eps: float) -> np.ndarray:
+    """Level-synchronous Douglas–Peucker over ``n`` samples; returns the kept indices."""
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    lo = np.array([0])
+    hi = np.array([n - 1])
+    while len(lo):
+        # Interior samples of every open range, range by range, plus the range each belongs to.
+        counts = hi - lo - 1
+        starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+        r = np.repeat(np.arange(len(lo)), counts)
+        i = np.arange(int(counts.sum())) - starts[r] + lo[r] + 1
+        d = dist(i, lo[r], hi[r])
+        dmax = np.maximum.reduceat(d, starts)
+        hit = np.flatnonzero(d == dmax[r])
+        _, first = np.unique(r[hit], return_index=True)
+        mid = i[hit[first]]
+        split = dmax > eps
+        mid, lo, hi = mid[split], lo[split], hi[split]
+        keep[mid] = True
+        lo, hi = np.concatenate([lo, mid]), np.concatenate([mid, hi])
+        open_ = hi - lo >= 2
+        lo, hi = lo[open_], hi[open_]
+    return np.flatnonzero(keep)
+
+
+def _split_best_first(n: int, dist: RangeDistance, eps: float, max_points: int) -> Reduction:
+    """Douglas–Peucker splitting the worst range first, up to ``max_points`` kept samples."""
+    heap: List[Tuple[float, int, int, int]] = []
+
+    def push(lo: int, hi: int) -> None:
+        if hi - lo < 2:
+            return
+        i = np.arange(lo + 1, hi)
+        d = dist(i, np.full(len(i), lo), np.full(len(i), hi))
+        k = int(np.argmax(d))
+        heapq.heappush(heap, (-float(d[k]), lo, hi, lo + 1 + k))
+
+    keep = [0, n - 1]
+    push(0, n - 1)
+    while heap and len(keep) < max_points and -heap[0][0] > eps:
+        _, lo, hi, mid = heapq.heappop(heap)
+        keep.append(mid)
+        push(lo, mid)
+        push(mid, hi)
+    return Reduction(np.array(sorted(keep)), -heap[0][0] if heap else 0.0)
+
+
+def _max_distance(n: int, idx: np.ndarray, dist: RangeDistance) -> float:
+    if len(idx) < 2 or n <= 2:
+        return 0.0
+    i = np.arange(n)
+    seg = np.clip(np.searchsorted(idx, i, side="right") - 1, 0, len(idx) - 2)
+    return float(np.max(dist(i, idx[seg], idx[seg + 1])))
+
+
+def _check_metric(metric: str) -> None:
+    if metric not in RDP_METRICS:
+        raise ValueError(f"Unknown RDP metric {metric!r}; expected one of {RDP_METRICS}")
+
+
+def rdp_indices(times, values, epsilon: float, metric: str = "perpendicular") -> np.ndarray:
+    """Sorted indices of the samples Douglas–Peucker keeps at tolerance ``epsilon``.
+
+    The first and last samples are always kept; a range is split at its farthest sample (the first
+    one on ties) while that distance exceeds ``epsilon``. All open ranges of one tree level are
+    measured together in a single vectorized pass, so the Python-level work is per level rather
+    than per range.
+    """
+    _check_metric(metric)
+    t = np.asarray(times, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64)
+    n = len(v)
+    if n <= 2:
+        return np.arange(n)
+    return _split_levels(n, lambda i, lo, hi: _chord_distances(t, v, i, lo, hi, metric), float(epsilon))
+
+
+def rdp_points(points: Sequence[Tuple[float, float]], epsilon: float, metric: str = "perpendicular") -> List[Tuple[float, float]]:
+    """`rdp_indices` on a list of (time, value) pairs; returns the kept pairs."""
+    if len(points) <= 2:
+        return list(points)
+    arr = np.asarray(points, dtype=np.float64)
+    return [points[i] for i in rdp_indices(arr[:, 0], arr[:, 1], epsilon, metric).tolist()]
+
+
+def max_error(times, values, indices, metric: str = "vertical") -> float:
+    """Largest distance of any sample from the chord between the kept samples around it."""
+    t = np.asarray(times, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64)
+    idx = np.asarray(indices, dtype=np.intp)
+    return _max_distance(len(v), idx, lambda i, lo, hi: _chord_distances(t, v, i, lo, hi, metric))
+
+
+class Reduction(NamedTuple):
+    indices: np.ndarray
+    # Largest distance (in the reduction's metric) of any dropped sample from its chord.
+    max_error: float
+
+
+def rdp_budget(
+    times, values, max_points: int, epsilon: float = 0.0, metric: str = "vertical"
+) -> Reduction:
+    """Best-first Douglas–Peucker under a point budget, in one pass.
+
+    Ranges sit in a heap keyed by their farthest sample; the worst one is split until every range
+    is within ``epsilon`` or ``max_points`` samples are kept. Without the budget this keeps the same
+    samples as `rdp_indices`; with it, the budget goes to the largest errors and the ends always
+    stay.
+    """
+    _check_metric(metric)
+    t = np.asarray(times, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64)
+    n = len(v)
+    if n <= 2:
+        return Reduction(np.arange(n), 0.0)
+    max_points = max(2, int(max_points))
+    eps = float(epsilon)
+    # Budgets that do not bind are common; the level-wise pass is cheaper than the heap for them.
+    idx = rdp_indices(t, v, eps, metric)
+    if len(idx) <= max_points:
+        return Reduction(idx, max_error(t, v, idx, metric))
+    return _split_best_first(n, lambda i, lo, hi: _chord_distances(t, v, i, lo, hi, metric), eps, max_points)
+
+
+def rdp_joint(times, values, error: JointError, max_points: Optional[int] = None) -> Reduction:
+    """One shared set of kept samples for all columns of ``values`` (N, D).
+
+    A dropped sample is reconstructed by interpolating every column linearly between the kept
+    samples around it, and ``error(i, approx)`` scores samples ``i`` against that (M, D)
+    reconstruction in tolerance units, so a range is split at its worst sample while the score
+    exceeds 1. The error can therefore be any per-sample measure over the whole group (a 3D
+    distance, an angle, the worst of several), not just a per-column one. ``max_points`` caps the
+    kept samples (splitting the worst range first); ``max_error`` is the worst score reached.
+    """
+    t = np.asarray(times, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64).reshape(len(t), -1)
+    n = len(v)
+    if n <= 2:
+        return Reduction(np.arange(n), 0.0)
+
+    def dist(i: np.ndarray, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        dt = t[hi] - t[lo]
+        w = np.divide(t[i] - t[lo], dt, out=np.zeros_like(dt), where=dt != 0.0)[:, None]
+        return np.asarray(error(i, v[lo] + w * (v[hi] - v[lo])), dtype=np.float64)
+
+    idx = _split_levels(n, dist, 1.0)
+    if max_points is None or len(idx) <= max(2, int(max_points)):
+        return Reduction(idx, _max_distance(n, idx, dist))
+    return _split_best_first(n, dist, 1.0, max(2, int(max_points)))
+
+
+def joint_column_keys(times, values, error: JointError, shared) -> List[np.ndarray]:
+    """Per column of ``values`` (N, D), the indices of the ``shared`` set it keeps.
+
+    Walking each column's interior keys in order, a key is dropped when interpolating that column
+    across it keeps the joint ``error`` of every sample in between within 1 (with the other columns
+    as already reduced). So every key stays on a shared frame and the joint bound still holds, but
+    a column that moves little (or linearly) keeps only the keys it needs.
+    """
+    t = np.asarray(times, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64).reshape(len(t), -1)
+    idx = np.asarray(shared, dtype=np.intp)
+    # Start from the shared reconstruction, so unvisited columns count with their full error.
+    recon = np.column_stack([np.interp(t, t[idx], v[idx, c]) for c in range(v.shape[1])]) if len(idx) else v.copy()
+    out: List[np.ndarray] = []
+    for c in range(v.shape[1]):
+        kept = [int(idx[0])] if len(idx) else []
+        for m in range(1, len(idx) - 1):
+            lo, hi = kept[-1], int(idx[m + 1])
+            i = np.arange(lo + 1, hi)
+            line = v[lo, c] + (t[i] - t[lo]) / (t[hi] - t[lo]) * (v[hi, c] - v[lo, c])
+            # Only samples whose value moves need scoring; the rest keep their (accepted) error.
+            moved = line != recon[i, c]
+            trial = recon[i[moved]]
+            trial[:, c] = line[moved]
+            if not len(trial) or np.all(error(i[moved], trial) <= 1.0):
+                recon[i, c] = line
+            else:
+                kept.append(int(idx[m]))
+        if len(idx) > 1:
+            kept.append(int(idx[-1]))
+        out.append(np.array(kept, dtype=np.intp))
+    return out
+
+
+# Bezier fitting: refits per segment before splitting, and how far off a fit may be and still be
+# worth refitting rather than splitting (as a multiple of the tolerance).
+BEZIER_FIT_ITERS = 4
+BEZIER_REFIT_FACTOR = 4.0
+
+
+class BezierKeys(NamedTuple):
+    indices: np.ndarray
+    # Per kept sample, in Keyframe tangent units: (dt, dv) with dt a fraction of the segment.
+    in_tan: np.ndarray
+    out_tan: np.ndarray
+
+
+def _bezier(s: np.ndarray, p0, p1, p2, p3) -> np.ndarray:
+    r = 1.0 - s
+    return r * r * r * p0 + 3.0 * r * r * s * p1 + 3.0 * r * s * s * p2 + s * s * s * p3
+
+
+def _solve_time(u: np.ndarray, x1: float, x2: float, iters: int = 24) -> np.ndarray:
+    """Vectorized `curves._solve_bezier_time`: bisection for x(s) = u."""
+    # x(s) in power form, evaluated by Horner: the bisection's inner loop is most of a fit.
+    c1 = 3.0 * x1
+    c2 = 3.0 * x2 - 6.0 * x1
+    c3 = 1.0 + 3.0 * x1 - 3.0 * x2
+    lo = np.zeros_like(u)
+    hi = np.ones_like(u)
+    for _ in range(iters):
+        mid = (lo + hi) * 0.5
+        below = ((c3 * mid + c2) * mid + c1) * mid < u
+        lo = np.where(below, mid, lo)
+        hi = np.where(below, hi, mid)
+    return (lo + hi) * 0.5
+
+
+def _slopes(t: np.ndarray, v: np.ndarray, tol: float) -> Tuple[np.ndarray, np.ndarray]:
+    """(incoming, outgoing) tangent slope at every sample.
+
+    Smooth samples share the central difference. Where the one-sided slopes disagree by more than
+    the tolerance over one step (a corner, e.g. between linear keys), each side keeps its own.
+    """
+    dt = np.diff(t)
+    step = np.diff(v) / dt
+    back = np.concatenate([step[:1], step])
+    fwd = np.concatenate([step, step[-1:]])
+    m_in = back.copy()
+    m_out = fwd.copy()
+    if len(v) > 2:
+        central = (v[2:] - v[:-2]) / (t[2:] - t[:-2])
+        corner = np.abs(step[1:] - step[:-1]) * np.minimum(dt[:-1], dt[1:]) > tol
+        m_in[1:-1] = np.where(corner, step[:-1], central)
+        m_out[1:-1] = np.where(corner, step[1:], central)
+    return m_in, m_out
+
+
+def _fit_segments(t, v, lo, hi, m0, m1, max_error):
+    """Schneider-style fit of bezier key segments over samples lo..hi with fixed end slopes.
+
+    The handles lie along the end tangents, so neighbouring segments join smoothly; their lengths
+    come from least squares over the samples, alternating with re-solving each sample's curve
+    parameter from its time (which is what evaluation does). All segments are fitted together,
+    sample arrays concatenated and per-segment sums reduced with ``reduceat``; a segment stops
+    refitting once it is within tolerance or too far off to be worth it. Returns per-segment
+    (a0, a1, worst, error) with handle lengths a0/a1 as fractions of the segment.
+    """
+    counts = hi - lo + 1
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    r = np.repeat(np.arange(len(lo)), counts)
+    idx = np.arange(int(counts.sum())) - starts[r] + lo[r]
+    h = t[hi] - t[lo]
+    u = (t[idx] - t[lo][r]) / h[r]
+    y = v[idx]
+    y0, y3 = v[lo][r], v[hi][r]
+    d0 = (m0 * h)[r]
+    d1 = (m1 * h)[r]
+    # Fit in a space where time and value spans are comparable.
+    ptp = np.maximum.reduceat(y, starts) - np.minimum.reduceat(y, starts)
+    scale = np.maximum.reduce([ptp, np.abs(m0 * h), np.abs(m1 * h), np.full(len(lo), 1e-12)])[r]
+    s = u.copy()
+    a0 = np.full(len(lo), 1.0 / 3.0)
+    a1 = a0.copy()
+    err = np.zeros_like(u)
+    active = np.ones(len(lo), dtype=bool)
+    for _ in range(BEZIER_FIT_ITERS):
+        q = 1.0 - s
+        b0, b1, b2, b3 = q * q * q, 3.0 * q * q * s, 3.0 * q * s * s, s * s * s
+        # Residual after the fixed end points, and each handle's contribution per unit length.
+        rx = u - (b2 + b3)
+        ry = (y - y0 * (b0 + b1) - y3 * (b2 + b3)) / scale
+        ax0, ay0 = b1, b1 * d0 / scale
+        ax1, ay1 = -b2, -b2 * d1 / scale
+        c00 = np.add.reduceat(ax0 * ax0 + ay0 * ay0, starts)
+        c01 = np.add.reduceat(ax0 * ax1 + ay0 * ay1, starts)
+        c11 = np.add.reduceat(ax1 * ax1 + ay1 * ay1, starts)
+        x0 = np.add.reduceat(rx * ax0 + ry * ay0, starts)
+        x1 = np.add.reduceat(rx * ax1 + ry * ay1, starts)
+        det = c00 * c11 - c01 * c01
+        solved = active & (np.abs(det) > 1e-12)
+        safe = np.where(solved, det, 1.0)
+        a0 = np.where(solved, (x0 * c11 - x1 * c01) / safe, a0)
+        a1 = np.where(solved, (c00 * x1 - c01 * x0) / safe, a1)
+        bad = active & ~((a0 >= 1e-3) & (a0 <= 1.0) & (a1 >= 1e-3) & (a1 <= 1.0))
+        a0[bad] = a1[bad] = 1.0 / 3.0
+        # The time solve dominates, so only samples of segments still refitting get one.
+        f = np.flatnonzero(active[r])
+        ar0, ar1 = a0[r[f]], a1[r[f]]
+        s[f] = _solve_time(u[f], ar0, 1.0 - ar1)
+        err[f] = np.abs(_bezier(s[f], y0[f], y0[f] + ar0 * d0[f], y3[f] - ar1 * d1[f], y3[f]) - y[f])
+        emax = np.maximum.reduceat(err, starts)
+        active &= (emax > max_error) & (emax <= BEZIER_REFIT_FACTOR * max_error)
+        if not active.any():
+            break
+    emax = np.maximum.reduceat(err, starts)
+    hit = np.flatnonzero(err == emax[r])
+    _, first = np.unique(r[hit], return_index=True)
+    return a0, a1, idx[hit[first]], emax
+
+
+def fit_bezier_keys(times, values, max_error: float) -> BezierKeys:
+    """Bezier keys (with tangents) that reproduce the samples within ``max_error``.
+
+    Segments are fitted with `_fit_segments` and split at their worst sample until every one is
+    within tolerance (two-sample segments always are). Like `rdp_indices`, all open segments of
+    one split level are fitted in a single vectorized pass. Tangent slopes come from the samples
+    around each key, so the curve is smooth across keys except at corners in the data.
+    """
+    t = np.asarray(times, dtype=np.float64)
+    v = np.asarray(values, dtype=np.float64)
+    n = len(v)
+    if n == 0:
+        return BezierKeys(np.arange(0), np.zeros((0, 2)), np.zeros((0, 2)))
+    in_tan = np.zeros((n, 2))
+    out_tan = np.zeros((n, 2))
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    if n == 1:
+        return BezierKeys(np.flatnonzero(keep), in_tan[:1], out_tan[:1])
+    tol = max(0.0, float(max_error))
+    m_in, m_out = _slopes(t, v, tol)
+    lo = np.array([0])
+    hi = np.array([n - 1])
+    while len(lo):
+        m0, m1 = m_out[lo], m_in[hi]
+        a0, a1, worst, err = _fit_segments(t, v, lo, hi, m0, m1, tol)
+        split = (err > tol) & (hi - lo >= 2)
+        done = ~split
+        h = (t[hi] - t[lo])[done]
+        out_tan[lo[done]] = np.column_stack([a0[done], a0[done] * m0[done] * h])
+        in_tan[hi[done]] = np.column_stack([-a1[done], -a1[done] * m1[done] * h])
+        lo, hi, worst = lo[split], hi[split], worst[split]
+        k = np.where((lo < worst) & (worst < hi), worst, (lo + hi) // 2)
+        keep[k] = True
+        lo, hi = np.concatenate([lo, k]), np.concatenate([k, hi])
+    idx = np.flatnonzero(keep)
+    return BezierKeys(idx, in_tan[idx], out_tan[idx])
@@ -0,0 +1,61 @@
+import math
+
+import numpy as np
+import pytest
+
+from deforum_core.camera.modifiers import aim_spring_apply, aim_spring_scan, aim_spring_transition
+
+
+def _targets(n=1000, seed=4):
+    rng = np.random.default_rng(seed)
+    return np.cumsum(rng.normal(scale=0.2, size=(n, 3)), axis=0)
+
+
+def test_euler_scan_matches_reference_loop():
+    tg = _targets()
+    ref = np.array(aim_spring_apply([tuple(t) for t in tg.tolist()], dt=1 / 24, stiffness=9.0, damping=0.7))
+    out, _ = aim_spring_scan(np.arange(len(tg)), tg, dt=1 / 24, stiffness=9.0, damping=0.7)
+    assert np.allclose(out, ref, rtol=0.0, atol=1e-9 * (1 + np.abs(ref).max()))
+
+
+@pytest.mark.parametrize("integrator", ["euler", "exact"])
+def test_chunking_is_bit_identical(integrator):
+    tg = _targets()
+    frames = np.arange(len(tg))
+    whole, _ = aim_spring_scan(frames, tg, dt=1 / 30, stiffness=12.0, damping=0.5, integrator=integrator)
+    cuts = [0, 1, 5, 255, 256, 300, 700, 999, 1000]
+    state, parts = None, []
+    for lo, hi in zip(cuts[:-1], cuts[1:]):
+        out, state = aim_spring_scan(frames[lo:hi], tg[lo:hi], dt=1 / 30, stiffness=12.0, damping=0.5, integrator=integrator, state=state)
+        parts.append(out)
+    assert np.array_equal(np.concatenate(parts), whole)
+
+
+@pytest.mark.parametrize("z", [0.3, 1.0, 2.5])
+def test_exact_matches_analytic_step_response(z):
+    w, dt, n = 10.0, 1 / 24, 96
+    tg = np.zeros((n, 3))
+    tg[:, 0] = 1.0
+    tg[0, 0] = 0.0  # start at rest on 0, then hold the target at 1
+    out, _ = aim_spring_scan(np.arange(n), tg, dt=dt, stiffness=w, damping=z, integrator="exact")
+    t = dt * np.arange(1, n)
+    if z < 1:
+        wd = w * math.sqrt(1 - z * z)
+        ref = 1 - np.exp(-z * w * t) * (np.cos(wd * t) + z * w / wd * np.sin(wd * t))
+    elif z == 1:
+        ref = 1 - np.exp(-w * t) * (1 + w * t)
+    else:
+        r1, r2 = -z * w + w * math.sqrt(z * z - 1), -z * w - w * math.sqrt(z * z - 1)
+        ref = 1 + (r2 * np.exp(r1 * t) - r1 * np.exp(r2 * t)) / (r1 - r2)
+    assert np.allclose(out[1:, 0], ref, atol=1e-12)
+
+
+def test_exact_is_stable_for_stiff_springs():
+    tg = _targets(500)
+    out, _ = aim_spring_scan(np.arange(500), tg, dt=1 / 24, stiffness=5000.0, damping=0.9, integrator="exact")
+    assert np.all(np.isfinite(out))
+    assert np.abs(out[1:] - tg[1:]).max() < 1e-6
+    phi, _ = aim_spring_transition(1 / 24, stiffness=1e6, damping=50.0, integrator="exact")
+    assert np.all(np.isfinite(phi)) and np.abs(np.linalg.eigvals(phi)).max() < 1.0
+    with pytest.raises(ValueError):
+        aim_spring_transition(1 / 24, integrator="rk4")
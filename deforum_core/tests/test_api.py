@@ -9,3 +9,71 @@ def test_health():
     r = c.get("/health")
     assert r.status_code == 200
     assert r.json()["status"] == "ok"
+
+
+def test_evaluate_frame_reuses_prepared_rig():
+    project = {
+        "meta": {"name": "t", "fps": 24, "frames": 10},
+        "timeline": {"tracks": [{"id": "camera.transform", "channels": {"position.x": {"keys": [{"t": 0, "v": 0}, {"t": 9, "v": 9}]}}}]},
+    }
+    c = TestClient(create_app())
+    a = c.post("/evaluate/frame", json={"project": project, "frame": 3}).json()
+    b = c.post("/evaluate/frame", json={"project": project, "frame": 3}).json()
+    assert a == b
+    r = c.post("/evaluate/range", json={"project": project, "start": 0, "end": 9}).json()
+    assert r["frames"][3]["position"] == a["position"]
+    assert c.post("/evaluate/frame", json={"frame": 0}).status_code == 400
+
+
+def test_evaluate_frame_scopes_revision_to_the_project():
+    def project(name, x):
+        return {
+            "meta": {"name": name, "fps": 24, "frames": 10},
+            "timeline": {"tracks": [{"id": "camera.transform", "channels": {"position.x": {"keys": [{"t": 0, "v": x}]}}}]},
+        }
+
+    c = TestClient(create_app())
+    # Projects sharing a revision string never see each other's rig.
+    for p, want in ((project("a", 1), 1), (project("b", 1), 1), (project("a", 2), 2), (project("a", 1), 1)):
+        got = c.post("/evaluate/frame", json={"project": p, "revision": "1", "frame": 0}).json()
+        assert got["position"][0] == want
+    d = c.post("/evaluate/frame", json={"project": project("a", 3), "revision": "2", "frame": 0}).json()
+    assert d["position"][0] == 3
+
+
+def test_spline_nearest():
+    project = {
+        "meta": {"name": "t", "fps": 24, "frames": 10},
+        "timeline": {
+            "tracks": [{"id": "camera.transform", "channels": {}}],
+            "objects": {"splines": {"rail": {"points": [[0, 0, 0], [1, 0, 0], [2, 0, 0]]}}},
+        },
+    }
+    c = TestClient(create_app())
+    r = c.post("/spline/nearest", json={"project": project, "spline_id": "rail", "points": [[1.5, 2, 0], [-1, 0, 0]]}).json()
+    assert r["u"][1] == 0.0 and abs(r["distance"][0] - 2.0) < 1e-9
+    assert abs(r["position"][0][0] - 1.5) < 1e-9
+    missing = c.post("/spline/nearest", json={"project": project, "spline_id": "nope", "points": [[0, 0, 0]]})
+    assert missing.status_code == 404
+
+
+def test_spline_tessellate_is_adaptive_and_budgeted():
+    project = {
+        "meta": {"name": "t", "fps": 24, "frames": 10},
+        "timeline": {
+            "tracks": [{"id": "camera.transform", "channels": {}}],
+            "objects": {"splines": {
+                "line": {"points": [[0, 0, 0], [1, 0, 0], [2, 0, 0]]},
+                "bend": {"points": [[0, 0, 0], [4, 0, 0], [4, 4, 0], [0, 4, 0]], "closed": True},
+            }},
+        },
+    }
+    c = TestClient(create_app())
+    r = c.post("/spline/tessellate", json={"project": project, "tolerance": 0.01}).json()
+    line, bend = r["splines"]["line"], r["splines"]["bend"]
+    assert line["count"] == 3 and len(line["points"]) == 9
+    assert bend["count"] > 20 and bend["max_error"] <= 0.01
+    fine = c.post("/spline/tessellate", json={"project": project, "spline_ids": ["bend"], "tolerance": 0.01, "zoom": 2}).json()
+    assert fine["splines"]["bend"]["count"] > bend["count"]
+    capped = c.post("/spline/tessellate", json={"project": project, "spline_ids": ["bend"], "tolerance": 1e-6, "max_points": 40}).json()
+    assert capped["splines"]["bend"]["count"] == 40
@@ -0,0 +1,89 @@
+import numpy as np
+
+from deforum_core.camera.constraints import spline_rail_position
+from deforum_core.camera.splines import arc_length_table, sample_spline
+from deforum_core.schema.models import SplineObject
+
+
+def _speeds(sp, params, n=201):
+    pts = np.array([spline_rail_position(sp, u, params) for u in np.linspace(0.0, 1.0, n)])
+    return np.linalg.norm(np.diff(pts, axis=0), axis=1)
+
+
+def test_catmull_rom_arc_length_is_constant_speed():
+    sp = {"type": "CatmullRomSpline", "points": [[0, 0, 0], [1, 0.5, 0], [6, 1, 0], [7, 4, 0]], "closed": False}
+    uniform = _speeds(sp, {})
+    even = _speeds(sp, {"arc_length": True})
+    assert uniform.max() / uniform.min() > 3.0
+    assert even.max() / even.min() < 1.05
+
+
+def test_bezier_arc_length_endpoints_and_speed():
+    sp = {
+        "type": "BezierSpline",
+        "segments": [
+            {"p0": [0, 0, 0], "p1": [0.1, 0, 0], "p2": [0.2, 0, 0], "p3": [0.3, 0, 0]},
+            {"p0": [0.3, 0, 0], "p1": [2, 1, 0], "p2": [4, 1, 0], "p3": [5, 0, 0]},
+        ],
+    }
+    params = {"arc_length": True}
+    assert np.allclose(spline_rail_position(sp, 0.0, params), (0, 0, 0))
+    assert np.allclose(spline_rail_position(sp, 1.0, params), (5, 0, 0))
+    even = _speeds(sp, params)
+    assert even.max() / even.min() < 1.05
+
+
+def test_arc_length_table_is_cached_and_monotonic():
+    sp = {"type": "CatmullRomSpline", "points": [[0, 0, 0], [1, 0, 0], [1, 2, 0]], "closed": True}
+    t = arc_length_table(sp)
+    assert arc_length_table(dict(sp)) is t
+    assert np.all(np.diff(t.s) >= 0.0) and t.s[-1] == 1.0
+    assert np.allclose(sample_spline(sp, float(t.param(1.0))), sample_spline(sp, 0.0))
+
+
+def test_bezier_spline_object_validates():
+    b = SplineObject.model_validate({
+        "type": "BezierSpline",
+        "segments": [{"p0": [0, 0, 0], "p1": [1, 0, 0], "p2": [2, 0, 0], "p3": [3, 0, 0]}],
+    })
+    assert b.type == "BezierSpline" and b.segments[0].p3 == (3.0, 0.0, 0.0)
+
+
+def test_rail_constraint_arc_length_opt_in():
+    from deforum_core.camera.rig import eval_camera_range
+    from deforum_core.schema.models import Project
+
+    pts = [[0, 0, 0], [1, 0, 0], [8, 0, 0]]
+    track = {
+        "id": "cam", "type": "camera", "name": "Cam",
+        "channels": {"rail.u": {"keys": [{"t": 0, "v": 0.0, "interp": "linear"}, {"t": 100, "v": 1.0, "interp": "linear"}]}},
+        "constraints": [{"type": "Rail", "params": {"spline_id": "s", "arc_length": True}}],
+    }
+    project = Project.model_validate({
+        "meta": {"frames": 101},
+        "timeline": {"tracks": [track], "objects": {"splines": {"s": {"points": pts}}}},
+    })
+    x = eval_camera_range(project, 0, 100).position[:, 0]
+    step = np.diff(x)
+    assert np.allclose(step, step.mean(), rtol=0.1)
+
+
+def test_rig_evaluates_rails_without_hashing_spline_dicts(monkeypatch):
+    from deforum_core.camera import splines
+    from deforum_core.camera.rig import CameraRig
+    from deforum_core.schema.models import Project
+
+    track = {
+        "id": "cam", "type": "camera", "name": "Cam",
+        "channels": {"rail.u": {"keys": [{"t": 0, "v": 0.0}, {"t": 100, "v": 1.0}]}},
+        "constraints": [{"type": "Rail", "params": {"spline_id": "s", "arc_length": True}}],
+    }
+    project = Project.model_validate({
+        "meta": {"frames": 101},
+        "timeline": {"tracks": [track], "objects": {"splines": {"s": {"points": [[0, 0, 0], [1, 0, 0], [8, 0, 0]]}}}},
+    })
+    rig = CameraRig.from_project(project)
+    want = rig.eval_range(0, 100).position
+    monkeypatch.setattr(splines, "_spline_key", lambda sp: (_ for _ in ()).throw(AssertionError("hashed")))
+    assert np.array_equal(rig.eval(37).position, want[37])
+    assert np.array_equal(rig.eval_range(0, 100).position, want)
@@ -0,0 +1,60 @@
+import math
+
+import numpy as np
+
+from deforum_core.camera.bake import CameraSample, _limit_speed_accel, _smooth, apply_constraints
+from deforum_core.schema.models import CameraConstraints
+
+
+def _reference_limit(series, max_speed, max_accel):
+    out = [np.asarray(series[0], dtype=float)]
+    prev_v = np.zeros_like(out[0])
+    for x in series[1:]:
+        v = np.asarray(x, dtype=float) - out[-1]
+        if max_speed > 0 and np.linalg.norm(v) > max_speed:
+            v = v * (max_speed / np.linalg.norm(v))
+        if max_accel > 0:
+            da = v - prev_v
+            if np.linalg.norm(da) > max_accel:
+                v = prev_v + da * (max_accel / np.linalg.norm(da))
+        out.append(out[-1] + v)
+        prev_v = v
+    return np.array(out)
+
+
+def test_smoothing_kernels_match_naive_windows():
+    rng = np.random.default_rng(3)
+    x = np.cumsum(rng.normal(size=(200, 3)), axis=0)
+    w = 7
+    trailing = np.array([x[max(0, i - w + 1): i + 1].mean(axis=0) for i in range(len(x))])
+    centered = np.array([x[max(0, i - 3): i + 4].mean(axis=0) for i in range(len(x))])
+    assert np.allclose(_smooth(x, w, "trailing"), trailing)
+    assert np.allclose(_smooth(x, w, "centered"), centered)
+    g = _smooth(x, w, "gaussian")
+    assert g.shape == x.shape and np.abs(np.diff(g, 2, axis=0)).mean() < np.abs(np.diff(x, 2, axis=0)).mean()
+    assert np.allclose(_smooth(np.full(50, 2.5), 9, "gaussian"), 2.5)
+    assert np.allclose(_smooth(x[:, 0], w, "centered"), centered[:, 0])
+
+
+def test_limit_speed_accel_matches_sequential_reference():
+    rng = np.random.default_rng(5)
+    x = np.cumsum(rng.normal(size=(500, 3)) * 0.3, axis=0)
+    for ms, ma in ((0.4, 0.2), (0.4, 0.0), (0.0, 0.1), (10.0, 10.0)):
+        assert np.allclose(_limit_speed_accel(x, ms, ma), _reference_limit(x, ms, ma), atol=1e-12)
+    r = x[:, 0]
+    assert np.allclose(_limit_speed_accel(r, 0.25), _reference_limit(r[:, None], 0.25, 0.0)[:, 0], atol=1e-12)
+
+
+def test_apply_constraints_limits_focal_and_derives_fov():
+    samples = [
+        CameraSample(frame=i, pos=(i * 3.0, 0.0, 0.0), target=(0.0, 0.0, -1.0), euler_deg=(0.0, 0.0, 0.0), fov_deg=0.0,
+                     focal_length_mm=35.0 if i < 5 else 85.0)
+        for i in range(10)
+    ]
+    cc = CameraConstraints(max_speed_pos=1.0, max_accel_pos=0.0, max_speed_focal_mm=2.0, smoothing_window=3, smoothing_kernel="centered")
+    out = apply_constraints(samples, cc)
+    focal = np.array([s.focal_length_mm for s in out])
+    assert np.all(np.abs(np.diff(focal)) <= 2.0 + 1e-9)
+    assert np.all(np.linalg.norm(np.diff([s.pos for s in out], axis=0), axis=1) <= 1.0 + 1e-9)
+    fov = out[-1].fov_deg
+    assert math.isclose(fov, math.degrees(2 * math.atan(36.0 / (2 * focal[-1]))))
@@ -0,0 +1,37 @@
+import numpy as np
+
+from deforum_core.camera.euler import (
+    euler_xyz_deg_to_quat,
+    euler_xyz_deg_to_quat_batch,
+    quat_to_euler_xyz_deg,
+    quat_to_euler_xyz_deg_batch,
+)
+from deforum_core.camera.math3d import Quaternion, look_at_rotation, look_at_rotation_batch
+
+
+def _q(q):
+    return [q.w, q.x, q.y, q.z]
+
+
+def test_look_at_batch_matches_scalar_including_degenerate_cases():
+    rng = np.random.default_rng(11)
+    eye = rng.normal(size=(300, 3))
+    target = rng.normal(size=(300, 3))
+    target[:3] = eye[:3]                    # zero-length view
+    target[3:6] = eye[3:6] + [0.0, 2.0, 0.0]  # looking straight up
+    target[6:9] = eye[6:9] - [0.0, 2.0, 0.0]  # looking straight down
+    got = look_at_rotation_batch(eye, target)
+    want = np.array([_q(look_at_rotation(e, t)) for e, t in zip(eye, target)])
+    assert got.shape == (300, 4)
+    assert np.allclose(got, want, atol=1e-12)
+
+
+def test_euler_batch_matches_scalar_including_gimbal_lock():
+    rng = np.random.default_rng(12)
+    e = rng.uniform(-180, 180, size=(200, 3))
+    e[:4, 1] = [90.0, -90.0, 89.9999, -90.0]
+    quats = euler_xyz_deg_to_quat_batch(e)
+    assert np.allclose(quats, [_q(euler_xyz_deg_to_quat(*row)) for row in e], atol=1e-12)
+    got = quat_to_euler_xyz_deg_batch(quats)
+    want = np.array([quat_to_euler_xyz_deg(Quaternion(*q)) for q in quats])
+    assert np.allclose(got, want, atol=1e-9)
@@ -0,0 +1,61 @@
+import numpy as np
+
+from deforum_core.camera.bake import bake_camera_tracks
+from deforum_core.camera.rig import CAMERA_DTYPE, CameraBuffer, CameraRig, CameraState
+from deforum_core.cli.exporters import export_a1111_bundle, export_camera_csv
+from deforum_core.schema.models import Project
+
+
+def _project():
+    return Project.model_validate({
+        "meta": {"name": "t", "fps": 24, "frames": 60},
+        "timeline": {"tracks": [{
+            "id": "camera.transform",
+            "type": "CameraTransformTrack",
+            "channels": {
+                "position.x": {"keys": [{"t": 0, "v": -2}, {"t": 59, "v": 2}]},
+                "focal_length_mm": {"keys": [{"t": 0, "v": 24}, {"t": 59, "v": 50}]},
+            },
+            "modifiers": [{"type": "AimSpring", "params": {"stiffness": 6.0, "damping": 0.8}}],
+        }]},
+    })
+
+
+def test_range_returns_structured_buffer():
+    cams = CameraRig.from_project(_project()).eval_range(0, 59)
+    assert isinstance(cams, CameraBuffer)
+    assert cams.data.dtype == CAMERA_DTYPE and len(cams) == 60
+    assert cams.position.shape == (60, 3) and cams.rotation.shape == (60, 4)
+    assert np.array_equal(cams.frame, np.arange(60))
+    assert cams.focal_length_mm[0] == 24.0
+
+
+def test_state_adapter_round_trips():
+    cams = CameraRig.from_project(_project()).eval_range(0, 59)
+    states = cams.to_states()
+    assert all(isinstance(s, CameraState) for s in states)
+    assert states[7] == cams[7]
+    assert [s.position for s in cams] == [s.position for s in states]
+    again = CameraBuffer.from_states(states)
+    assert np.array_equal(again.data, cams.data)
+    sub = cams[10:20:3]
+    assert isinstance(sub, CameraBuffer) and sub.frame.tolist() == [10, 13, 16, 19]
+
+
+def test_chunks_concat_to_whole_range():
+    rig = CameraRig.from_project(_project())
+    whole = rig.eval_range(0, 59)
+    joined = CameraBuffer.concat(rig.iter_range(0, 59, chunk=16))
+    assert np.array_equal(joined.data, whole.data)
+
+
+def test_consumers_read_columns():
+    pr = _project()
+    cams = CameraRig.from_project(pr).eval_range(0, 59)
+    rows = export_camera_csv(pr, 0, 59)
+    assert [r["frame"] for r in rows] == list(range(60))
+    assert rows[5]["qw"] == cams.rotation[5, 0] and rows[5]["tgt_x"] == cams.target[5, 0]
+    bundle = export_a1111_bundle(pr, 0, 59)
+    assert bundle.meta["frames"] == 60
+    baked = bake_camera_tracks(pr, 0, 59, reduce_keys=False)
+    assert [k["v"] for k in baked["camera.transform"]["position.x"]] == cams.position[:, 0].tolist()
@@ -0,0 +1,44 @@
+from deforum_core.schema.models import Project
+from deforum_core.camera.rig import CameraRig, eval_camera, eval_camera_range
+
+
+def _project():
+    return Project.model_validate({
+        "meta": {"name": "t", "fps": 24, "frames": 48},
+        "timeline": {
+            "objects": {"nulls": {"hero": {"type": "Null", "position": [1, 2, 3]}}, "splines": {}},
+            "tracks": [{
+                "id": "camera.transform",
+                "type": "CameraTransformTrack",
+                "channels": {
+                    "position.x": {"keys": [{"t": 0, "v": 0}, {"t": 47, "v": 4}]},
+                    "position.z": {"value": -6},
+                    "orbit.azimuth_deg": {"keys": [{"t": 0, "v": 0}, {"t": 47, "v": 90}]},
+                    "roll_deg": {"keys": [{"t": 0, "v": 0}, {"t": 47, "v": 15}]},
+                },
+                "constraints": [
+                    {"type": "Orbit", "order": 10, "params": {"radius": 5.0}},
+                    {"type": "LookAtObject", "order": 0, "params": {"null_id": "hero"}},
+                    {"type": "Rail", "order": 5, "enabled": False, "params": {"spline_id": "missing"}},
+                ],
+            }],
+        },
+    })
+
+
+def test_rig_prepares_stacks_once():
+    rig = CameraRig.from_project(_project())
+    assert [c.type for c in rig.constraints] == ["LookAtObject", "Orbit"]
+    assert rig.nulls["hero"] == (1.0, 2.0, 3.0)
+    assert set(rig.channels) == {"position.x", "position.z", "orbit.azimuth_deg", "roll_deg"}
+
+
+def test_rig_matches_module_functions():
+    pr = _project()
+    rig = CameraRig.from_project(pr)
+    for f in (0, 11, 47):
+        a, b = rig.eval(f), eval_camera(pr, f)
+        assert a.position == b.position and a.target == b.target and a.rotation == b.rotation
+    rng = rig.eval_range(0, 47)
+    assert [c.position for c in rng] == [c.position for c in eval_camera_range(pr, 0, 47)]
+    assert rng[0].target == (1.0, 2.0, 3.0)
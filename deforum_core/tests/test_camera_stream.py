@@ -0,0 +1,45 @@
+import numpy as np
+
+from deforum_core.camera.rig import CameraRig, iter_camera_range
+from deforum_core.schema.models import Project
+
+
+def _project():
+    return Project.model_validate({
+        "meta": {"name": "t", "fps": 24, "frames": 200},
+        "timeline": {"tracks": [{
+            "id": "camera.transform",
+            "type": "CameraTransformTrack",
+            "channels": {
+                "position.x": {"keys": [{"t": 0, "v": -3}, {"t": 199, "v": 3}]},
+                "target.y": {"keys": [{"t": 0, "v": 0}, {"t": 80, "v": 2, "interp": "bezier"}, {"t": 199, "v": 0}]},
+                "roll_deg": {"keys": [{"t": 0, "v": 0}, {"t": 199, "v": 20}]},
+            },
+            "modifiers": [
+                {"type": "AimSpring", "params": {"stiffness": 9.0, "damping": 0.7}},
+                {"type": "NoiseShake", "params": {"seed": 7, "amp_pos": 0.05}},
+            ],
+        }]},
+    })
+
+
+def _flat(states):
+    return np.array([[s.frame, *s.position, *s.target, s.rotation.w, s.rotation.x, s.rotation.y, s.rotation.z] for s in states])
+
+
+def test_chunks_carry_modifier_state():
+    rig = CameraRig.from_project(_project())
+    whole = _flat(rig.eval_range(5, 180))
+    for chunk in (1, 7, 64, 1000):
+        chunks = list(rig.iter_range(5, 180, chunk=chunk))
+        assert all(len(c) <= chunk for c in chunks)
+        streamed = _flat([s for c in chunks for s in c])
+        assert streamed.shape == whole.shape
+        assert np.allclose(streamed, whole, rtol=0.0, atol=1e-12)
+
+
+def test_iter_camera_range_is_lazy():
+    it = iter_camera_range(_project(), 0, 199, chunk=50)
+    first = next(it)
+    assert [s.frame for s in first] == list(range(50))
+    assert sum(len(c) for c in it) == 150
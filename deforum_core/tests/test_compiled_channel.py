@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from deforum_core.schema.models import Channel
+from deforum_core.timeline.curves import ARRAY_EVAL_RTOL, compile_channel, eval_keyframes
+from deforum_core.timeline.evaluator import eval_channel, eval_channel_array
+
+
+def _channel():
+    return Channel(keys=[
+        {"t": 0, "v": 0.0, "interp": "linear"},
+        {"t": 12, "v": 4.0, "interp": "bezier", "out_tan": [0.1, 2.0]},
+        {"t": 30, "v": 1.0, "interp": "catmull_rom"},
+        {"t": 45, "v": 6.0, "interp": "bezier", "in_tan": [-0.8, -1.0]},
+    ])
+
+
+def test_compiled_matches_scalar_evaluator():
+    ch = _channel()
+    cc = compile_channel(ch)
+    tol = ARRAY_EVAL_RTOL * (1.0 + 6.0)
+    frames = np.arange(-3, 50)
+    want = np.array([eval_keyframes(ch.keys, int(f)) for f in frames])
+    assert np.max(np.abs(cc.eval_array(frames) - want)) <= tol
+    assert max(abs(cc.eval(int(f)) - w) for f, w in zip(frames, want)) <= tol
+
+
+def test_eval_channel_accepts_compiled_form():
+    ch = _channel()
+    cc = compile_channel(ch)
+    assert abs(eval_channel(cc, 20) - eval_channel(ch, 20)) <= ARRAY_EVAL_RTOL * 7.0
+    assert np.allclose(eval_channel_array(cc, [5, 20]), eval_channel_array(ch, [5, 20]))
+    assert eval_channel(compile_channel(Channel(value=3.0)), 99) == 3.0
+    assert eval_channel(compile_channel(Channel()), 99, default=-2.0) == -2.0
+
+
+def test_compiled_channel_is_immutable():
+    cc = compile_channel(_channel())
+    with pytest.raises(ValueError):
+        cc.values[0] = 1.0
+    with pytest.raises(AttributeError):
+        cc.times = np.zeros(1)
+
+
+def test_bezier_solvers_agree():
+    from deforum_core.schema.models import Keyframe
+    from deforum_core.timeline.curves import BEZIER_SOLVERS, compile_keyframes
+
+    keys = [
+        Keyframe.model_construct(t=0, v=0.0, interp="bezier", in_tan=None, out_tan=(0.7, 3.0), ease=None),
+        Keyframe.model_construct(t=40, v=2.0, interp="bezier", in_tan=(-0.05, 1.0), out_tan=None, ease=(0.9, 0.1, 0.1, 0.9)),
+        Keyframe.model_construct(t=90, v=-1.0, interp="bezier", in_tan=(-1.0, 0.0), out_tan=None, ease=None),
+    ]
+    frames = np.arange(0, 91)
+    ref = compile_keyframes(keys, solver="bisect", tol=1e-14).eval_array(frames)
+    for solver in BEZIER_SOLVERS:
+        cc = compile_keyframes(keys, solver=solver, tol=1e-10)
+        assert np.max(np.abs(cc.eval_array(frames) - ref)) < 1e-7
+        assert max(abs(cc.eval(int(f)) - r) for f, r in zip(frames, ref)) < 1e-7
+    with pytest.raises(ValueError):
+        compile_keyframes(keys, solver="secant")
+
+
+def test_chord_deviation_bounds_every_frame():
+    cc = compile_channel(_channel())
+    a = np.array([0, 12, 14, 30, 33, 45, -5], dtype=float)
+    b = np.array([12, 30, 25, 45, 44, 60, 0], dtype=float)
+    dev, where = cc.chord_deviation(a, b)
+    for lo, hi, d, w in zip(a, b, dev, where):
+        f = np.linspace(lo, hi, 401)
+        v = cc.eval_array(f)
+        chord = v[0] + (f - lo) * (v[-1] - v[0]) / (hi - lo)
+        true = np.abs(v - chord).max()
+        assert true <= d + 1e-9 and d <= true + 1e-4
+        assert lo <= w <= hi
+    # Linear segments and frames outside the keys sit on their chords.
+    assert dev[0] < 1e-12 and dev[5] == 0.0 and dev[6] == 0.0
+
+
+def test_chord_deviation_does_not_bound_eased_segments():
+    from types import SimpleNamespace
+    from deforum_core.timeline.curves import compile_keyframes
+
+    # Keys carrying an `ease` attribute (the schema model does not declare one).
+    keys = [
+        SimpleNamespace(t=0, v=0.0, interp="linear", ease=None),
+        SimpleNamespace(t=10, v=1.0, interp="linear", ease=(0.4, 0.0, 0.6, 1.0)),
+    ]
+    dev, _ = compile_keyframes(keys).chord_deviation([0.0], [10.0])
+    assert np.isinf(dev[0])
@@ -0,0 +1,77 @@
+import numpy as np
+
+from deforum_core.schema.models import Channel, Keyframe
+from deforum_core.timeline.curves import (
+    ARRAY_EVAL_RTOL,
+    ARRAY_EVAL_RTOL_STALLED,
+    BEZIER_SOLVERS,
+    compile_keyframes,
+    eval_keyframes,
+    eval_keyframes_array,
+)
+from deforum_core.timeline.evaluator import eval_channel, eval_channel_array
+
+
+def _mixed_keys():
+    return [
+        Keyframe(t=0, v=0.0, interp="linear"),
+        Keyframe(t=7, v=3.0, interp="bezier", out_tan=(0.2, 1.5)),
+        Keyframe(t=20, v=-2.0, interp="bezier", in_tan=(-0.6, 0.4)),
+        Keyframe(t=31, v=5.0, interp="catmull_rom"),
+        Keyframe(t=40, v=4.0, interp="catmull_rom"),
+        Keyframe(t=52, v=9.0, interp="bezier"),
+    ]
+
+
+def test_array_matches_scalar_for_mixed_interp():
+    keys = _mixed_keys()
+    frames = np.arange(-5, 60)
+    got = eval_keyframes_array(keys, frames)
+    want = np.array([eval_keyframes(keys, int(f)) for f in frames])
+    tol = ARRAY_EVAL_RTOL * (1.0 + 11.0)
+    assert np.max(np.abs(got - want)) <= tol
+
+
+def test_array_matches_scalar_with_easing():
+    k0 = Keyframe(t=0, v=1.0, interp="linear")
+    k1 = Keyframe.model_construct(t=30, v=4.0, interp="bezier", in_tan=None, out_tan=None, ease=(0.42, 0.0, 0.58, 1.0))
+    keys = [k0, k1]
+    frames = np.arange(0, 31)
+    got = eval_keyframes_array(keys, frames)
+    want = np.array([eval_keyframes(keys, int(f)) for f in frames])
+    assert np.max(np.abs(got - want)) <= ARRAY_EVAL_RTOL * 4.0
+
+
+def test_array_matches_scalar_with_clamped_tangents():
+    frames = np.arange(0, 10001)
+
+    # dt outside [0, 1] (or [-1, 0]) is clamped identically by both paths.
+    clamped = [
+        Keyframe(t=0, v=0.0, interp="bezier", out_tan=(-0.4, 1.0)),
+        Keyframe(t=5000, v=1.0, interp="bezier", in_tan=(-1.7, 0.5), out_tan=(1.6, -2.0)),
+        Keyframe(t=10000, v=-1.0, interp="bezier", in_tan=(0.3, 1.0)),
+    ]
+    # out dt >= 1 with in dt <= -1: the time curve stalls mid-segment.
+    stalled = [
+        Keyframe(t=0, v=0.0, interp="bezier", out_tan=(1.5, 3.0)),
+        Keyframe(t=10000, v=1.0, interp="bezier", in_tan=(-1.2, -3.0)),
+    ]
+    for keys, tol in ((clamped, ARRAY_EVAL_RTOL * (1.0 + 2.0)), (stalled, ARRAY_EVAL_RTOL_STALLED * (1.0 + 1.0))):
+        want = np.array([eval_keyframes(keys, int(f)) for f in frames])
+        for solver in BEZIER_SOLVERS:
+            assert np.max(np.abs(compile_keyframes(keys, solver=solver).eval_array(frames) - want)) <= tol
+
+
+def test_channel_array_constant_and_empty():
+    frames = np.arange(5)
+    assert np.all(eval_channel_array(Channel(value=2.5), frames) == 2.5)
+    assert np.all(eval_channel_array(Channel(), frames, default=-1.0) == -1.0)
+    ch = Channel(keys=[{"t": 0, "v": 0}, {"t": 4, "v": 8}])
+    assert np.allclose(eval_channel_array(ch, frames), [eval_channel(ch, int(f)) for f in frames])
+
+
+def test_array_preserves_input_shape():
+    keys = [Keyframe(t=0, v=0.0), Keyframe(t=10, v=5.0)]
+    assert np.shape(eval_keyframes_array(keys, 3)) == ()
+    assert abs(float(eval_keyframes_array(keys, 3)) - eval_keyframes(keys, 3)) <= ARRAY_EVAL_RTOL * 6.0
+    assert eval_keyframes_array(keys, [[1, 2], [3, 4]]).shape == (2, 2)
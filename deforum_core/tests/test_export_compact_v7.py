@@ -42,3 +42,38 @@ def test_compact_schedule_not_exploding():
     # translation_x should be reduced to <=80 points -> schedule has <=80 commas+1 roughly
     s = b.deforum_fields["translation_x"]
     assert len(s.split(",")) <= 80
+
+
+def test_compact_budget_keeps_tail_and_reports_error():
+    pr = _mk_project(frames=600)
+    b = export_a1111_bundle(pr, 0, pr.meta.frames-1, compact=True, tolerance=1e-6, max_points=12)
+    for name, s in b.deforum_fields.items():
+        frames = [int(p.split(":")[0]) for p in s.split(", ")]
+        assert len(frames) <= 12 and frames[-1] == 599
+    assert set(b.max_errors) >= set(b.deforum_fields) and b.meta["max_errors"] is b.max_errors
+    assert all(e >= 0.0 for e in b.max_errors.values())
+
+
+def test_joint_compact_shares_frames_and_bounds_position():
+    import numpy as np
+
+    pr = _mk_project(frames=600)
+    b = export_a1111_bundle(pr, 0, 599, compact=True, tolerance=0.02, reduce_mode="joint", precision=6)
+    assert b.meta["reduce_mode"] == "joint"
+    pts = {k: [tuple(map(float, p.replace("(", "").replace(")", "").split(":"))) for p in s.split(", ")] for k, s in b.schedules.items()}
+    # Translation and absolute position schedules key the same frames.
+    assert [f for f, _ in pts["position.x"]] == [int(p.split(":")[0]) for p in b.deforum_fields["translation_x"].split(", ")]
+    frames = np.arange(600)
+    pos = np.stack([np.interp(frames, *zip(*pts[k])) for k in ("position.x", "position.y", "position.z")], axis=1)
+    xyz = np.array([[r["pos_x"], r["pos_y"], r["pos_z"]] for r in b.camera_csv])
+    assert np.linalg.norm(pos - xyz, axis=1).max() <= 0.02 + 1e-5
+    assert len(pts["position.y"]) == 2
+
+
+def test_joint_compact_reports_channel_fallback():
+    pr = _mk_project(frames=60)
+    b = export_a1111_bundle(pr, 0, 59, compact=True, tolerance=0.0, reduce_mode="joint")
+    assert b.meta["reduce_mode"] == "channel"
+    assert len(b.meta["warnings"]) == 1 and "joint" in b.meta["warnings"][0]
+    b = export_a1111_bundle(pr, 0, 59, compact=True, tolerance=0.02, reduce_mode="joint")
+    assert b.meta["reduce_mode"] == "joint" and b.meta["warnings"] == []
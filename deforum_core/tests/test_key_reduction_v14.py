@@ -1,5 +1,11 @@
+import numpy as np
+import pytest
+
 from deforum_core.schema.models import Project, Meta, Timeline, Track, Channel
 from deforum_core.camera.bake import bake_camera_tracks
+from deforum_core.camera.math3d import quat_view_roll_deg_batch
+from deforum_core.camera.rig import CameraRig, eval_camera_range
+from deforum_core.timeline.curves import eval_keyframes
 
 def test_key_reduction_can_shrink_keys():
     pr = Project(
@@ -24,3 +30,126 @@ def test_key_reduction_can_shrink_keys():
     full = bake_camera_tracks(pr, start=0, end=59, reduce_keys=False, max_error=0.0)
     red = bake_camera_tracks(pr, start=0, end=59, reduce_keys=True, max_error=0.05)
     assert len(red["camera.transform"]["position.x"]) <= len(full["camera.transform"]["position.x"])
+
+
+def test_bezier_key_mode_emits_tangents_within_error():
+    pr = Project(
+        meta=Meta(name="t", fps=24, frames=120, resolution=(640, 360)),
+        timeline=Timeline(tracks=[Track(id="camera.transform", type="camera.transform", channels={
+            "position.x": Channel(keys=[
+                {"t": 0, "v": 0},
+                {"t": 30, "v": 2, "interp": "catmull_rom"},
+                {"t": 60, "v": 3, "interp": "catmull_rom"},
+                {"t": 90, "v": 0.5, "interp": "catmull_rom"},
+                {"t": 119, "v": -1, "interp": "catmull_rom"},
+            ]),
+            "position.z": Channel(keys=[{"t": 0, "v": 0}, {"t": 60, "v": 2}, {"t": 119, "v": -4}]),
+        })]),
+    )
+    linear = bake_camera_tracks(pr, 0, 119, max_error=0.001)
+    bez = bake_camera_tracks(pr, 0, 119, max_error=0.001, key_mode="bezier")
+    keys = bez["camera.transform"]["position.x"]
+    assert all(k["interp"] == "bezier" for k in keys) and "out_tan" in keys[0] and "in_tan" in keys[-1]
+    assert len(keys) < len(linear["camera.transform"]["position.x"])
+    channel = Channel(keys=keys)
+    xs = eval_camera_range(pr, 0, 119).position[:, 0]
+    assert max(abs(eval_keyframes(channel.keys, f) - xs[f]) for f in range(120)) <= 0.001
+    # A corner in the source stays a corner: no extra keys around it.
+    assert len(bez["camera.transform"]["position.z"]) == len(linear["camera.transform"]["position.z"])
+
+
+def test_joint_reduce_mode_shares_frames_within_camera_space_bound():
+    pr = Project(
+        meta=Meta(name="t", fps=24, frames=240, resolution=(640, 360)),
+        timeline=Timeline(tracks=[Track(id="camera.transform", type="camera.transform", channels={
+            "position.x": Channel(keys=[
+                {"t": 0, "v": 0},
+                {"t": 80, "v": 2, "interp": "catmull_rom"},
+                {"t": 160, "v": -1, "interp": "catmull_rom"},
+                {"t": 239, "v": 3, "interp": "catmull_rom"},
+            ]),
+            "position.y": Channel(keys=[{"t": 0, "v": 0}, {"t": 100, "v": 1, "interp": "catmull_rom"}, {"t": 239, "v": 0.5, "interp": "catmull_rom"}]),
+            "position.z": Channel(keys=[{"t": 0, "v": -6}, {"t": 239, "v": -2}]),
+            "target.y": Channel(keys=[{"t": 0, "v": 0}, {"t": 120, "v": 1}, {"t": 239, "v": 0}]),
+        })]),
+    )
+    baked = bake_camera_tracks(pr, 0, 239, max_error=0.01, reduce_mode="joint", max_angle_deg=0.05)
+    tr = baked["camera.transform"]
+    frames = set().union(*({k["t"] for k in keys} for keys in tr.values()))
+    assert len(frames) < sum(len(keys) for keys in tr.values())
+
+    def curve(name):
+        keys = Channel(keys=tr[name]).keys
+        return np.array([eval_keyframes(keys, f) for f in range(240)])
+
+    cams = eval_camera_range(pr, 0, 239)
+    p = np.stack([curve("position.x"), curve("position.y"), curve("position.z")], axis=1)
+    q = np.stack([curve("target.x"), curve("target.y"), curve("target.z")], axis=1)
+    assert np.linalg.norm(p - cams.position, axis=1).max() <= 0.01 + 1e-9
+    a, b = cams.target - cams.position, q - p
+    cos = np.einsum("ij,ij->i", a, b) / np.linalg.norm(a, axis=1) / np.linalg.norm(b, axis=1)
+    assert np.degrees(np.arccos(np.clip(cos, -1.0, 1.0))).max() <= 0.05 + 1e-6
+
+    with pytest.raises(ValueError):
+        bake_camera_tracks(pr, 0, 239, reduce_mode="tracks")
+    with pytest.raises(ValueError):
+        bake_camera_tracks(pr, 0, 239, reduce_mode="joint", key_mode="bezier")
+
+
+def _adaptive_project(modifiers=()):
+    return Project.model_validate({
+        "schema_version": "2.0",
+        "meta": {"name": "t", "fps": 24, "frames": 600, "resolution": [640, 360]},
+        "timeline": {
+            "objects": {"nulls": {"hero": {"type": "Null", "position": [0.5, 1.0, 2.0]}}, "splines": {}},
+            "tracks": [{
+                "id": "camera.transform",
+                "type": "CameraTransformTrack",
+                "channels": {
+                    "position.x": {"keys": [
+                        {"t": 0, "v": -3}, {"t": 150, "v": 2, "interp": "catmull_rom"},
+                        {"t": 400, "v": -1, "interp": "catmull_rom"}, {"t": 599, "v": 4, "interp": "catmull_rom"},
+                    ]},
+                    "position.z": {"keys": [{"t": 0, "v": -6}, {"t": 300, "v": -2, "out_tan": [0.6, 1.5]}, {"t": 599, "v": -5}]},
+                    "roll_deg": {"keys": [{"t": 0, "v": 0}, {"t": 599, "v": 12}]},
+                    "focal_length_mm": {"keys": [{"t": 0, "v": 35}, {"t": 250, "v": 50, "interp": "linear"}, {"t": 599, "v": 28}]},
+                },
+                "constraints": [{"type": "LookAtObject", "order": 0, "enabled": True, "params": {"null_id": "hero"}}],
+                "modifiers": list(modifiers),
+            }],
+        },
+    })
+
+
+def test_adaptive_sampling_keeps_every_frame_within_max_error(monkeypatch):
+    pr = _adaptive_project()
+    cams = eval_camera_range(pr, 0, 599)
+    dense = bake_camera_tracks(pr, 0, 599, max_error=0.005)
+    with monkeypatch.context() as m:
+        # Adaptive sampling must not evaluate the whole range.
+        m.setattr(CameraRig, "eval_range", lambda *a, **k: (_ for _ in ()).throw(AssertionError("dense")))
+        baked = bake_camera_tracks(pr, 0, 599, max_error=0.005, sampling="adaptive")
+    truth = {
+        "position.x": cams.position[:, 0],
+        "position.z": cams.position[:, 2],
+        "target.x": cams.target[:, 0],
+        "roll_deg": quat_view_roll_deg_batch(cams.rotation),
+        "focal_length_mm": cams.focal_length_mm,
+    }
+    frames = np.arange(600)
+    for name, want in truth.items():
+        track = "camera.lens" if name == "focal_length_mm" else "camera.transform"
+        keys = baked[track][name]
+        got = np.interp(frames, [k["t"] for k in keys], [k["v"] for k in keys])
+        assert np.abs(got - want).max() <= 0.005, name
+        assert keys[0]["t"] == 0 and keys[-1]["t"] == 599
+        assert len(keys) <= 2 * len(dense[track][name]) + 2, name
+
+
+def test_adaptive_sampling_falls_back_for_reshaping_stacks():
+    pr = _adaptive_project([{"type": "NoiseShake", "order": 0, "enabled": True, "params": {"seed": 3}}])
+    assert bake_camera_tracks(pr, 0, 120, max_error=0.01, sampling="adaptive") == bake_camera_tracks(pr, 0, 120, max_error=0.01)
+    with pytest.raises(ValueError):
+        bake_camera_tracks(pr, 0, 120, sampling="sparse")
+    with pytest.raises(ValueError):
+        bake_camera_tracks(pr, 0, 120, sampling="adaptive", key_mode="bezier")
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from deforum_core.timeline.keyreduce import (
+    fit_bezier_keys,
+    joint_column_keys,
+    rdp_budget,
+    rdp_indices,
+    rdp_joint,
+    rdp_points,
+)
+
+
+def _recursive(points, eps):
+    if len(points) <= 2:
+        return points
+    (x1, y1), (x2, y2) = points[0], points[-1]
+    dx, dy = x2 - x1, y2 - y1
+    denom = (dx * dx + dy * dy) ** 0.5
+    ds = [abs(dy * x - dx * y + x2 * y1 - y2 * x1) / denom for x, y in points[1:-1]]
+    k = int(np.argmax(ds))
+    if ds[k] <= eps:
+        return [points[0], points[-1]]
+    return _recursive(points[: k + 2], eps)[:-1] + _recursive(points[k + 1:], eps)
+
+
+def test_matches_recursive_douglas_peucker():
+    rng = np.random.default_rng(2)
+    t = np.arange(3000, dtype=float)
+    v = np.cumsum(rng.normal(scale=0.1, size=len(t)))
+    pts = list(zip(t.tolist(), v.tolist()))
+    for eps in (0.0, 0.05, 0.5, 5.0):
+        assert [int(p[0]) for p in _recursive(pts, eps)] == rdp_indices(t, v, eps).tolist()
+    assert rdp_points(pts, 0.5) == _recursive(pts, 0.5)
+
+
+def test_vertical_metric_bounds_linear_key_error():
+    rng = np.random.default_rng(4)
+    t = np.arange(5000, dtype=float)
+    v = np.sin(t / 80.0) + rng.normal(scale=0.01, size=len(t))
+    idx = rdp_indices(t, v, 0.03, metric="vertical")
+    assert idx[0] == 0 and idx[-1] == len(t) - 1
+    assert np.max(np.abs(np.interp(t, t[idx], v[idx]) - v)) <= 0.03 + 1e-12
+
+
+def test_deep_split_trees_do_not_recurse():
+    t = np.arange(20000, dtype=float)
+    v = np.exp(t / 2000.0)  # convex: every split lands next to an end
+    idx = rdp_indices(t, v, 1e-4, metric="vertical")
+    assert len(idx) > 100 and np.all(np.diff(idx) > 0)
+
+
+def test_small_inputs_and_bad_metric():
+    assert rdp_indices([0, 1], [0, 5], 0.1).tolist() == [0, 1]
+    assert rdp_points([(0, 1.0)], 0.1) == [(0, 1.0)]
+    with pytest.raises(ValueError):
+        rdp_indices([0, 1, 2], [0, 1, 0], 0.1, metric="area")
+
+
+def test_budget_keeps_ends_and_reports_error():
+    rng = np.random.default_rng(9)
+    t = np.arange(4000, dtype=float)
+    v = np.cumsum(rng.normal(scale=0.2, size=len(t)))
+    red = rdp_budget(t, v, 50, 0.01)
+    assert len(red.indices) == 50 and red.indices[0] == 0 and red.indices[-1] == len(t) - 1
+    assert np.isclose(red.max_error, np.max(np.abs(np.interp(t, t[red.indices], v[red.indices]) - v)))
+    assert rdp_budget(t, v, 200, 0.01).max_error <= red.max_error
+    loose = rdp_budget(t, v, 10**6, 0.5)
+    assert loose.indices.tolist() == rdp_indices(t, v, 0.5, metric="vertical").tolist()
+    assert loose.max_error <= 0.5
+
+
+def test_bezier_fit_round_trips_through_eval_keyframes():
+    from deforum_core.schema.models import Keyframe
+    from deforum_core.timeline.curves import eval_keyframes
+
+    t = np.arange(400, dtype=float)
+    v = np.sin(t / 50.0) * 2.0 + 0.01 * t
+    fit = fit_bezier_keys(t, v, 0.005)
+    assert len(fit.indices) < len(rdp_indices(t, v, 0.005, metric="vertical")) // 2
+    keys = [
+        Keyframe(t=int(t[k]), v=float(v[k]), interp="bezier", in_tan=tuple(fit.in_tan[n]), out_tan=tuple(fit.out_tan[n]))
+        for n, k in enumerate(fit.indices)
+    ]
+    got = np.array([eval_keyframes(keys, int(f)) for f in t])
+    assert np.max(np.abs(got - v)) <= 0.005
+
+
+def test_bezier_fit_bounds_error_on_noisy_series():
+    from deforum_core.schema.models import Keyframe
+    from deforum_core.timeline.curves import compile_keyframes
+
+    t = np.arange(3000, dtype=float)
+    v = np.cumsum(np.random.default_rng(4).normal(scale=0.05, size=3000))
+    fit = fit_bezier_keys(t, v, 0.02)
+    keys = [
+        Keyframe(t=int(t[k]), v=float(v[k]), interp="bezier", in_tan=tuple(fit.in_tan[n]), out_tan=tuple(fit.out_tan[n]))
+        for n, k in enumerate(fit.indices)
+    ]
+    assert np.max(np.abs(compile_keyframes(keys).eval_array(t) - v)) <= 0.02 + 1e-6
+
+
+def test_joint_reduction_bounds_3d_distance_on_shared_frames():
+    t = np.arange(500.0)
+    xyz = np.stack([np.sin(t / 30), np.cos(t / 45) * 0.5, np.where(t < 250, 0.0, (t - 250) / 100)], axis=1)
+
+    def error(i, approx):
+        return np.linalg.norm(approx - xyz[i], axis=1) / 0.01
+
+    shared = rdp_joint(t, xyz, error).indices
+    assert shared[0] == 0 and shared[-1] == 499
+    keys = joint_column_keys(t, xyz, error, shared)
+    recon = np.stack([np.interp(t, t[k], xyz[k, c]) for c, k in enumerate(keys)], axis=1)
+    assert np.linalg.norm(recon - xyz, axis=1).max() <= 0.01 + 1e-12
+    assert all(np.isin(k, shared).all() for k in keys)
+    # The z column is flat, then linear: it needs far fewer keys than the others.
+    assert len(keys[2]) < len(keys[0]) and len(keys[2]) <= 4
+
+    budget = rdp_joint(t, xyz, error, max_points=8)
+    assert len(budget.indices) == 8 and budget.max_error > 1.0
@@ -0,0 +1,58 @@
+import numpy as np
+
+from deforum_core.camera.rig import CameraRig, ModifierCheckpoints
+from deforum_core.schema.models import Project
+
+
+def _project(seed=11):
+    return Project.model_validate({
+        "meta": {"name": "t", "fps": 24, "frames": 700},
+        "timeline": {"tracks": [{
+            "id": "camera.transform",
+            "type": "CameraTransformTrack",
+            "channels": {
+                "position.x": {"keys": [{"t": 0, "v": -3}, {"t": 699, "v": 3}]},
+                "target.y": {"keys": [{"t": 0, "v": 0}, {"t": 300, "v": 2, "interp": "bezier"}, {"t": 699, "v": 0}]},
+            },
+            "modifiers": [
+                {"type": "AimSpring", "params": {"stiffness": 9.0, "damping": 0.7}},
+                {"type": "NoiseShake", "params": {"seed": seed, "amp_pos": 0.05}},
+                {"type": "HorizonLock"},
+            ],
+        }]},
+    })
+
+
+def test_single_frames_match_full_range():
+    rig = CameraRig.from_project(_project())
+    full = rig.eval_range(0, 699)
+    for f in (0, 1, 255, 256, 257, 511, 640, 699):
+        assert rig.eval(f) == full[f]
+
+
+def test_sub_ranges_resume_from_checkpoints():
+    rig = CameraRig.from_project(_project())
+    full = rig.eval_range(0, 699)
+    assert np.array_equal(rig.eval_range(300, 420).data, full[300:421].data)
+    chunks = [c.data for c in rig.iter_range(130, 699, chunk=100)]
+    assert np.array_equal(np.concatenate(chunks), full[130:].data)
+
+
+def test_store_is_lazy_and_per_rig():
+    rig = CameraRig.from_project(_project())
+    assert "checkpoints" not in vars(rig)
+    rig.eval(10)
+    assert len(rig.checkpoints) == 1
+    rig.eval(600)
+    assert len(rig.checkpoints) == 3
+
+    other = CameraRig.from_project(_project(seed=12))
+    assert other.eval(600) != rig.eval(600)
+
+    store = ModifierCheckpoints(rig, interval=7)
+    a = store.states_at(50)
+    store.invalidate()
+    assert len(store) == 1
+    b = store.states_at(50)
+    assert a[0].frame == b[0].frame and np.array_equal(a[0].s, b[0].s) and np.array_equal(a[0].pending, b[0].pending)
+    assert a[1].rng.getstate() == b[1].rng.getstate()
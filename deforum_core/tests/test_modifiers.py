@@ -27,3 +27,50 @@ def test_noise_shake_deterministic():
     a = eval_camera_range(project, 0, 9)
     b = eval_camera_range(project, 0, 9)
     assert [c.position for c in a] == [c.position for c in b]
+
+
+def _hash_shake_project(mode="hash"):
+    return Project.model_validate({
+        "meta": {"name": "t", "fps": 24, "frames": 2000},
+        "timeline": {"tracks": [{
+            "id": "camera.transform",
+            "type": "CameraTransformTrack",
+            "channels": {"position.x": {"keys": [{"t": 0, "v": 0}, {"t": 1999, "v": 5}]}},
+            "modifiers": [{"type": "NoiseShake", "params": {"seed": 5, "amp_pos": 0.05, "amp_tgt": 0.02, "freq_hz": 3.0, "mode": mode}}],
+        }]},
+    })
+
+
+def test_hash_noise_shake_is_frame_local():
+    import numpy as np
+    from deforum_core.camera.modifiers import noise_shake_hash
+    from deforum_core.camera.rig import CameraBuffer, CameraRig
+
+    rig = CameraRig.from_project(_hash_shake_project())
+    assert not rig.stateful
+    full = rig.eval_range(0, 1999)
+    for chunk in (37, 500):
+        assert np.array_equal(CameraBuffer.concat(rig.iter_range(0, 1999, chunk=chunk)).data, full.data)
+    assert np.array_equal(CameraBuffer.concat(rig.iter_range(100, 199, chunk=1)).data, full[100:200].data)
+    assert rig.eval(1234) == full[1234]
+    assert "checkpoints" not in vars(rig)
+
+    frames = np.arange(2000)
+    d_pos, d_tgt = noise_shake_hash(frames, 5, amp_pos=0.05, amp_tgt=0.02, freq_hz=3.0, fps=24)
+    assert np.abs(d_pos).max() <= 0.05 and np.abs(d_tgt).max() <= 0.02
+    assert d_pos.std() > 0.01
+    # Smooth at 3 Hz / 24 fps: a frame step moves at most a fraction of the amplitude.
+    assert np.abs(np.diff(d_pos, axis=0)).max() < 0.05 * 0.5
+    again, _ = noise_shake_hash(frames[700:900], 5, amp_pos=0.05, amp_tgt=0.02, freq_hz=3.0, fps=24)
+    assert np.array_equal(again, d_pos[700:900])
+
+
+def test_legacy_noise_shake_is_default():
+    from deforum_core.camera.rig import CameraRig
+
+    legacy = Project.model_validate(_hash_shake_project().model_dump())
+    legacy.timeline.tracks[0].modifiers[0].params.pop("mode")
+    rig = CameraRig.from_project(legacy)
+    assert rig.stateful
+    explicit = CameraRig.from_project(_hash_shake_project(mode="legacy"))
+    assert rig.eval_range(0, 99).data.tobytes() == explicit.eval_range(0, 99).data.tobytes()
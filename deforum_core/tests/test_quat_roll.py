@@ -0,0 +1,72 @@
+import numpy as np
+
+from deforum_core.camera.euler import lock_roll, lock_roll_batch
+from deforum_core.camera.math3d import (
+    look_at_rotation,
+    look_at_rotation_batch,
+    quat_forward_batch,
+    quat_roll,
+    quat_roll_batch,
+    quat_view_roll_deg_batch,
+    v3,
+)
+from deforum_core.camera.rig import eval_camera_range
+from deforum_core.schema.models import Project
+
+
+def _views(n=64, seed=3):
+    rng = np.random.default_rng(seed)
+    eye = rng.uniform(-5, 5, size=(n, 3))
+    target = eye + rng.normal(size=(n, 3))
+    return eye, target
+
+
+def test_roll_twists_about_view_axis_only():
+    eye, target = _views()
+    q = look_at_rotation_batch(eye, target)
+    rolls = np.linspace(-170.0, 170.0, len(q))
+    rolled = quat_roll_batch(q, rolls)
+    assert np.allclose(quat_forward_batch(rolled), quat_forward_batch(q), atol=1e-12)
+    assert np.allclose(quat_view_roll_deg_batch(rolled), rolls, atol=1e-9)
+    assert np.allclose(quat_view_roll_deg_batch(q), 0.0, atol=1e-9)
+
+
+def test_lock_roll_restores_level_look_at():
+    eye, target = _views()
+    q = look_at_rotation_batch(eye, target)
+    locked = lock_roll_batch(quat_roll_batch(q, 37.0))
+    dots = np.abs(np.einsum("ij,ij->i", locked, q))
+    assert np.allclose(dots, 1.0, atol=1e-12)
+
+    s = quat_roll(look_at_rotation(v3(*eye[0]), v3(*target[0])), 25.0)
+    ls = lock_roll(s)
+    assert abs(abs(np.dot([ls.w, ls.x, ls.y, ls.z], q[0])) - 1.0) < 1e-12
+
+
+def test_roll_stable_near_vertical_pitch():
+    eye = np.zeros((5, 3))
+    # Views within a hair of straight down: Euler decompositions degenerate here.
+    target = np.array([[1e-7 * k, -1.0, 1e-7] for k in range(1, 6)])
+    q = look_at_rotation_batch(eye, target)
+    rolled = quat_roll_batch(q, 30.0)
+    assert np.all(np.isfinite(rolled))
+    assert np.allclose(quat_forward_batch(rolled), quat_forward_batch(q), atol=1e-12)
+    assert np.allclose(np.linalg.norm(rolled, axis=1), 1.0)
+    assert np.all(np.isfinite(lock_roll_batch(rolled)))
+
+
+def test_rig_roll_channel_is_view_axis_roll():
+    pr = Project.model_validate({
+        "meta": {"fps": 24},
+        "timeline": {"tracks": [{
+            "id": "camera.transform",
+            "type": "CameraTransformTrack",
+            "channels": {"roll_deg": {"keys": [
+                {"t": 0, "v": 0.0, "interp": "linear"},
+                {"t": 10, "v": 40.0, "interp": "linear"},
+            ]}},
+        }]},
+    })
+    states = eval_camera_range(pr, 0, 10)
+    q = np.array([[s.rotation.w, s.rotation.x, s.rotation.y, s.rotation.z] for s in states])
+    assert np.allclose(quat_view_roll_deg_batch(q), np.linspace(0.0, 40.0, 11), atol=1e-6)
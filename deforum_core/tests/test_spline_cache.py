@@ -0,0 +1,85 @@
+import numpy as np
+
+from deforum_core.camera.splines import SplineCache, compile_spline, sample_spline, sample_spline_array
+
+PTS = [[0, 1, -5], [1, 1.5, -4], [2, 0.5, -3], [3, 1, -2], [2, 2, 0]]
+SPLINES = [
+    {"type": "CatmullRomSpline", "points": PTS, "closed": False},
+    {"type": "CatmullRomSpline", "points": PTS, "closed": True},
+    {
+        "type": "BezierSpline",
+        "segments": [
+            {"p0": [-3, 1.8, -7], "p1": [-2, 1.6, -6], "p2": [-1, 1.6, -5], "p3": [0, 1.5, -4]},
+            {"p0": [0, 1.5, -4], "p1": [1, 1.5, -3], "p2": [2, 1.7, -4], "p3": [3, 1.8, -5.2]},
+        ],
+    },
+    {"type": "BezierSpline", "points": PTS[:4]},
+]
+
+
+def test_compiled_sampling_matches_reference():
+    u = np.concatenate([np.linspace(0.0, 1.0, 97), [-0.5, 1.5]])
+    for sp in SPLINES:
+        got = sample_spline_array(sp, u)
+        want = np.array([sample_spline(sp, float(x)) for x in u])
+        assert got.shape == (len(u), 3)
+        assert np.allclose(got, want, rtol=1e-12, atol=1e-12)
+
+
+def test_tangent_matches_finite_difference():
+    u = (np.arange(20) + 0.37) / 20.0  # away from segment joins
+    h = 1e-6
+    for sp in SPLINES:
+        cs = compile_spline(sp)
+        fd = (cs.sample(u + h) - cs.sample(u - h)) / (2 * h)
+        assert np.allclose(cs.tangent(u), fd, atol=1e-5)
+
+
+def test_cache_recompiles_on_content_change():
+    cache = SplineCache()
+    sp = dict(SPLINES[0])
+    a = cache.get("rail", sp)
+    assert cache.get("rail", dict(sp)) is a
+    sp["points"] = PTS[:3]
+    b = cache.get("rail", sp)
+    assert b is not a and b.segments == 2
+    assert len(cache) == 1
+
+
+def test_uncompilable_spline():
+    assert compile_spline({"type": "CatmullRomSpline", "points": [[0, 0, 0]]}) is None
+    assert sample_spline_array({"type": "Unknown"}, [0.0, 1.0]).shape == (2, 3)
+
+
+def test_nearest_u_matches_dense_sampling():
+    rng = np.random.default_rng(7)
+    pts = np.cumsum(rng.normal(size=(60, 3)), axis=0).tolist()
+    for sp in (
+        {"type": "CatmullRomSpline", "points": pts, "closed": False},
+        {"type": "CatmullRomSpline", "points": pts, "closed": True},
+        SPLINES[2],
+    ):
+        cs = compile_spline(sp)
+        dense = cs.sample(np.linspace(0.0, 1.0, 200001))
+        queries = dense[rng.integers(0, len(dense), 25)] + rng.normal(scale=2.0, size=(25, 3))
+        u, pos, dist = cs.nearest_batch(queries)
+        brute = np.array([np.min(np.linalg.norm(dense - q, axis=1)) for q in queries])
+        assert np.all(dist <= brute + 1e-9)
+        assert np.allclose(pos, cs.sample(u))
+        hit = cs.nearest(queries[0])
+        assert hit.u == u[0] and hit.distance == dist[0]
+
+
+def test_tessellation_meets_tolerance():
+    for sp in SPLINES:
+        cs = compile_spline(sp)
+        tess = cs.tessellate(1e-3)
+        assert tess.u[0] == 0.0 and tess.u[-1] == 1.0 and np.all(np.diff(tess.u) > 0)
+        u = np.linspace(0.0, 1.0, 20001)
+        pts = cs.sample(u)
+        k = np.clip(np.searchsorted(tess.u, u, side="right") - 1, 0, len(tess.u) - 2)
+        a, b = tess.points[k], tess.points[k + 1]
+        ab = b - a
+        t = np.clip(np.einsum("ij,ij->i", pts - a, ab) / np.maximum(np.einsum("ij,ij->i", ab, ab), 1e-30), 0.0, 1.0)
+        dev = np.linalg.norm(pts - (a + t[:, None] * ab), axis=1)
+        assert dev.max() <= tess.max_error + 1e-12 <= 1e-3 + 1e-12
@@ -0,0 +1,66 @@
+import numpy as np
+import pytest
+
+from deforum_core.camera import stack
+from deforum_core.camera.rig import CameraRig
+from deforum_core.schema.models import Project
+
+
+def _project(modifiers):
+    return Project.model_validate({
+        "meta": {"name": "t", "fps": 24, "frames": 600},
+        "timeline": {"tracks": [{
+            "id": "camera.transform",
+            "type": "CameraTransformTrack",
+            "channels": {"position.x": {"keys": [{"t": 0, "v": -2}, {"t": 599, "v": 2}]}},
+            "constraints": [{"type": "NoSuchConstraint", "params": {}}],
+            "modifiers": modifiers,
+        }]},
+    })
+
+
+@pytest.fixture
+def registry(monkeypatch):
+    monkeypatch.setattr(stack, "MODIFIERS", dict(stack.MODIFIERS))
+    return stack
+
+
+def test_builtins_are_registered():
+    assert set(stack.CONSTRAINTS) == {"rail", "followpath", "orbit", "lookatobject"}
+    assert set(stack.MODIFIERS) == {"aimspring", "noiseshake", "horizonlock", "dollyzoom"}
+    assert stack.modifier_entry("AimSpring").is_stateful({})
+    assert not stack.modifier_entry("NoiseShake").is_stateful({"mode": "hash"})
+    assert stack.modifier_entry("NoiseShake").is_stateful({})
+
+
+def test_third_party_modifier_dispatches_once_per_block(registry):
+    calls = []
+
+    @registry.register_modifier("Lift")
+    def lift(block, params, state):
+        calls.append(len(block))
+        block.position[:, 1] += float(params["dy"])
+
+    rig = CameraRig.from_project(_project([{"type": "lift", "params": {"dy": 0.5}}]))
+    assert [e.name for e, _ in rig.stack] == ["lift"]
+    cams = rig.eval_range(0, 99)
+    assert calls == [100]
+    assert np.allclose(cams.position[:, 1], 2.0)
+
+    with pytest.raises(ValueError):
+        registry.register_modifier("lift", lift)
+    registry.register_modifier("lift", lift, replace=True)
+
+
+def test_stateful_third_party_modifier_uses_checkpoints(registry):
+    @registry.register_modifier("counter", stateful=True)
+    def counter(block, params, state):
+        start = 0 if state is None else state
+        block.position[:, 0] = start + np.arange(len(block))
+        return start + len(block)
+
+    rig = CameraRig.from_project(_project([{"type": "counter"}]))
+    assert rig.stateful
+    assert rig.eval(450).position[0] == 450.0
+    chunks = list(rig.iter_range(100, 599, chunk=64))
+    assert np.concatenate([c.position[:, 0] for c in chunks]).tolist() == list(range(100, 600))
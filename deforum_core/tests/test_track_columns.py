@@ -0,0 +1,41 @@
+import numpy as np
+
+from deforum_core.schema.models import Track
+from deforum_core.timeline.evaluator import eval_track, eval_track_columns, eval_tracks_columns
+
+
+def _track(tid, channels):
+    return Track(id=tid, channels=channels)
+
+
+def test_columns_match_per_frame_dicts():
+    tr = _track("camera.transform", {
+        "position.x": {"keys": [{"t": 0, "v": 0}, {"t": 20, "v": 4, "interp": "catmull_rom"}, {"t": 40, "v": 1}]},
+        "position.y": {"value": 1.5},
+        "roll_deg": {"keys": [{"t": 5, "v": 0, "interp": "linear"}, {"t": 25, "v": 30, "interp": "linear"}]},
+    })
+    frames = np.arange(0, 45)
+    cols = eval_track_columns(tr, frames)
+    for i, f in enumerate(frames):
+        want = eval_track(tr, int(f))
+        got = cols.row(i)
+        assert set(got) == set(want)
+        for k in want:
+            assert abs(got[k] - want[k]) < 1e-6
+
+
+def test_vec_fills_missing_components_with_defaults():
+    cols = eval_track_columns(_track("t", {"position.x": {"value": 2.0}}), [0, 1, 2])
+    v = cols.vec("position", (9.0, 8.0, 7.0))
+    assert v.shape == (3, 3)
+    assert np.all(v == np.array([2.0, 8.0, 7.0]))
+    assert "position.x" in cols and "position.y" not in cols
+
+
+def test_later_tracks_override_earlier_channels():
+    a = _track("a", {"x": {"value": 1.0}, "y": {"value": 2.0}})
+    b = _track("b", {"x": {"value": 5.0}})
+    cols = eval_tracks_columns([a, b], [0, 10])
+    assert np.all(cols.column("x", 0.0) == 5.0)
+    assert np.all(cols.column("y", 0.0) == 2.0)
+    assert cols.data.shape == (2, 2)
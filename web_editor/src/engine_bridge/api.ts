@@ -17,3 +17,47 @@ export async function evalRange(
   }
   return await res.json();
 }
+
+export async function nearestU(
+  bridgeUrl: string,
+  project: Project,
+  splineId: string,
+  points: [number, number, number][],
+  arcLength = false
+): Promise<{ u: number[]; position: [number, number, number][]; distance: number[] }> {
+  const res = await fetch(`${bridgeUrl}/spline/nearest`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({ project, spline_id: splineId, points, arc_length: arcLength })
+  });
+  if (!res.ok) {
+    const txt = await res.text();
+    throw new Error(txt);
+  }
+  return await res.json();
+}
+
+export type SplineTessellation = { count: number; points: number[]; u: number[]; max_error: number };
+
+export async function tessellateSplines(
+  bridgeUrl: string,
+  project: Project,
+  opts: { splineIds?: string[]; tolerance?: number; zoom?: number; maxPoints?: number } = {}
+): Promise<{ tolerance: number; splines: Record<string, SplineTessellation> }> {
+  const res = await fetch(`${bridgeUrl}/spline/tessellate`, {
+    method: "POST",
+    headers: { "Content-Type": "application/json" },
+    body: JSON.stringify({
+      project,
+      spline_ids: opts.splineIds ?? null,
+      tolerance: opts.tolerance ?? 0.01,
+      zoom: opts.zoom ?? 0,
+      max_points: opts.maxPoints ?? 2048
+    })
+  });
+  if (!res.ok) {
+    const txt = await res.text();
+    throw new Error(txt);
+  }
+  return await res.json();
+}
@@ -129,8 +129,8 @@ export default function App() {
               { type: "Orbit", order: 20, enabled: false, params: { radius: 6.0, azimuth_deg: 0.0, elevation_deg: 10.0, offset: [0, 0, 0] } }
             ],
             modifiers: [
-              { type: "AimSpring", order: 0, enabled: true, params: { stiffness: 18.0, damping: 6.0 } },
-              { type: "NoiseShake", order: 10, enabled: true, params: { seed: 42, amp_pos: 0.03, amp_tgt: 0.015, freq_hz: 5.5 } },
+              { type: "AimSpring", order: 0, enabled: true, params: { stiffness: 18.0, damping: 6.0, integrator: "exact" } },
+              { type: "NoiseShake", order: 10, enabled: true, params: { seed: 42, amp_pos: 0.03, amp_tgt: 0.015, freq_hz: 5.5, mode: "hash" } },
               { type: "DollyZoom", order: 20, enabled: true, params: { reference_focal_mm: 35.0, reference_distance_m: 3.2, min_focal_mm: 18.0, max_focal_mm: 120.0 } },
               { type: "HorizonLock", order: 30, enabled: true, params: {} }
             ]
@@ -417,7 +417,7 @@ function setMarkers(next: Marker[]) {
       </div>
 
       <div style={{ position: "relative" }}>
-        <Viewport3D rangeData={rangeData} frame={frame} project={project} onKeyframe={applyViewportKeyframe} />
+        <Viewport3D rangeData={rangeData} frame={frame} project={project} bridgeUrl={bridgeUrl} onKeyframe={applyViewportKeyframe} />
         <div style={{ position: "absolute", left: 12, bottom: 12, fontSize: 12, padding: 8, background: "rgba(0,0,0,0.5)", color: "white" }}>
           {rangeData ? "Preview loaded" : "Click 'Refresh Preview' to evaluate camera path."}
         </div>
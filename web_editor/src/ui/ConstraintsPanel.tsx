@@ -9,6 +9,7 @@ type CameraConstraints = {
   max_speed_roll_deg?: number;
   max_speed_focal_mm?: number;
   smoothing_window?: number;
+  smoothing_kernel?: "trailing" | "centered" | "gaussian";
   sample_step?: number;
 };
 
@@ -33,6 +34,7 @@ export default function ConstraintsPanel({
     max_speed_roll_deg: 4.0,
     max_speed_focal_mm: 1.5,
     smoothing_window: 3,
+    smoothing_kernel: "trailing",
     sample_step: 1,
   };
 
@@ -61,6 +63,14 @@ export default function ConstraintsPanel({
         <Field label="Max focal speed (mm/frame)" value={c.max_speed_focal_mm} onChange={(v)=>set("max_speed_focal_mm", v)} />
         <Field label="Smoothing window" value={c.smoothing_window} step={1} onChange={(v)=>set("smoothing_window", Math.max(0, Math.round(v)))} />
         <Field label="Sample step (frames)" value={c.sample_step} step={1} onChange={(v)=>set("sample_step", Math.max(1, Math.round(v)))} />
+        <div style={{ display: "grid", gap: 4 }}>
+          <div style={{ fontSize: 12, opacity: 0.85 }}>Smoothing kernel</div>
+          <select value={c.smoothing_kernel ?? "trailing"} onChange={(e) => set("smoothing_kernel", e.target.value)}>
+            <option value="trailing">trailing</option>
+            <option value="centered">centered</option>
+            <option value="gaussian">gaussian</option>
+          </select>
+        </div>
       </div>
     </div>
   );
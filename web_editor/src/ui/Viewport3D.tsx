@@ -2,11 +2,13 @@ import React, { useEffect, useRef, useState } from "react";
 import * as THREE from "three";
 import { OrbitControls } from "three/examples/jsm/controls/OrbitControls.js";
 import { TransformControls } from "three/examples/jsm/controls/TransformControls.js";
+import { tessellateSplines } from "../engine_bridge/api";
 
 type Props = {
   rangeData: any;
   frame: number;
   project?: any;
+  bridgeUrl?: string;
   onKeyframe?: (frame: number, payload: { position: [number, number, number]; target: [number, number, number]; roll_deg?: number }) => void;
 };
 
@@ -80,24 +82,48 @@ function densifyPolyline(raw: THREE.Vector3[], stepsPerSeg: number) {
   return out;
 }
 
-function getAllSplineLines(project: any): { id: string; pts: THREE.Vector3[]; color: number }[] {
-  const out: { id: string; pts: THREE.Vector3[]; color: number }[] = [];
+type SplineLine = { id: string; pts: THREE.Vector3[]; color: number };
+
+// Orbit distance at which the bridge tessellates at zoom 0; every halving of it is one zoom level.
+const SPLINE_ZOOM_REF_DISTANCE = 12;
+
+function splineColor(sp: any) {
+  return sp?.segments?.length ? 0xffaa44 : 0x44ff88;
+}
+
+// Offline fallback when the bridge is unreachable: fixed-rate sampling of the raw spline data.
+function getLocalSplineLines(project: any): SplineLine[] {
+  const out: SplineLine[] = [];
   const splines = project?.timeline?.objects?.splines ?? {};
   for (const id of Object.keys(splines)) {
     const sp = splines[id];
     if (sp?.points?.length) {
       const raw = sp.points.map((p: number[]) => new THREE.Vector3(p[0], p[1], p[2]));
       const pts = densifyPolyline(raw, 10);
-      out.push({ id, pts, color: 0x44ff88 });
+      out.push({ id, pts, color: splineColor(sp) });
     } else if (sp?.segments?.length) {
       const pts = sampleBezierSpline(sp.segments, 24);
-      out.push({ id, pts, color: 0xffaa44 });
+      out.push({ id, pts, color: splineColor(sp) });
     }
   }
   return out;
 }
 
-export default function Viewport3D({ rangeData, frame, project, onKeyframe }: Props) {
+// Adaptive polylines from the bridge's /spline/tessellate, finer as the viewport zooms in.
+async function getBridgeSplineLines(bridgeUrl: string, project: any, zoom: number): Promise<SplineLine[]> {
+  const splines = project?.timeline?.objects?.splines ?? {};
+  const res = await tessellateSplines(bridgeUrl, project, { zoom });
+  const out: SplineLine[] = [];
+  for (const id of Object.keys(res.splines)) {
+    const flat = res.splines[id].points;
+    const pts: THREE.Vector3[] = [];
+    for (let i = 0; i + 2 < flat.length; i += 3) pts.push(new THREE.Vector3(flat[i], flat[i + 1], flat[i + 2]));
+    out.push({ id, pts, color: splineColor(splines[id]) });
+  }
+  return out;
+}
+
+export default function Viewport3D({ rangeData, frame, project, bridgeUrl, onKeyframe }: Props) {
   const mountRef = useRef<HTMLDivElement | null>(null);
   const sceneRef = useRef<THREE.Scene | null>(null);
   const rendererRef = useRef<THREE.WebGLRenderer | null>(null);
@@ -116,6 +142,7 @@ export default function Viewport3D({ rangeData, frame, project, onKeyframe }: Pr
 
   const [gizmo, setGizmo] = useState<"off" | "camera" | "target">("off");
   const [mode, setMode] = useState<"translate" | "rotate">("translate");
+  const [zoom, setZoom] = useState(0);
 
   useEffect(() => {
     const mount = mountRef.current;
@@ -140,6 +167,11 @@ export default function Viewport3D({ rangeData, frame, project, onKeyframe }: Pr
     controls.enableDamping = true;
     controls.dampingFactor = 0.08;
     controls.target.set(0, 1.5, 0);
+    controls.addEventListener("change", () => {
+      // Whole zoom levels only, so orbiting does not refetch spline tessellations.
+      const dist = Math.max(1e-3, camera.position.distanceTo(controls.target));
+      setZoom(Math.round(Math.log2(SPLINE_ZOOM_REF_DISTANCE / dist)));
+    });
     controlsRef.current = controls;
 
     scene.add(new THREE.GridHelper(40, 40, 0x2a2f3a, 0x1b1f28));
@@ -248,16 +280,32 @@ export default function Viewport3D({ rangeData, frame, project, onKeyframe }: Pr
     }
     splineLinesRef.current = [];
 
-    const lines = getAllSplineLines(project);
-    for (const ln of lines) {
-      if (!ln.pts.length) continue;
-      const geom = new THREE.BufferGeometry().setFromPoints(ln.pts);
-      const mat = new THREE.LineBasicMaterial({ color: ln.color });
-      const line = new THREE.Line(geom, mat);
-      scene.add(line);
-      splineLinesRef.current.push(line);
+    const splines = project?.timeline?.objects?.splines ?? {};
+    if (!Object.keys(splines).length) return;
+
+    let cancelled = false;
+    const draw = (lines: SplineLine[]) => {
+      if (cancelled) return;
+      for (const ln of lines) {
+        if (!ln.pts.length) continue;
+        const geom = new THREE.BufferGeometry().setFromPoints(ln.pts);
+        const mat = new THREE.LineBasicMaterial({ color: ln.color });
+        const line = new THREE.Line(geom, mat);
+        scene.add(line);
+        splineLinesRef.current.push(line);
+      }
+    };
+    if (bridgeUrl) {
+      getBridgeSplineLines(bridgeUrl, project, zoom)
+        .then(draw)
+        .catch(() => draw(getLocalSplineLines(project)));
+    } else {
+      draw(getLocalSplineLines(project));
     }
-  }, [project]);
+    return () => {
+      cancelled = true;
+    };
+  }, [project, bridgeUrl, zoom]);
 
   // draw evaluated camera path line
   useEffect(() => {